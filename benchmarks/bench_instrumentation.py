@@ -0,0 +1,60 @@
+"""
+Measure what disabled instrumentation costs the public API.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_instrumentation.py
+
+Each ``timed`` public call is compared with the undecorated function (``__wrapped__``) on the same
+arguments, so the difference is the wrapper frame and its ``None`` check; that difference is small next to
+the call itself, so it is also measured alone on a no-op function. ``active()`` is timed on its own: it is
+the check every internal hook makes.
+"""
+
+import datetime
+import timeit
+
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+
+UTC = datetime.timezone.utc
+REPEAT = 7
+NUMBER = 20_000
+
+
+def best(statement):
+    return min(timeit.repeat(statement, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def _noop():
+    pass
+
+
+def main():
+    assert not instrumentation.is_enabled()
+    cron = AwsCroniter("0/15 9-17 ? * MON-FRI *")
+    moment = datetime.datetime(2024, 3, 1, 12, 7, tzinfo=UTC)
+    seconds = int(moment.timestamp())
+    calls = {
+        "get_next": (AwsCroniter.get_next, (cron, moment)),
+        "get_prev": (AwsCroniter.get_prev, (cron, moment)),
+        "get_next_epoch": (AwsCroniter.get_next_epoch, (cron, seconds)),
+    }
+    print(f"{'call':16} {'decorated':>12} {'undecorated':>12} {'overhead':>10}")
+    for name, (decorated, args) in calls.items():
+        undecorated = decorated.__wrapped__
+        with_hook = best(lambda: decorated(*args))
+        without_hook = best(lambda: undecorated(*args))
+        overhead = with_hook - without_hook
+        print(
+            f"{name:16} {with_hook * 1e6:10.2f}us {without_hook * 1e6:10.2f}us "
+            f"{overhead * 1e9:7.0f}ns ({overhead / without_hook:5.1%})"
+        )
+    noop = instrumentation.timed("noop")(_noop)
+    frame = best(noop) - best(_noop)
+    print(f"{'wrapper frame':16} {frame * 1e9:10.0f}ns per timed public call")
+    print(f"{'active()':16} {best(instrumentation.active) * 1e9:10.0f}ns per internal hook check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Compare the per-expression recent-run index in ``_search_conflicts`` with the previous full deque scan.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_recent_window.py
+
+Two every-minute schedules conflict on every run, so each step exercises the recent window at its
+largest. The legacy implementation scanned every run in the window and computed an O(k^2) minimum
+separation for each conflict; the index touches one entry per expression.
+"""
+
+import datetime
+import heapq
+import time
+from collections import deque
+
+from aws_croniter.conflict_models import ConflictCollectionMode
+from aws_croniter.conflict_models import ConflictSearchOptions
+from aws_croniter.conflict_models import ScheduleConflict
+from aws_croniter.conflict_models import ScheduledRun
+from aws_croniter.conflicts import _prepare_expressions
+from aws_croniter.conflicts import _search_conflicts
+from aws_croniter.occurrence_stream import OccurrenceCounter
+from aws_croniter.occurrence_stream import OccurrenceStream
+
+UTC = datetime.timezone.utc
+EXPRESSIONS = ["* * * * ? *", "*/3 * * * ? *"]
+MAX_CONFLICTS = 20
+
+
+def legacy_search(cron_pairs, options, report_from):
+    counter = OccurrenceCounter(options.max_total_occurrences)
+    heap = []
+    for index, (cron, expression) in enumerate(cron_pairs):
+        stream = OccurrenceStream(
+            cron,
+            expression,
+            index,
+            options.from_date,
+            options.to_date,
+            options.max_occurrences_per_expression,
+            counter,
+        )
+        if stream.peek() is not None:
+            heapq.heappush(heap, (stream.peek(), index, stream))
+    recent = deque()
+    conflicts = []
+    while heap:
+        run_at, index, stream = heapq.heappop(heap)
+        run = ScheduledRun(index, stream.expression, run_at)
+        while recent and recent[0].run_at < run_at - options.buffer:
+            recent.popleft()
+        conflicting = [
+            prior
+            for prior in recent
+            if prior.expression_index != index and abs(run_at - prior.run_at) <= options.buffer
+        ]
+        if conflicting and run_at >= report_from:
+            unique = {(r.run_at, r.expression_index): r for r in [run, *conflicting]}
+            runs = sorted(unique.values(), key=lambda r: (r.run_at, r.expression_index))
+            separation = min(abs(a.run_at - b.run_at) for i, a in enumerate(runs) for b in runs[i + 1 :])
+            conflicts.append(ScheduleConflict(tuple(runs), separation))
+            if len(conflicts) >= options.max_conflicts:
+                break
+        recent.append(run)
+        stream.pop()
+        if stream.peek() is not None:
+            heapq.heappush(heap, (stream.peek(), index, stream))
+    return conflicts
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    cron_pairs = _prepare_expressions(EXPRESSIONS, 50)
+    print(f"{'buffer':>14} | {'legacy scan (s)':>15} | {'latest index (s)':>16} | {'speedup':>7}")
+    for buffer in (datetime.timedelta(hours=1), datetime.timedelta(hours=6), datetime.timedelta(days=1)):
+        from_date = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+        # Skip conflicts until the window is full so every measured step sees the whole buffer.
+        options = ConflictSearchOptions(
+            from_date=from_date,
+            to_date=from_date + 2 * buffer + datetime.timedelta(hours=1),
+            buffer=buffer,
+            collection_mode=ConflictCollectionMode.ALL,
+            max_conflicts=MAX_CONFLICTS,
+        )
+        report_from = from_date + buffer
+        legacy = timed(legacy_search, cron_pairs, options, report_from)
+        indexed = timed(_search_conflicts, cron_pairs, options, report_from)
+        print(f"{str(buffer):>14} | {legacy:>15.3f} | {indexed:>16.3f} | {legacy / indexed:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
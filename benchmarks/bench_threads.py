@@ -0,0 +1,74 @@
+"""
+Measure how next-run computations on shared ``AwsCroniter`` instances scale across threads.
+
+Run from the repository root, ideally on a free-threaded interpreter (``python3.13t`` or later)::
+
+    PYTHONPATH=src python3.13t benchmarks/bench_threads.py [MAX_THREADS]
+
+Every thread queries the same parsed expressions, so the run exercises the shared state the package keeps:
+the parsed fields, the lazily computed properties and the compiled validation patterns (expressions are
+re-parsed as well). With the GIL the throughput stays flat as threads are added; on a free-threaded build
+it should grow with the number of cores, since the caches lock only on a miss.
+"""
+
+import datetime
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aws_croniter.aws_croniter import AwsCroniter
+
+UTC = datetime.timezone.utc
+EXPRESSIONS = [
+    "0/15 9-17 ? * MON-FRI *",
+    "0 12 L * ? *",
+    "30 8 15W * ? *",
+    "0 6 ? * 6#3 *",
+    "*/5 * * * ? *",
+]
+CALLS_PER_THREAD = 2_000
+START_SECONDS = int(datetime.datetime(2024, 1, 1, tzinfo=UTC).timestamp())
+
+
+def work(crons, offset):
+    """One thread's share: next runs from many start points, plus a re-parse now and then."""
+    for call in range(CALLS_PER_THREAD):
+        cron = crons[call % len(crons)]
+        cron.get_next_epoch(START_SECONDS + (offset + call) * 7_919, 3)
+        if call % 100 == 0:
+            AwsCroniter(cron.cron)
+
+
+def throughput(crons, threads):
+    barrier = threading.Barrier(threads)
+
+    def task(offset):
+        barrier.wait()
+        work(crons, offset)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(task, range(threads)))
+    return threads * CALLS_PER_THREAD / (time.perf_counter() - started)
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    cores = os.cpu_count() or 1
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else cores
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {cores} cores")
+    crons = [AwsCroniter(expression) for expression in EXPRESSIONS]
+    work(crons, 0)  # warm up the shared caches
+    baseline = None
+    threads = 1
+    while threads <= max_threads:
+        calls = throughput(crons, threads)
+        baseline = baseline or calls
+        print(f"{threads:3d} threads: {calls:12,.0f} calls/s  ({calls / baseline:.2f}x)")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,66 @@
 from .aws_croniter import AwsCroniter
+from .cancellation import CancellationToken
+from .catchup import missed_runs
+from .catchup_models import MissedRuns
+from .conflict_index import ConflictIndex
+from .conflict_matrix import conflict_matrix
 from .conflict_models import ConflictCollectionMode
+from .conflict_models import ConflictColumns
+from .conflict_models import ConflictIndexChange
+from .conflict_models import ConflictMatrix
 from .conflict_models import ConflictSearchOptions
 from .conflict_models import ConflictSearchResult
+from .conflict_models import PairConflict
 from .conflict_models import ScheduleConflict
 from .conflict_models import ScheduledRun
+from .conflicts import ConflictIterator
 from .conflicts import find_conflicts
+from .conflicts import iter_conflicts
+from .epoch import EpochUnit
 from .exceptions import AwsCroniterConflictSearchLimitError
+from .export import ExportFormat
+from .export import export_conflicts
+from .export import export_runs
+from .firing_index import FiringIndex
+from .instrumentation import InstrumentationCollector
+from .load_models import LoadBucket
+from .load_models import LoadProfile
+from .load_models import LoadRule
+from .load_models import PeakInterval
+from .load_profile import load_profile
+from .materialized import MaterializedSchedule
 
 # Should be exported when using `from aws_croniter import *`
 __all__ = [
     "AwsCroniter",
     "AwsCroniterConflictSearchLimitError",
+    "CancellationToken",
     "ConflictCollectionMode",
+    "ConflictColumns",
+    "ConflictIndex",
+    "ConflictIndexChange",
+    "ConflictIterator",
+    "ConflictMatrix",
     "ConflictSearchOptions",
     "ConflictSearchResult",
+    "EpochUnit",
+    "ExportFormat",
+    "FiringIndex",
+    "InstrumentationCollector",
+    "LoadBucket",
+    "LoadProfile",
+    "LoadRule",
+    "MaterializedSchedule",
+    "MissedRuns",
+    "PairConflict",
+    "PeakInterval",
     "ScheduleConflict",
     "ScheduledRun",
+    "conflict_matrix",
+    "export_conflicts",
+    "export_runs",
     "find_conflicts",
+    "iter_conflicts",
+    "load_profile",
+    "missed_runs",
 ]
@@ -1,5 +1,14 @@
 import datetime
-
+import functools
+import hashlib
+from array import array
+
+from aws_croniter import distribution
+from aws_croniter import epoch
+from aws_croniter import instrumentation
+from aws_croniter import periodicity
+from aws_croniter.catchup_models import MissedRuns
+from aws_croniter.epoch import EpochUnit
 from aws_croniter.exceptions import AwsCroniterExpressionDayOfMonthError
 from aws_croniter.exceptions import AwsCroniterExpressionDayOfWeekError
 from aws_croniter.exceptions import AwsCroniterExpressionError
@@ -7,11 +16,23 @@ from aws_croniter.exceptions import AwsCroniterExpressionHourError
 from aws_croniter.exceptions import AwsCroniterExpressionMinuteError
 from aws_croniter.exceptions import AwsCroniterExpressionMonthError
 from aws_croniter.exceptions import AwsCroniterExpressionYearError
+from aws_croniter.materialized import MaterializedSchedule
 from aws_croniter.occurrence import Occurrence
+from aws_croniter.occurrence_walk import walk_epoch_minutes
 from aws_croniter.utils import RegexUtils
+from aws_croniter.utils import TimeUtils
 
 
 class AwsCroniter:
+    """
+    A parsed AWS cron expression.
+
+    Instances are immutable once constructed and safe to share between threads: every query method only
+    reads the parsed fields, and the lazily computed properties (``schedule_key``, ``canonical``,
+    ``period``) are pure, so two threads racing to fill one store the same value. The compiled validation
+    patterns shared by all instances are published under a lock, taken only on a cache miss.
+    """
+
     MONTH_REPLACES = [
         ["JAN", "1"],
         ["FEB", "2"],
@@ -37,6 +58,7 @@ class AwsCroniter:
         ["SAT", "7"],
     ]
 
+    @instrumentation.timed("parse")
     def __init__(self, cron):
         self.cron = cron
         self.minutes = None
@@ -93,6 +115,112 @@ class AwsCroniter:
         # If validation passes, then parse the cron expression
         self.__parse()
 
+    def __eq__(self, other):
+        """Expressions are equal when they fire at exactly the same times, however they are written."""
+        if not isinstance(other, AwsCroniter):
+            return NotImplemented
+        return self.schedule_key == other.schedule_key
+
+    def __hash__(self):
+        return hash(self.schedule_key)
+
+    def __repr__(self):
+        return f"AwsCroniter({self.cron!r})"
+
+    @functools.cached_property
+    def schedule_key(self):
+        """
+        Canonical parsed fields: expressions with equal keys fire at exactly the same times.
+
+        Numeric fields become sorted tuples of unique values; "L", "W" and "#" rules keep their positional
+        form. Every day of the week with "?" day-of-month is stored as every day of the month.
+
+        :return: tuple of (minutes, hours, days_of_month, months, days_of_week, years)
+        """
+
+        def normalized(values):
+            if values and isinstance(values[0], str):
+                return tuple(values)
+            return tuple(sorted(set(values)))
+
+        days_of_month, days_of_week = self.days_of_month, self.days_of_week
+        if not days_of_month and set(days_of_week) == set(range(1, 8)):
+            days_of_month, days_of_week = list(range(1, 32)), []
+        return (
+            normalized(self.minutes),
+            normalized(self.hours),
+            normalized(days_of_month),
+            normalized(self.months),
+            normalized(days_of_week),
+            normalized(self.years),
+        )
+
+    @functools.cached_property
+    def canonical(self):
+        """
+        Canonical expression text, identical for all expressions with the same ``schedule_key``.
+
+        Values are numeric and ascending, full ranges are written as "*" and runs of three or more
+        consecutive values as "a-b", e.g. "0/15 9-17 ? * MON-FRI *" becomes "0,15,30,45 9-17 ? * 2-6 *".
+        The canonical text parses back to an equal expression.
+
+        :return: str
+        """
+        minutes, hours, days_of_month, months, days_of_week, years = self.schedule_key
+        if not days_of_month:
+            day_of_month = "?"
+        elif days_of_month[0] == "L":
+            day_of_month = "L" if days_of_month[1] == 0 else f"L-{days_of_month[1]}"
+        elif days_of_month[0] == "W":
+            day_of_month = f"{days_of_month[1]}W"
+        else:
+            day_of_month = AwsCroniter.__format_values(days_of_month, 1, 31)
+        if not days_of_week:
+            day_of_week = "?"
+        elif days_of_week[0] == "L":
+            day_of_week = "L" if days_of_week[1] == 0 else f"{days_of_week[1]}L"
+        elif days_of_week[0] == "#":
+            day_of_week = f"{days_of_week[1]}#{days_of_week[2]}"
+        else:
+            day_of_week = AwsCroniter.__format_values(days_of_week, 1, 7)
+        return " ".join(
+            (
+                AwsCroniter.__format_values(minutes, 0, 59),
+                AwsCroniter.__format_values(hours, 0, 23),
+                day_of_month,
+                AwsCroniter.__format_values(months, 1, 12),
+                day_of_week,
+                AwsCroniter.__format_values(years, 1970, 2199),
+            )
+        )
+
+    @property
+    def fingerprint(self):
+        """
+        Stable content hash of the schedule: the SHA-256 hex digest of ``canonical``.
+
+        Unlike ``hash()``, it is the same in every process and release, so it can key persistent or shared stores.
+
+        :return: str of 64 hex characters
+        """
+        return hashlib.sha256(self.canonical.encode("ascii")).hexdigest()
+
+    @staticmethod
+    def __format_values(values, min_value, max_value):
+        if len(values) == max_value - min_value + 1:
+            return "*"
+        parts = []
+        start = 0
+        for index in range(1, len(values) + 1):
+            if index < len(values) and values[index] == values[index - 1] + 1:
+                continue
+            if index - start >= 3:
+                parts.append(f"{values[start]}-{values[index - 1]}")
+            else:
+                parts.extend(str(value) for value in values[start:index])
+            start = index
+        return ",".join(parts)
+
     def occurrence(self, utc_datetime):
         if utc_datetime.tzinfo is None or utc_datetime.tzinfo != datetime.timezone.utc:
             raise Exception("Occurrence utc_datetime must have tzinfo == datetime.timezone.utc")
@@ -104,6 +232,7 @@ class AwsCroniter:
             rs = rs.replace(rule[0], rule[1])
         return rs
 
+    @instrumentation.timed("parse.fields", check_slow=False)
     def __parse(self):
         self.minutes = self.__parse_one_rule(self.rules[0], 0, 59)
         self.hours = self.__parse_one_rule(self.rules[1], 0, 23)
@@ -201,6 +330,7 @@ class AwsCroniter:
         for offset in range(0, distance + 1, step):
             yield min_value + ((start_offset + offset) % size)
 
+    @instrumentation.timed("get_next")
     def get_next(self, from_date, n=1, inclusive=False):
         """
         Returns a list with the n next datetime(s) that match the aws cron expression from the provided start date.
@@ -217,13 +347,32 @@ class AwsCroniter:
         else:
             schedule_list = [None] * n
             for i in range(n):
-                from_date = self.occurrence(from_date).next(inclusive=(inclusive and i == 0))
+                from_date = self.__next_run(from_date, inclusive and i == 0)
                 if from_date is None:
                     break
                 schedule_list[i] = from_date
 
             return schedule_list
 
+    def __next_run(self, from_date, inclusive):
+        found = self.occurrence(from_date).next(inclusive=inclusive)
+        if found is None:
+            # The field search gives up after a bounded number of steps; confirm with the periodic search,
+            # which walks at most one period per segment however far away the next run is.
+            start = TimeUtils.datetime_to_epoch_minute(from_date) + (0 if inclusive else 1)
+            run = periodicity.first_run(self, start)
+            found = None if run is None else TimeUtils.epoch_minute_to_datetime(run)
+        return found
+
+    def __prev_run(self, from_date, inclusive):
+        found = self.occurrence(from_date).prev(inclusive=inclusive)
+        if found is None:
+            stop = TimeUtils.datetime_to_epoch_minute(from_date) - (0 if inclusive else 1)
+            run = periodicity.last_run(self, stop)
+            found = None if run is None else TimeUtils.epoch_minute_to_datetime(run)
+        return found
+
+    @instrumentation.timed("get_prev")
     def get_prev(self, from_date, n=1, inclusive=False):
         """
         Returns a list with the n prev datetime(s) that match the aws cron expression
@@ -241,13 +390,68 @@ class AwsCroniter:
         else:
             schedule_list = [None] * n
             for i in range(n):
-                from_date = self.occurrence(from_date).prev(inclusive=(inclusive and i == 0))
+                from_date = self.__prev_run(from_date, inclusive and i == 0)
                 if from_date is None:
                     break
                 schedule_list[i] = from_date
 
             return schedule_list
 
+    @instrumentation.timed("get_next_epoch")
+    def get_next_epoch(self, from_epoch, n=1, inclusive=False, unit=EpochUnit.SECONDS):
+        """
+        Like get_next, with integer timestamps in and out instead of datetime objects.
+
+        :param from_epoch: int with the start time in the given unit
+        :param n: Int of the n next timestamp(s), defaults to 1
+        :param inclusive: If True, include the from_epoch minute if it matches a valid execution.
+        :param unit: EpochUnit of from_epoch and of the result, defaults to EpochUnit.SECONDS
+        :return: list of int timestamps, padded with None when fewer than n runs are left
+        """
+        unit = EpochUnit(unit)
+        minute = epoch.to_epoch_minute(from_epoch, unit, "from_epoch")
+        runs = epoch.next_epoch_minutes(self, minute, n, inclusive)
+        return [run * unit.per_minute for run in runs] + [None] * (n - len(runs))
+
+    @instrumentation.timed("get_prev_epoch")
+    def get_prev_epoch(self, from_epoch, n=1, inclusive=False, unit=EpochUnit.SECONDS):
+        """
+        Like get_prev, with integer timestamps in and out instead of datetime objects.
+
+        :param from_epoch: int with the start time in the given unit
+        :param n: Int of the n prev timestamp(s), defaults to 1
+        :param inclusive: If True, include the from_epoch minute if it matches a valid execution.
+        :param unit: EpochUnit of from_epoch and of the result, defaults to EpochUnit.SECONDS
+        :return: list of int timestamps, padded with None when fewer than n runs are left
+        """
+        unit = EpochUnit(unit)
+        minute = epoch.to_epoch_minute(from_epoch, unit, "from_epoch")
+        runs = epoch.prev_epoch_minutes(self, minute, n, inclusive)
+        return [run * unit.per_minute for run in runs] + [None] * (n - len(runs))
+
+    @instrumentation.timed("get_all_schedule_bw_epochs")
+    def get_all_schedule_bw_epochs(self, from_epoch, to_epoch, exclude_ends=False, unit=EpochUnit.SECONDS):
+        """
+        Like get_all_schedule_bw_dates, with integer timestamps in and out instead of datetime objects.
+        The runs come from one cursor walk and are returned as a compact array of 64-bit ints.
+
+        :param from_epoch: int with the start time in the given unit
+        :param to_epoch: int with the end time in the given unit
+        :param exclude_ends: bool defaulted to False, to not exclude the end timestamps
+        :param unit: EpochUnit of the arguments and of the result, defaults to EpochUnit.SECONDS
+        :return: array('q') of int timestamps
+        """
+        unit = EpochUnit(unit)
+        start = epoch.to_epoch_minute(from_epoch, unit, "from_epoch")
+        stop = epoch.to_epoch_minute(to_epoch, unit, "to_epoch")
+        if exclude_ends:
+            start, stop = start + 1, stop - 1
+        runs = array("q", walk_epoch_minutes(self, start, stop))
+        if unit is EpochUnit.MINUTES:
+            return runs
+        return array("q", [run * unit.per_minute for run in runs])
+
+    @instrumentation.timed("get_all_schedule_bw_dates")
     def get_all_schedule_bw_dates(self, from_date, to_date, exclude_ends=False):
         """
         Get all datetime(s) from from_date to to_date matching the given cron expression.
@@ -292,6 +496,119 @@ class AwsCroniter:
                     schedule_list.pop()
             return schedule_list
 
+    @instrumentation.timed("count_between")
+    def count_between(self, from_date, to_date):
+        """
+        Count the datetime(s) from from_date to to_date matching the given cron expression, both ends included,
+        without generating them.
+        One period of the schedule (see ``period``) is counted and multiplied, so the cost does not grow with
+        the length of the range.
+
+        :param from_date: datetime object from where the schedule will start with tzinfo in utc.
+        :param to_date: datetime object to where the schedule will end with tzinfo in utc.
+        :return: int, equal to len(get_all_schedule_bw_dates(from_date, to_date))
+        """
+        if not isinstance(from_date, datetime.datetime) or not isinstance(to_date, datetime.datetime):
+            raise ValueError("The from_date and to_date must be of type datetime.datetime")
+        if from_date.tzinfo != datetime.timezone.utc or to_date.tzinfo != datetime.timezone.utc:
+            raise ValueError(
+                "Invalid from_date and to_date. Must be of type datetime.datetime "
+                "and have tzinfo = datetime.timezone.utc"
+            )
+        start = TimeUtils.datetime_to_epoch_minute(from_date)
+        stop = TimeUtils.datetime_to_epoch_minute(to_date)
+        return periodicity.count_runs(self, start, stop)
+
+    @instrumentation.timed("distribution")
+    def distribution(self, from_date, to_date, by=("hour",)):
+        """
+        Histogram of the datetime(s) from from_date to to_date matching the given cron expression, both ends
+        included, computed from the parsed fields without generating the runs.
+        Dimensions are "minute", "hour", "day" (of month), "weekday" (1=SUN .. 7=SAT, like the day-of-week
+        field), "month" and "year"; each key holds the values of the dimensions in the order given by ``by``.
+
+        :param from_date: datetime object from where the schedule will start with tzinfo in utc.
+        :param to_date: datetime object to where the schedule will end with tzinfo in utc.
+        :param by: dimension name or sequence of dimension names, defaults to ("hour",)
+        :return: dict mapping tuples of dimension values to run counts, sorted by key, without empty bins
+        """
+        by = distribution.validate_dimensions(by)
+        if not isinstance(from_date, datetime.datetime) or not isinstance(to_date, datetime.datetime):
+            raise ValueError("The from_date and to_date must be of type datetime.datetime")
+        if from_date.tzinfo != datetime.timezone.utc or to_date.tzinfo != datetime.timezone.utc:
+            raise ValueError(
+                "Invalid from_date and to_date. Must be of type datetime.datetime "
+                "and have tzinfo = datetime.timezone.utc"
+            )
+        start = TimeUtils.datetime_to_epoch_minute(from_date)
+        stop = TimeUtils.datetime_to_epoch_minute(to_date)
+        return distribution.run_distribution(self, start, stop, by)
+
+    @instrumentation.timed("missed_between")
+    def missed_between(self, last_run, now):
+        """
+        Summarize the runs missed after last_run, up to and including now, without generating them.
+        Meant for catching up after downtime: a run at last_run itself is not missed, a run at now is.
+        The count comes from count_between and the first and last runs from the periodic search, so the cost
+        does not grow with the length of the downtime.
+
+        :param last_run: datetime object of the last run that happened with tzinfo in utc.
+        :param now: datetime object up to which runs count as missed with tzinfo in utc.
+        :return: MissedRuns with the count and the first and last missed datetime (None when nothing was missed)
+        """
+        if not isinstance(last_run, datetime.datetime) or not isinstance(now, datetime.datetime):
+            raise ValueError("The last_run and now must be of type datetime.datetime")
+        if last_run.tzinfo != datetime.timezone.utc or now.tzinfo != datetime.timezone.utc:
+            raise ValueError(
+                "Invalid last_run and now. Must be of type datetime.datetime and have tzinfo = datetime.timezone.utc"
+            )
+        if last_run > now:
+            raise ValueError("last_run must be less than or equal to now")
+        # Runs fall on whole minutes, so the first candidate is the minute after the one holding last_run.
+        start = TimeUtils.datetime_to_epoch_minute(last_run) + 1
+        stop = TimeUtils.datetime_to_epoch_minute(now)
+        count = periodicity.count_runs(self, start, stop) if start <= stop else 0
+        if count == 0:
+            return MissedRuns(0, None, None)
+        return MissedRuns(
+            count,
+            TimeUtils.epoch_minute_to_datetime(periodicity.first_run(self, start)),
+            TimeUtils.epoch_minute_to_datetime(periodicity.last_run(self, stop)),
+        )
+
+    @instrumentation.timed("materialize")
+    def materialize(self, from_date, to_date):
+        """
+        Precompute every datetime from from_date to to_date matching the given cron expression, both ends included.
+        The result stores the runs as an array of epoch minutes and answers next/prev/slice queries by bisection;
+        it can be saved to a file and loaded memory-mapped by other processes.
+
+        :param from_date: datetime object from where the schedule will start with tzinfo in utc.
+        :param to_date: datetime object to where the schedule will end with tzinfo in utc.
+        :return: MaterializedSchedule
+        """
+        if not isinstance(from_date, datetime.datetime) or not isinstance(to_date, datetime.datetime):
+            raise ValueError("The from_date and to_date must be of type datetime.datetime")
+        if from_date.tzinfo != datetime.timezone.utc or to_date.tzinfo != datetime.timezone.utc:
+            raise ValueError(
+                "Invalid from_date and to_date. Must be of type datetime.datetime "
+                "and have tzinfo = datetime.timezone.utc"
+            )
+        return MaterializedSchedule.build(self, from_date, to_date)
+
+    @functools.cached_property
+    def period(self):
+        """
+        Fundamental period of the schedule, ignoring the year field.
+
+        A timedelta of at most one day for rules that run every day, seven days for day-of-week rules
+        and the 28-year calendar cycle for everything else.
+
+        :return: datetime.timedelta
+        """
+        return datetime.timedelta(minutes=periodicity.schedule_period(self))
+
+    @instrumentation.timed("get_final_execution_time")
     def get_final_execution_time(self, from_date, to_date):
         """
         Get the final execution datetime between from_date and to_date matching the given cron expression.
@@ -0,0 +1,20 @@
+import threading
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared between a caller and a running conflict search.
+
+    Call ``cancel()`` from any thread; the search stops at its next check and returns the
+    conflicts found so far with ``truncated=True``.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
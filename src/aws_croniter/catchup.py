@@ -0,0 +1,41 @@
+import datetime
+from collections.abc import Iterable
+
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.catchup_models import MissedRuns
+from aws_croniter.conflict_models import _validate_utc
+from aws_croniter.conflicts import CronInput
+from aws_croniter.utils import TimeUtils
+
+
+@instrumentation.timed("missed_runs")
+def missed_runs(
+    rules: Iterable[tuple[CronInput, datetime.datetime]],
+    now: datetime.datetime,
+) -> list[MissedRuns]:
+    """
+    ``AwsCroniter.missed_between(last_run, now)`` for every ``(expression, last_run)`` pair, in input order.
+
+    Recovery after an outage usually finds many rules sharing a schedule and a last run. Expressions are
+    parsed once per distinct string, and rules with equal schedules whose last runs fall in the same minute
+    share one answer, so the cost grows with the number of distinct schedules rather than the number of rules.
+    """
+    _validate_utc(now, "now")
+    crons: dict[str, AwsCroniter] = {}
+    answers: dict[tuple, MissedRuns] = {}
+    results = []
+    for expression, last_run in rules:
+        if isinstance(expression, AwsCroniter):
+            cron = expression
+        else:
+            cron = crons.get(expression)
+            if cron is None:
+                cron = crons[expression] = AwsCroniter(expression)
+        _validate_utc(last_run, "last_run")
+        key = (cron.schedule_key, TimeUtils.datetime_to_epoch_minute(last_run))
+        answer = answers.get(key)
+        if answer is None:
+            answer = answers[key] = cron.missed_between(last_run, now)
+        results.append(answer)
+    return results
@@ -0,0 +1,15 @@
+import datetime
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MissedRuns:
+    """
+    Runs of a schedule missed after its last run: how many, and the first and last of them.
+
+    ``first`` and ``last`` are ``None`` when ``count`` is zero.
+    """
+
+    count: int
+    first: datetime.datetime | None
+    last: datetime.datetime | None
@@ -0,0 +1,250 @@
+"""
+Command-line interface: ``aws-croniter <command> [FILE ...]``.
+
+Expressions are read one per line from the given files (``-`` or no file reads stdin); blank lines and
+lines starting with ``#`` are skipped. Results are written to stdout as NDJSON, one object per input line
+(``conflicts`` writes one object per conflict), carrying the 1-based ``line`` number across all inputs.
+"""
+
+import argparse
+import datetime
+import functools
+import itertools
+import json
+import sys
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO
+
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_models import ConflictCollectionMode
+from aws_croniter.conflicts import find_conflicts
+from aws_croniter.conflicts import iter_conflicts
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.utils import TimeUtils
+
+# Distinct expressions kept parsed per process; rule dumps repeat a small set of schedules.
+COMPILE_CACHE_SIZE = 4096
+# Lines handed to the worker pool at a time, so large inputs are never read into memory at once.
+BATCH_SIZE = 10_000
+# Lines sent to a worker process per task.
+WORKER_CHUNK_SIZE = 256
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line; returns ``0`` on success, ``1`` when any expression failed and ``2`` on errors."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "to_date", None) is not None and args.from_date > args.to_date:
+        parser.error("--from must not be after --to")
+    if args.command == "next" and args.from_date is None:
+        args.from_date = datetime.datetime.now(datetime.timezone.utc)
+    try:
+        return _run(args)
+    except _InputError as error:
+        print(f"aws-croniter: {error}", file=sys.stderr)
+        return 2
+
+
+class _InputError(Exception):
+    """An input file could not be opened."""
+
+
+def _run(args: argparse.Namespace) -> int:
+    lines = _read_expressions(args.files)
+    if args.command == "conflicts":
+        return _conflicts(args, lines, sys.stdout)
+    task = functools.partial(
+        _process_line,
+        args.command,
+        getattr(args, "from_date", None),
+        getattr(args, "to_date", None),
+        getattr(args, "count", 1),
+    )
+    failed = False
+    for record in _map_lines(task, lines, args.workers):
+        failed = failed or "error" in record
+        sys.stdout.write(json.dumps(record) + "\n")
+    return 1 if failed else 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aws-croniter",
+        description="Process AWS cron expressions in bulk and write NDJSON results.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def command(name: str, help_text: str) -> argparse.ArgumentParser:
+        subparser = commands.add_parser(name, help=help_text)
+        subparser.add_argument("files", nargs="*", default=["-"], help="files with one expression per line")
+        subparser.add_argument("--workers", type=_positive_int, default=1, help="worker processes")
+        return subparser
+
+    def window(subparser: argparse.ArgumentParser) -> None:
+        subparser.add_argument("--from", dest="from_date", type=_utc_datetime, required=True, help="ISO 8601")
+        subparser.add_argument("--to", dest="to_date", type=_utc_datetime, required=True, help="ISO 8601")
+
+    command("validate", "check that each expression parses")
+    next_parser = command("next", "next runs of each expression")
+    next_parser.add_argument("--from", dest="from_date", type=_utc_datetime, help="ISO 8601, default: now")
+    next_parser.add_argument("--count", type=_positive_int, default=1, help="runs per expression")
+    window(command("between", "runs of each expression in [--from, --to]"))
+    window(command("count", "number of runs of each expression in [--from, --to]"))
+
+    conflicts = command("conflicts", "conflicts between all expressions in [--from, --to]")
+    window(conflicts)
+    conflicts.add_argument("--buffer", type=int, default=0, help="minimum separation in minutes")
+    conflicts.add_argument("--mode", choices=[mode.value for mode in ConflictCollectionMode], default="first")
+    conflicts.add_argument("--max-conflicts", type=_positive_int, default=1)
+    conflicts.add_argument("--max-occurrences-per-expression", type=_positive_int, default=10_000)
+    conflicts.add_argument("--max-total-occurrences", type=_positive_int, default=100_000)
+    return parser
+
+
+def _utc_datetime(value: str) -> datetime.datetime:
+    """ISO 8601 datetime; a trailing ``Z`` means UTC, naive values are taken as UTC."""
+    try:
+        parsed = datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 datetime: {value!r}") from None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.astimezone(datetime.timezone.utc)
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def _read_expressions(files: list[str]) -> Iterator[tuple[int, str]]:
+    """
+    ``(line number, expression)`` for every non-blank, non-comment line, numbered across all inputs.
+
+    A file that cannot be opened raises ``_InputError``; lines of earlier files have been processed by then.
+    """
+    number = 0
+    for name in files:
+        try:
+            stream = sys.stdin if name == "-" else open(name, encoding="utf-8")
+        except OSError as error:
+            raise _InputError(f"{name}: {error.strerror or error}") from error
+        try:
+            for line in stream:
+                number += 1
+                expression = line.strip()
+                if expression and not expression.startswith("#"):
+                    yield number, expression
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def _map_lines(task, lines: Iterable[tuple[int, str]], workers: int) -> Iterator[dict]:
+    """Apply ``task`` to every line in input order, ``BATCH_SIZE`` lines at a time across ``workers`` processes."""
+    if workers == 1:
+        for number, expression in lines:
+            yield task(number, expression)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        lines = iter(lines)
+        while batch := list(itertools.islice(lines, BATCH_SIZE)):
+            numbers, expressions = zip(*batch)
+            yield from executor.map(task, numbers, expressions, chunksize=WORKER_CHUNK_SIZE)
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile(expression: str) -> tuple[AwsCroniter | None, str | None]:
+    """Parsed expression or the parse error message; both outcomes are cached."""
+    try:
+        return AwsCroniter(expression), None
+    except ValueError as error:
+        return None, str(error)
+
+
+def _process_line(
+    command: str,
+    from_date: datetime.datetime | None,
+    to_date: datetime.datetime | None,
+    count: int,
+    number: int,
+    expression: str,
+) -> dict:
+    record = {"line": number, "expression": expression}
+    cron, error = _compile(expression)
+    if command == "validate":
+        record["valid"] = error is None
+        if error is not None:
+            record["error"] = error
+        return record
+    if error is not None:
+        record["error"] = error
+        return record
+
+    if command == "next":
+        record["next"] = [run.isoformat() for run in cron.get_next(from_date, count) if run is not None]
+        return record
+    runs = walk_epoch_minutes(
+        cron, TimeUtils.datetime_to_epoch_minute(from_date), TimeUtils.datetime_to_epoch_minute(to_date)
+    )
+    if command == "count":
+        record["count"] = sum(1 for _ in runs)
+    else:
+        record["runs"] = [TimeUtils.epoch_minute_to_datetime(run).isoformat() for run in runs]
+    return record
+
+
+def _conflicts(args: argparse.Namespace, lines: Iterable[tuple[int, str]], out: IO[str]) -> int:
+    """Search all valid expressions together; invalid lines are reported and left out of the search."""
+    numbers, crons = [], []
+    failed = False
+    for number, expression in lines:
+        cron, error = _compile(expression)
+        if error is not None:
+            out.write(json.dumps({"line": number, "expression": expression, "error": error}) + "\n")
+            failed = True
+            continue
+        numbers.append(number)
+        crons.append(cron)
+
+    keywords = {
+        "from_date": args.from_date,
+        "to_date": args.to_date,
+        "buffer": datetime.timedelta(minutes=args.buffer),
+        "collection_mode": ConflictCollectionMode(args.mode),
+        "max_conflicts": args.max_conflicts,
+        "max_expressions": max(len(crons), 2),
+        "max_occurrences_per_expression": args.max_occurrences_per_expression,
+        "max_total_occurrences": args.max_total_occurrences,
+    }
+    try:
+        if args.workers > 1:
+            conflicts = find_conflicts(crons, workers=args.workers, **keywords).conflicts
+        else:
+            conflicts = iter_conflicts(crons, **keywords)
+        for position, conflict in enumerate(conflicts):
+            record = {
+                "conflict": position,
+                "separation_minutes": conflict.separation // datetime.timedelta(minutes=1),
+                "runs": [
+                    {
+                        "line": numbers[run.expression_index],
+                        "expression": run.expression,
+                        "run_at": run.run_at.isoformat(),
+                    }
+                    for run in conflict.runs
+                ],
+            }
+            out.write(json.dumps(record) + "\n")
+    except ValueError as error:  # includes AwsCroniterConflictSearchLimitError
+        print(f"aws-croniter: error: {error}", file=sys.stderr)
+        return 2
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
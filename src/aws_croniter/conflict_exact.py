@@ -0,0 +1,173 @@
+import datetime
+
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_models import INTERRUPT_CHECK_INTERVAL
+from aws_croniter.conflict_models import ConflictSearchResult
+from aws_croniter.conflict_models import ScheduleConflict
+from aws_croniter.conflict_models import ScheduledRun
+from aws_croniter.conflict_models import _Interruption
+from aws_croniter.utils import DateUtils
+
+
+class _Fields:
+    """Set views of one parsed expression, with day rules resolved lazily per month."""
+
+    def __init__(self, cron: AwsCroniter) -> None:
+        self.cron = cron
+        self.years = frozenset(cron.years)
+        self.months = frozenset(cron.months)
+        self.hours = frozenset(cron.hours)
+        self.minutes = frozenset(cron.minutes)
+        self._days: dict[tuple[int, int], frozenset[int]] = {}
+
+    def days(self, year: int, month: int) -> frozenset[int]:
+        key = (year, month)
+        days = self._days.get(key)
+        if days is None:
+            days = frozenset(
+                DateUtils.resolve_days_of_month(year, month, self.cron.days_of_month, self.cron.days_of_week)
+            )
+            self._days[key] = days
+        return days
+
+    def fires_at(self, moment: datetime.datetime) -> bool:
+        return (
+            moment.year in self.years
+            and moment.month in self.months
+            and moment.hour in self.hours
+            and moment.minute in self.minutes
+            and moment.day in self.days(moment.year, moment.month)
+        )
+
+
+class _Pair:
+    """Field-set intersection of two expressions; only day rules are left to resolve."""
+
+    def __init__(self, first: _Fields, second: _Fields) -> None:
+        self.first = first
+        self.second = second
+        self.years = first.years & second.years
+        self.months = first.months & second.months
+        self.times = sorted(
+            hour * 60 + minute for hour in first.hours & second.hours for minute in first.minutes & second.minutes
+        )
+
+    @property
+    def possible(self) -> bool:
+        return bool(self.years and self.months and self.times)
+
+
+def find_first_exact_conflict(
+    cron_pairs: list[tuple[AwsCroniter, str]],
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    interruption: _Interruption | None = None,
+    groups: list[list[int]] | None = None,
+) -> ConflictSearchResult:
+    """
+    Find the earliest run time shared by two expressions inside ``[from_date, to_date]``.
+
+    Exact (``buffer=0``) conflicts only need the minute, hour, month and year sets of two expressions to
+    intersect and one day to satisfy both day rules. Field sets are intersected once per pair, and day
+    rules are resolved month by month, so no occurrences are enumerated and a window reaching 2199 is
+    proven conflict-free in at most one pass over its months.
+
+    ``groups`` lists equivalent expressions (one group per expression by default). Only one member of each
+    group is intersected with the others; a group of two or more first conflicts with itself at its first
+    run. The returned conflict is the one the ``FIRST`` enumeration reports: walking the groups that fire at
+    the earliest shared time in index order, either a group of two or more (naming all its members) or the
+    second single expression, whichever is reached first.
+
+    ``interruption`` (the search's timeout, deadline and cancellation) is checked every
+    ``INTERRUPT_CHECK_INTERVAL`` months; when it fires the result has ``truncated=True`` and ``reached`` set
+    to the end of the last month proven conflict-free (``None`` if no month was scanned).
+    """
+    start = from_date.replace(second=0, microsecond=0)
+    stop = to_date.replace(second=0, microsecond=0)
+    if groups is None:
+        groups = [[index] for index in range(len(cron_pairs))]
+    fields = [_Fields(cron_pairs[members[0]][0]) for members in groups]
+    pairs = [
+        pair
+        for i, first in enumerate(fields)
+        for second in fields[i if len(groups[i]) > 1 else i + 1 :]
+        if (pair := _Pair(first, second)).possible
+    ]
+    collector = instrumentation.active()
+    if collector is not None:
+        collector.increment("conflicts.exact_pairs", len(pairs))
+
+    if not pairs:
+        return ConflictSearchResult(False, [], 0)
+    moment, unscanned = _first_shared_moment(pairs, start, stop, interruption)
+    if unscanned is not None:
+        reached = unscanned - datetime.timedelta(minutes=1) if unscanned > start else None
+        return ConflictSearchResult(False, [], 0, truncated=True, reached=reached)
+    if moment is None:
+        return ConflictSearchResult(False, [], 0)
+
+    runs = []
+    for members, group_fields in zip(groups, fields):
+        if not group_fields.fires_at(moment):
+            continue
+        if len(members) > 1:
+            # The earliest shared moment cannot be later than the group's first run, so this is that run.
+            runs = [ScheduledRun(index, cron_pairs[index][1], moment) for index in members]
+            break
+        runs.append(ScheduledRun(members[0], cron_pairs[members[0]][1], moment))
+        if len(runs) == 2:
+            break
+    if collector is not None:
+        collector.increment("conflicts.found")
+    return ConflictSearchResult(True, [ScheduleConflict(tuple(runs), datetime.timedelta(0))], 0)
+
+
+def _first_shared_moment(
+    pairs: list[_Pair],
+    start: datetime.datetime,
+    stop: datetime.datetime,
+    interruption: _Interruption | None,
+) -> tuple[datetime.datetime | None, datetime.datetime | None]:
+    """
+    Earliest shared moment, or ``None``, and ``None``; when interrupted, ``None`` and the first moment of
+    the first month left unscanned.
+    """
+    year, month = start.year, start.month
+    scanned = 0
+    while (year, month) <= (stop.year, stop.month):
+        if interruption is not None and scanned % INTERRUPT_CHECK_INTERVAL == 0 and interruption.fired():
+            return None, datetime.datetime(year, month, 1, tzinfo=datetime.timezone.utc)
+        scanned += 1
+        earliest = None
+        for pair in pairs:
+            if year not in pair.years or month not in pair.months:
+                continue
+            moment = _first_in_month(pair, year, month, start, stop)
+            if moment is not None and (earliest is None or moment < earliest):
+                earliest = moment
+        if earliest is not None:
+            return earliest, None
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return None, None
+
+
+def _first_in_month(
+    pair: _Pair,
+    year: int,
+    month: int,
+    start: datetime.datetime,
+    stop: datetime.datetime,
+) -> datetime.datetime | None:
+    shared_days = pair.first.days(year, month) & pair.second.days(year, month)
+    for day in sorted(shared_days):
+        for minute_of_day in pair.times:
+            moment = datetime.datetime(
+                year, month, day, minute_of_day // 60, minute_of_day % 60, tzinfo=datetime.timezone.utc
+            )
+            if moment < start:
+                continue
+            if moment > stop:
+                return None
+            return moment
+    return None
@@ -0,0 +1,230 @@
+import bisect
+import datetime
+from array import array
+from collections.abc import Iterator
+from itertools import islice
+
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_models import ConflictIndexChange
+from aws_croniter.conflict_models import PairConflict
+from aws_croniter.conflict_models import _validate_utc
+from aws_croniter.conflicts import CronInput
+from aws_croniter.exceptions import AwsCroniterConflictSearchLimitError
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.utils import TimeUtils
+
+
+class _Entry:
+    """
+    Materialized runs of one indexed expression, as sorted epoch minutes in an ``array('q')``.
+
+    Runs cost 8 bytes each; the cells they fall in are not stored but read off the sorted runs by ``cells``.
+    """
+
+    def __init__(self, order: int, runs: array) -> None:
+        self.order = order
+        self.runs = runs
+
+    def cells(self, cell_width: int) -> Iterator[int]:
+        """Distinct cells holding a run, ascending; bisects past the runs of each cell instead of visiting them."""
+        runs = self.runs
+        position = 0
+        while position < len(runs):
+            cell = runs[position] // cell_width
+            yield cell
+            position = bisect.bisect_left(runs, (cell + 1) * cell_width, position + 1)
+
+
+class ConflictIndex:
+    """
+    Long-lived index of expressions and their pairwise conflicts over a fixed window.
+
+    Each expression's runs in ``[from_date, to_date]`` are materialized once, and the minutes they fall on
+    are hashed into cells ``buffer + 1`` minutes wide: two runs within ``buffer`` of each other always share
+    a cell or sit in neighbouring cells. ``add`` therefore only compares the new expression with expressions
+    that have a run in one of its cells or their neighbours, and ``remove`` just drops the expression's
+    pairs, so an update costs time proportional to the expressions near the changed one, not to the fleet.
+
+    Pair conflicts are summarized as ``PairConflict`` exactly like ``conflict_matrix``. Expressions are keyed
+    by their cron string; adding the same string twice raises ``ValueError``.
+    """
+
+    def __init__(
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        buffer: datetime.timedelta | None = None,
+        *,
+        max_occurrences_per_expression: int = 10_000,
+        expressions: tuple[CronInput, ...] = (),
+    ) -> None:
+        if buffer is None:
+            buffer = datetime.timedelta(0)
+        _validate_utc(from_date, "from_date")
+        _validate_utc(to_date, "to_date")
+        if buffer < datetime.timedelta(0):
+            raise ValueError("buffer must be greater than or equal to zero")
+        if from_date > to_date:
+            raise ValueError("from_date must be less than or equal to to_date")
+        if max_occurrences_per_expression < 1:
+            raise ValueError("max_occurrences_per_expression must be at least 1")
+
+        self.from_date = from_date
+        self.to_date = to_date
+        self.buffer = buffer
+        self.max_occurrences_per_expression = max_occurrences_per_expression
+        # Runs are whole minutes, so a gap is within the buffer exactly when it is within its whole minutes.
+        self._buffer_minutes = buffer // datetime.timedelta(minutes=1)
+        self._cell_width = self._buffer_minutes + 1
+        self._entries: dict[str, _Entry] = {}
+        self._cells: dict[int, set[str]] = {}
+        self._pairs: dict[str, dict[str, PairConflict]] = {}
+        self._next_order = 0
+        for expression in expressions:
+            self.add(expression)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, expression: object) -> bool:
+        if isinstance(expression, AwsCroniter):
+            expression = expression.cron
+        return expression in self._entries
+
+    @property
+    def expressions(self) -> list[str]:
+        """Indexed expressions, in the order they were added."""
+        return list(self._entries)
+
+    def add(self, expression: CronInput) -> ConflictIndexChange:
+        """Index ``expression`` and return the pair conflicts it introduces."""
+        cron, key = self._parse(expression)
+        if key in self._entries:
+            raise ValueError(f"expression {key!r} is already indexed")
+        return self._insert(key, self._build(cron))
+
+    def remove(self, expression: CronInput) -> ConflictIndexChange:
+        """Drop ``expression`` from the index and return the pair conflicts that no longer exist."""
+        _, key = self._parse(expression, validate=False)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            raise ValueError(f"expression {key!r} is not indexed")
+        for cell in entry.cells(self._cell_width):
+            members = self._cells[cell]
+            members.discard(key)
+            if not members:
+                del self._cells[cell]
+        change = ConflictIndexChange()
+        for other, pair in self._pairs.pop(key).items():
+            del self._pairs[other][key]
+            change.resolved[self._pair_key(key, other, entry)] = pair
+        return change
+
+    def replace(self, old: CronInput, new: CronInput) -> ConflictIndexChange:
+        """
+        Swap ``old`` for ``new`` in one step.
+
+        ``new`` is parsed and materialized first, so a replacement that fails leaves the index untouched.
+        Conflicts of ``old`` are reported as resolved and conflicts of ``new`` as introduced.
+        """
+        cron, key = self._parse(new)
+        _, old_key = self._parse(old, validate=False)
+        if old_key not in self._entries:
+            raise ValueError(f"expression {old_key!r} is not indexed")
+        if key in self._entries and key != old_key:
+            raise ValueError(f"expression {key!r} is already indexed")
+        entry = self._build(cron)
+        resolved = self.remove(old_key)
+        introduced = self._insert(key, entry)
+        return ConflictIndexChange(introduced.introduced, resolved.resolved)
+
+    def conflicts(self) -> dict[tuple[str, str], PairConflict]:
+        """Every conflicting pair, keyed in the order the expressions were added."""
+        result = {}
+        for key, entry in self._entries.items():
+            for other, pair in self._pairs[key].items():
+                if self._entries[other].order > entry.order:
+                    result[(key, other)] = pair
+        return result
+
+    def conflicts_for(self, expression: CronInput) -> dict[str, PairConflict]:
+        """Expressions conflicting with ``expression``, mapped to the pair summary."""
+        _, key = self._parse(expression, validate=False)
+        if key not in self._entries:
+            raise ValueError(f"expression {key!r} is not indexed")
+        return dict(self._pairs[key])
+
+    @staticmethod
+    def _parse(expression: CronInput, validate: bool = True) -> tuple[AwsCroniter | None, str]:
+        if isinstance(expression, AwsCroniter):
+            return expression, expression.cron
+        return (AwsCroniter(expression) if validate else None), expression
+
+    def _build(self, cron: AwsCroniter) -> _Entry:
+        entry = _Entry(self._next_order, self._materialize(cron))
+        self._next_order += 1
+        return entry
+
+    def _insert(self, key: str, entry: _Entry) -> ConflictIndexChange:
+        cells = list(entry.cells(self._cell_width))
+        candidates = set()
+        for cell in cells:
+            for neighbour in (cell - 1, cell, cell + 1):
+                candidates.update(self._cells.get(neighbour, ()))
+        collector = instrumentation.active()
+        if collector is not None:
+            collector.increment("conflicts.index_candidates", len(candidates))
+
+        self._entries[key] = entry
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+        partners = self._pairs[key] = {}
+        change = ConflictIndexChange()
+        for other in sorted(candidates, key=lambda item: self._entries[item].order):
+            pair = self._pair_conflict(self._entries[other].runs, entry.runs)
+            if pair is not None:
+                partners[other] = pair
+                self._pairs[other][key] = pair
+                change.introduced[(other, key)] = pair
+        return change
+
+    def _pair_key(self, key: str, other: str, entry: _Entry) -> tuple[str, str]:
+        return (other, key) if self._entries[other].order < entry.order else (key, other)
+
+    def _materialize(self, cron: AwsCroniter) -> array:
+        """Runs in the window as epoch minutes, read straight off the cursor walk without building datetimes."""
+        limit = self.max_occurrences_per_expression
+        start = TimeUtils.datetime_to_epoch_minute(self.from_date)
+        stop = TimeUtils.datetime_to_epoch_minute(self.to_date)
+        runs = array("q", islice(walk_epoch_minutes(cron, start, stop), limit + 1))
+        if len(runs) > limit:
+            raise AwsCroniterConflictSearchLimitError(
+                f"Exceeded max_occurrences_per_expression ({limit}) for expression index {self._next_order}."
+            )
+        return runs
+
+    def _pair_conflict(self, first: array, second: array) -> PairConflict | None:
+        """Merge two sorted run lists, counting runs that land within the buffer after a run of the other."""
+        buffer = self._buffer_minutes
+        first_at = count = separation = None
+        last_first = last_second = None
+        i = j = 0
+        while i < len(first) or j < len(second):
+            if j >= len(second) or (i < len(first) and first[i] <= second[j]):
+                run, prior = first[i], last_second
+                last_first = run
+                i += 1
+            else:
+                run, prior = second[j], last_first
+                last_second = run
+                j += 1
+            if prior is None or run - prior > buffer:
+                continue
+            if first_at is None:
+                first_at, count, separation = run, 0, run - prior
+            count += 1
+            separation = min(separation, run - prior)
+        if first_at is None:
+            return None
+        return PairConflict(TimeUtils.epoch_minute_to_datetime(first_at), count, datetime.timedelta(minutes=separation))
@@ -0,0 +1,92 @@
+import datetime
+import heapq
+from collections import deque
+from collections.abc import Sequence
+
+from aws_croniter import instrumentation
+from aws_croniter.conflict_models import ConflictMatrix
+from aws_croniter.conflict_models import PairConflict
+from aws_croniter.conflict_models import _validate_utc
+from aws_croniter.conflicts import CronInput
+from aws_croniter.conflicts import _prepare_expressions
+from aws_croniter.occurrence_stream import OccurrenceCounter
+from aws_croniter.occurrence_stream import OccurrenceStream
+
+
+@instrumentation.timed("conflict_matrix")
+def conflict_matrix(
+    expressions: Sequence[CronInput],
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    buffer: datetime.timedelta | None = None,
+    *,
+    max_occurrences_per_expression: int = 10_000,
+    max_total_occurrences: int = 10_000_000,
+) -> ConflictMatrix:
+    """
+    Find every pair of expressions whose runs fall within ``buffer`` of each other in ``[from_date, to_date]``.
+
+    All expressions are merged into one time-ordered sweep. Each run is compared with the latest run of every
+    other expression still inside the buffer window, so the work is proportional to occurrences times the
+    expressions active in a window, not to the number of pairs. Memory holds the window and one entry per
+    conflicting pair.
+
+    ``count`` on each ``PairConflict`` is the number of runs of either expression that arrive within
+    ``buffer`` after (or at the same time as) a run of the other; ``min_separation`` is the smallest gap seen.
+    There is no ``max_expressions`` cap; occurrence limits raise ``AwsCroniterConflictSearchLimitError``.
+    """
+    if buffer is None:
+        buffer = datetime.timedelta(0)
+    _validate_utc(from_date, "from_date")
+    _validate_utc(to_date, "to_date")
+    if buffer < datetime.timedelta(0):
+        raise ValueError("buffer must be greater than or equal to zero")
+    if from_date > to_date:
+        raise ValueError("from_date must be less than or equal to to_date")
+
+    cron_pairs = _prepare_expressions(expressions, None)
+    counter = OccurrenceCounter(max_total_occurrences)
+    heap: list[tuple[datetime.datetime, int, OccurrenceStream]] = []
+    for index, (cron, expression) in enumerate(cron_pairs):
+        stream = OccurrenceStream(cron, expression, index, from_date, to_date, max_occurrences_per_expression, counter)
+        if stream.peek() is not None:
+            heap.append((stream.peek(), index, stream))
+    heapq.heapify(heap)
+
+    latest: dict[int, datetime.datetime] = {}
+    window: deque[tuple[datetime.datetime, int]] = deque()
+    # pair -> [first_conflict, count, min_separation]
+    stats: dict[tuple[int, int], list] = {}
+
+    while heap:
+        run_at, index, stream = heap[0]
+        threshold = run_at - buffer
+        while window and window[0][0] < threshold:
+            expired_at, expired_index = window.popleft()
+            if latest.get(expired_index) == expired_at:
+                del latest[expired_index]
+
+        for other, other_at in latest.items():
+            if other == index:
+                continue
+            key = (other, index) if other < index else (index, other)
+            separation = run_at - other_at
+            entry = stats.get(key)
+            if entry is None:
+                stats[key] = [run_at, 1, separation]
+            else:
+                entry[1] += 1
+                if separation < entry[2]:
+                    entry[2] = separation
+
+        latest[index] = run_at
+        window.append((run_at, index))
+        stream.pop()
+        next_time = stream.peek()
+        if next_time is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (next_time, index, stream))
+
+    pairs = {key: PairConflict(first, count, separation) for key, (first, count, separation) in stats.items()}
+    return ConflictMatrix([expression for _, expression in cron_pairs], pairs, counter.total)
@@ -1,27 +1,52 @@
 import datetime
+import time
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
 from enum import Enum
 
+from aws_croniter.cancellation import CancellationToken
+from aws_croniter.utils import TimeUtils
+
+# Steps (merged runs, or scanned months in the exact search) between timeout, deadline and cancellation checks.
+INTERRUPT_CHECK_INTERVAL = 64
+
 
 class ConflictCollectionMode(Enum):
     """How many schedule conflicts to collect before stopping."""
 
     FIRST = "first"
     ALL = "all"
+    CLUSTER = "cluster"
+
+
+class _FrozenSlots:
+    """Pickle support for frozen slotted dataclasses (unpickling by attribute assignment fails before 3.11)."""
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return self.__class__, tuple(getattr(self, item.name) for item in fields(self))
+
 
+@dataclass(frozen=True, slots=True)
+class ScheduledRun(_FrozenSlots):
+    """
+    One scheduled execution time attributed to a source expression.
 
-@dataclass(frozen=True)
-class ScheduledRun:
-    """One scheduled execution time attributed to a source expression."""
+    ``expression`` references the caller's string (it is not copied), so a run costs three slots.
+    """
 
     expression_index: int
     expression: str
     run_at: datetime.datetime
 
 
-@dataclass(frozen=True)
-class ScheduleConflict:
+@dataclass(frozen=True, slots=True)
+class ScheduleConflict(_FrozenSlots):
     """Runs from different expressions that violate the minimum separation (buffer)."""
 
     runs: tuple[ScheduledRun, ...]
@@ -36,6 +61,71 @@ class ScheduleConflict:
         return max(run.run_at for run in self.runs)
 
 
+@dataclass
+class ConflictColumns:
+    """
+    Conflicts stored as parallel integer arrays instead of run and conflict objects.
+
+    Conflict ``i`` owns runs ``offsets[i]`` to ``offsets[i + 1]`` (exclusive) of ``expression_indexes``
+    and ``run_minutes`` (UTC minutes since the epoch); ``separation_minutes[i]`` is its separation.
+    Expression strings are kept once, in ``expressions``, and looked up by index. Storage is about
+    16 bytes per run and 16 per conflict.
+    """
+
+    expressions: list[str]
+    offsets: array = field(default_factory=lambda: array("q", [0]))
+    expression_indexes: array = field(default_factory=lambda: array("q"))
+    run_minutes: array = field(default_factory=lambda: array("q"))
+    separation_minutes: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_conflicts(cls, expressions: list[str], conflicts: Iterable[ScheduleConflict]) -> "ConflictColumns":
+        columns = cls(expressions)
+        for conflict in conflicts:
+            columns.append(conflict)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.separation_minutes)
+
+    def __iter__(self) -> Iterator[ScheduleConflict]:
+        for position in range(len(self)):
+            yield self.conflict(position)
+
+    def append(self, conflict: ScheduleConflict) -> None:
+        for run in conflict.runs:
+            self.expression_indexes.append(run.expression_index)
+            self.run_minutes.append(TimeUtils.datetime_to_epoch_minute(run.run_at))
+        self.offsets.append(len(self.run_minutes))
+        self.separation_minutes.append(conflict.separation // datetime.timedelta(minutes=1))
+
+    def extend(self, other: "ConflictColumns", limit: int | None = None) -> None:
+        """Append the first ``limit`` conflicts of ``other`` (all of them by default)."""
+        count = len(other) if limit is None else min(limit, len(other))
+        if count <= 0:
+            return
+        end = other.offsets[count]
+        base = self.offsets[-1]
+        self.expression_indexes.extend(other.expression_indexes[:end])
+        self.run_minutes.extend(other.run_minutes[:end])
+        self.offsets.extend(base + offset for offset in other.offsets[1 : count + 1])
+        self.separation_minutes.extend(other.separation_minutes[:count])
+
+    def conflict(self, position: int) -> ScheduleConflict:
+        """Rebuild conflict ``position`` as a ``ScheduleConflict``."""
+        if not 0 <= position < len(self):
+            raise IndexError("conflict position out of range")
+        runs = tuple(
+            ScheduledRun(
+                self.expression_indexes[item],
+                self.expressions[self.expression_indexes[item]],
+                TimeUtils.epoch_minute_to_datetime(self.run_minutes[item]),
+            )
+            for item in range(self.offsets[position], self.offsets[position + 1])
+        )
+        return ScheduleConflict(runs, datetime.timedelta(minutes=self.separation_minutes[position]))
+
+
 @dataclass
 class ConflictSearchOptions:
     """
@@ -43,6 +133,13 @@ class ConflictSearchOptions:
 
     All datetimes must use ``datetime.timezone.utc``. The search window is
     inclusive on both ends: occurrences at ``from_date`` or ``to_date`` are considered.
+
+    ``timeout`` (measured from the start of the search), ``deadline`` (wall clock) and
+    ``cancellation`` bound how long a search may run; when one of them fires, the conflicts
+    found so far are returned with ``truncated=True``.
+
+    With ``columnar`` the result carries its conflicts in ``ConflictSearchResult.columns``
+    and leaves ``conflicts`` empty.
     """
 
     from_date: datetime.datetime
@@ -53,6 +150,12 @@ class ConflictSearchOptions:
     max_expressions: int = 50
     max_occurrences_per_expression: int = 10_000
     max_total_occurrences: int = 100_000
+    workers: int = 1
+    prefetch_size: int = 64
+    timeout: datetime.timedelta | None = None
+    deadline: datetime.datetime | None = None
+    cancellation: CancellationToken | None = None
+    columnar: bool = False
 
     def __post_init__(self) -> None:
         _validate_utc(self.from_date, "from_date")
@@ -69,6 +172,14 @@ class ConflictSearchOptions:
             raise ValueError("max_occurrences_per_expression must be at least 1")
         if self.max_total_occurrences < 1:
             raise ValueError("max_total_occurrences must be at least 1")
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.prefetch_size < 1:
+            raise ValueError("prefetch_size must be at least 1")
+        if self.timeout is not None and self.timeout < datetime.timedelta(0):
+            raise ValueError("timeout must be greater than or equal to zero")
+        if self.deadline is not None:
+            _validate_utc(self.deadline, "deadline")
 
     @property
     def stop_on_first(self) -> bool:
@@ -79,6 +190,14 @@ class ConflictSearchOptions:
             return 1
         return self.max_conflicts
 
+    def effective_deadline(self) -> datetime.datetime | None:
+        """The earlier of ``deadline`` and ``timeout`` from now, or ``None`` when the search is unbounded."""
+        deadline = self.deadline
+        if self.timeout is not None:
+            timeout_at = datetime.datetime.now(datetime.timezone.utc) + self.timeout
+            deadline = timeout_at if deadline is None else min(deadline, timeout_at)
+        return deadline
+
     @classmethod
     def from_call(
         cls,
@@ -91,6 +210,12 @@ class ConflictSearchOptions:
         max_expressions: int = 50,
         max_occurrences_per_expression: int = 10_000,
         max_total_occurrences: int = 100_000,
+        workers: int = 1,
+        prefetch_size: int = 64,
+        timeout: datetime.timedelta | None = None,
+        deadline: datetime.datetime | None = None,
+        cancellation: CancellationToken | None = None,
+        columnar: bool = False,
     ) -> "ConflictSearchOptions":
         if buffer is None:
             buffer = datetime.timedelta(0)
@@ -103,6 +228,12 @@ class ConflictSearchOptions:
             max_expressions=max_expressions,
             max_occurrences_per_expression=max_occurrences_per_expression,
             max_total_occurrences=max_total_occurrences,
+            workers=workers,
+            prefetch_size=prefetch_size,
+            timeout=timeout,
+            deadline=deadline,
+            cancellation=cancellation,
+            columnar=columnar,
         )
 
 
@@ -113,14 +244,92 @@ class ConflictSearchResult:
     has_conflict: bool
     conflicts: list[ScheduleConflict] = field(default_factory=list)
     occurrences_examined: int = 0
+    # Groups of input indexes whose expressions fire at exactly the same times (every run collides).
+    equivalent_expressions: list[tuple[int, ...]] = field(default_factory=list)
+    # Input indexes the field-level pre-screen proved cannot conflict; they were never enumerated.
+    pruned_expressions: list[int] = field(default_factory=list)
+    # Set when a timeout, deadline or cancellation stopped the search early; every conflict completed
+    # at or before `reached` has then been reported (`reached` is None if no run was examined).
+    truncated: bool = False
+    reached: datetime.datetime | None = None
+    # Conflicts as parallel arrays, set instead of `conflicts` for columnar searches.
+    columns: ConflictColumns | None = None
 
     @property
     def first_conflict(self) -> ScheduleConflict | None:
+        if self.columns is not None:
+            return self.columns.conflict(0) if len(self.columns) else None
         if not self.conflicts:
             return None
         return self.conflicts[0]
 
+    @property
+    def conflict_count(self) -> int:
+        return len(self.columns) if self.columns is not None else len(self.conflicts)
+
+
+@dataclass(frozen=True, slots=True)
+class PairConflict(_FrozenSlots):
+    """Summary of every violation of ``buffer`` between two expressions in a window."""
+
+    first_conflict: datetime.datetime
+    count: int
+    min_separation: datetime.timedelta
+
+
+@dataclass
+class ConflictMatrix:
+    """
+    Sparse pairwise conflict summary.
+
+    ``pairs`` maps ``(i, j)`` with ``i < j`` (indexes into ``expressions``) to a
+    ``PairConflict``; pairs that never conflict are absent.
+    """
+
+    expressions: list[str]
+    pairs: dict[tuple[int, int], PairConflict] = field(default_factory=dict)
+    occurrences_examined: int = 0
+
+    def get(self, first: int, second: int) -> PairConflict | None:
+        return self.pairs.get((min(first, second), max(first, second)))
+
+    def conflicting_with(self, index: int) -> list[int]:
+        return sorted(j if i == index else i for i, j in self.pairs if index in (i, j))
+
+
+@dataclass
+class ConflictIndexChange:
+    """
+    Pair conflicts introduced or resolved by one ``ConflictIndex`` update.
+
+    Both maps are keyed by the pair of expression strings, in the order they were added to the index.
+    """
+
+    introduced: dict[tuple[str, str], PairConflict] = field(default_factory=dict)
+    resolved: dict[tuple[str, str], PairConflict] = field(default_factory=dict)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.introduced or self.resolved)
+
 
 def _validate_utc(value: datetime.datetime, name: str) -> None:
     if value.tzinfo is None or value.tzinfo != datetime.timezone.utc:
         raise ValueError(f"{name} must be a datetime with tzinfo=datetime.timezone.utc")
+
+
+class _Interruption:
+    """Timeout, deadline and cancellation of one search; the deadline is fixed when the search starts."""
+
+    def __init__(self, options: "ConflictSearchOptions") -> None:
+        self.cancellation = options.cancellation
+        deadline = options.effective_deadline()
+        self.expires_at = None
+        if deadline is not None:
+            remaining = (deadline - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            self.expires_at = time.monotonic() + remaining
+
+    def fired(self) -> bool:
+        if self.cancellation is not None and self.cancellation.cancelled:
+            return True
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
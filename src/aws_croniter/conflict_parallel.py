@@ -0,0 +1,201 @@
+import dataclasses
+import datetime
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.cancellation import CancellationToken
+from aws_croniter.conflict_models import ConflictCollectionMode
+from aws_croniter.conflict_models import ConflictColumns
+from aws_croniter.conflict_models import ConflictSearchOptions
+from aws_croniter.conflict_models import ConflictSearchResult
+
+# Shards per worker: finer shards let FIRST mode cancel more of the remaining window once a conflict is found.
+SHARDS_PER_WORKER = 4
+# How often the coordinating process polls a cancellation token while shards run.
+CANCELLATION_POLL_SECONDS = 0.05
+
+# Set in each worker process by the pool initializer; shards stop at their next interruption check once set.
+_stop_signal = None
+
+
+def search_conflicts_parallel(
+    cron_pairs: list[tuple[AwsCroniter, str]],
+    options: ConflictSearchOptions,
+) -> ConflictSearchResult:
+    """
+    Search ``[from_date, to_date]`` in time shards across ``options.workers`` processes.
+
+    Each shard owns a contiguous slice of the window but starts its search ``buffer`` earlier, so every run
+    sees the same recent runs it would see in a sequential search; only conflicts completed inside the
+    owned slice are reported (``CLUSTER`` shards also read ``buffer`` past their slice to decide whether
+    a cluster is maximal). Shard results are merged in time order. In ``FIRST`` mode, shards later than
+    one that reported a conflict are cancelled; in ``ALL`` mode, shards after the point where the ordered
+    prefix already holds ``max_conflicts`` are cancelled. Occurrence limits apply to each shard separately.
+
+    Shards receive the search deadline and stop on their own when it passes. A cancellation token cannot
+    cross process boundaries, so it is polled here instead: once cancelled, the in-order prefix of finished
+    shards is returned as a truncated result. Whenever the search returns (finished, stopped early or
+    cancelled), a stop signal shared with the workers is set first, so shards still running stop at their
+    next interruption check, and the workers are joined before returning.
+    """
+    shards = _shard_bounds(options.from_date, options.to_date, options.workers * SHARDS_PER_WORKER)
+    target = options.effective_max_conflicts()
+    cancellation = options.cancellation
+    shard_options = dataclasses.replace(options, timeout=None, deadline=options.effective_deadline(), cancellation=None)
+    stop = multiprocessing.Event()
+    executor = ProcessPoolExecutor(
+        max_workers=min(options.workers, len(shards)), initializer=_install_stop_signal, initargs=(stop,)
+    )
+    try:
+        futures: dict[Future, int] = {
+            executor.submit(_search_shard, cron_pairs, shard_options, shard_start, shard_end): index
+            for index, (shard_start, shard_end) in enumerate(shards)
+        }
+        completed: dict[int, Future] = {}
+        cutoff = len(shards) - 1
+        pending = set(futures)
+        poll = CANCELLATION_POLL_SECONDS if cancellation is not None else None
+        while pending:
+            if cancellation is not None and cancellation.cancelled:
+                break
+            done, pending = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                completed[index] = future
+                if options.stop_on_first and future.exception() is None and future.result().has_conflict:
+                    cutoff = min(cutoff, index)
+            cutoff = min(cutoff, _satisfied_prefix(completed, target, cutoff))
+            for future in list(pending):
+                if futures[future] > cutoff:
+                    future.cancel()
+                    pending.discard(future)
+            if all(index in completed for index in range(cutoff + 1)):
+                break
+        # Columnar shard results are concatenated into one set of arrays.
+        columns = ConflictColumns([expression for _, expression in cron_pairs]) if options.columnar else None
+        return _merge(completed, cutoff, target, shards, columns)
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _install_stop_signal(stop) -> None:
+    global _stop_signal
+    _stop_signal = stop
+
+
+class _StopSignalToken(CancellationToken):
+    """Cancellation token backed by the pool's stop signal (a ``multiprocessing.Event``)."""
+
+    def __init__(self, stop) -> None:
+        self._event = stop
+
+
+def _search_shard(
+    cron_pairs: list[tuple[AwsCroniter, str]],
+    options: ConflictSearchOptions,
+    shard_start: datetime.datetime,
+    shard_end: datetime.datetime,
+) -> ConflictSearchResult:
+    # Imported here: conflicts imports this module to dispatch parallel searches.
+    from aws_croniter.conflicts import _search_conflicts
+
+    # A cluster is owned by the shard holding its latest run, but whether it is maximal depends on
+    # runs up to `buffer` later, so CLUSTER shards look ahead past the slice they own.
+    lookahead = options.buffer if options.collection_mode is ConflictCollectionMode.CLUSTER else datetime.timedelta(0)
+    shard_options = dataclasses.replace(
+        options,
+        from_date=max(options.from_date, shard_start - options.buffer),
+        to_date=min(options.to_date, shard_end + lookahead),
+        workers=1,
+        cancellation=None if _stop_signal is None else _StopSignalToken(_stop_signal),
+    )
+    return _search_conflicts(
+        cron_pairs, shard_options, report_from=shard_start, report_until=shard_end, window_start=options.from_date
+    )
+
+
+def _shard_bounds(
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    count: int,
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """Split the minute-aligned inclusive window into at most ``count`` contiguous, non-overlapping slices."""
+    minute = datetime.timedelta(minutes=1)
+    start = from_date.replace(second=0, microsecond=0)
+    stop = to_date.replace(second=0, microsecond=0)
+    total_minutes = (stop - start) // minute + 1
+    count = max(1, min(count, total_minutes))
+    shards = []
+    for index in range(count):
+        first = start + minute * (total_minutes * index // count)
+        last = start + minute * (total_minutes * (index + 1) // count - 1)
+        shards.append((first, last))
+    return shards
+
+
+def _satisfied_prefix(completed: dict[int, Future], target: int, cutoff: int) -> int:
+    """Index of the first shard by which the completed, in-order prefix holds ``target`` conflicts."""
+    found = 0
+    for index in range(cutoff + 1):
+        future = completed.get(index)
+        if future is None or future.exception() is not None:
+            return cutoff
+        found += future.result().conflict_count
+        if found >= target:
+            return index
+    return cutoff
+
+
+def _merge(
+    completed: dict[int, Future],
+    cutoff: int,
+    target: int,
+    shards: list[tuple[datetime.datetime, datetime.datetime]],
+    columns: ConflictColumns | None,
+) -> ConflictSearchResult:
+    conflicts = []
+    examined = 0
+    truncated = False
+    reached = None
+    for index in range(cutoff + 1):
+        future = completed.get(index)
+        if future is None:
+            truncated = True  # cancelled before this shard finished
+            break
+        result = future.result()
+        if columns is not None:
+            columns.extend(result.columns, target - len(columns))
+        conflicts.extend(result.conflicts)
+        examined += result.occurrences_examined
+        if result.truncated:
+            truncated = True
+            if result.reached is not None and (reached is None or result.reached > reached):
+                reached = result.reached
+            break
+        reached = shards[index][1]
+        if len(conflicts) >= target or (columns is not None and len(columns) >= target):
+            break
+    conflicts = conflicts[:target]
+    # Each shard pre-screens its own slice; an expression counts as pruned when no merged shard enumerated it.
+    merged = [
+        completed[index].result()
+        for index in range(cutoff + 1)
+        if index in completed and completed[index].exception() is None
+    ]
+    pruned = set.intersection(*(set(result.pruned_expressions) for result in merged)) if merged else set()
+    equivalent = merged[0].equivalent_expressions if merged else []
+    return ConflictSearchResult(
+        bool(conflicts) or bool(columns),
+        conflicts,
+        examined,
+        equivalent,
+        sorted(pruned),
+        truncated,
+        reached if truncated else None,
+        columns,
+    )
@@ -0,0 +1,102 @@
+import datetime
+
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_exact import _Fields
+
+MINUTES_PER_DAY = 24 * 60
+# Longer windows are screened month by month instead of day by day to keep the screen cheap.
+DAY_LEVEL_MAX_MONTHS = 24
+
+
+def prune_disjoint_expressions(
+    cron_pairs: list[tuple[AwsCroniter, str]],
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    buffer: datetime.timedelta,
+) -> list[int]:
+    """
+    Indexes of expressions that provably cannot conflict with any other expression in the window.
+
+    Two expressions can only conflict if, after widening one of them by ``buffer``, they share a day (or a
+    month, for windows longer than ``DAY_LEVEL_MAX_MONTHS``) inside the window and a minute of the day.
+    Days come from the parsed year, month and day rules; minutes of the day from the hour and minute sets,
+    widened around midnight. Both tests are necessary conditions only, so an expression is pruned when it
+    fails them against every other expression, and kept otherwise. Expressions that cannot run in any
+    month of the window are always pruned.
+    """
+    months = _window_months(from_date, to_date)
+    day_level = len(months) <= DAY_LEVEL_MAX_MONTHS
+    fields = [_Fields(cron) for cron, _ in cron_pairs]
+
+    if day_level:
+        slot_reach = -(-buffer // datetime.timedelta(days=1))
+    else:
+        # Months are at least 28 days long, so a gap of `buffer` crosses at most this many month boundaries.
+        slot_reach = 0 if buffer == datetime.timedelta(0) else buffer // datetime.timedelta(days=28) + 1
+    minute_reach = buffer // datetime.timedelta(minutes=1)
+
+    slots = [_slots(expression_fields, months, day_level) for expression_fields in fields]
+    times = [
+        frozenset(hour * 60 + minute for hour in expression_fields.hours for minute in expression_fields.minutes)
+        for expression_fields in fields
+    ]
+    # Reaching across the whole window overlaps every slot; skip the test instead of widening.
+    slot_span = (to_date.date() - from_date.date()).days + 62 if day_level else len(months)
+    widened_slots = [_widen(values, slot_reach) if slot_reach < slot_span else None for values in slots]
+    widened_times = [_widen_minutes(values, minute_reach) for values in times]
+
+    kept: set[int] = set()
+    for i in range(len(fields)):
+        if not slots[i]:
+            continue
+        for j in range(i + 1, len(fields)):
+            if i in kept and j in kept:
+                continue
+            if not slots[j] or (widened_slots[i] is not None and widened_slots[i].isdisjoint(slots[j])):
+                continue
+            if widened_times[i] is not None and widened_times[i].isdisjoint(times[j]):
+                continue
+            kept.update((i, j))
+
+    pruned = [index for index in range(len(fields)) if index not in kept]
+    collector = instrumentation.active()
+    if collector is not None and pruned:
+        collector.increment("conflicts.pruned", len(pruned))
+    return pruned
+
+
+def _window_months(from_date: datetime.datetime, to_date: datetime.datetime) -> list[tuple[int, int]]:
+    months = []
+    year, month = from_date.year, from_date.month
+    while (year, month) <= (to_date.year, to_date.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _slots(expression_fields: _Fields, months: list[tuple[int, int]], day_level: bool) -> set[int]:
+    """Day ordinals (or month numbers) of the window on which the expression can run."""
+    slots = set()
+    for year, month in months:
+        if year not in expression_fields.years or month not in expression_fields.months:
+            continue
+        if day_level:
+            first = datetime.date(year, month, 1).toordinal() - 1
+            slots.update(first + day for day in expression_fields.days(year, month))
+        else:
+            slots.add(year * 12 + month - 1)
+    return slots
+
+
+def _widen(values: set[int], reach: int) -> set[int]:
+    if reach == 0:
+        return values
+    return {value + offset for value in values for offset in range(-reach, reach + 1)}
+
+
+def _widen_minutes(values: frozenset[int], reach: int) -> frozenset[int] | None:
+    """Minutes of the day within ``reach`` of ``values`` (wrapping at midnight), or ``None`` for all of them."""
+    if len(values) * (2 * reach + 1) >= MINUTES_PER_DAY:
+        return None
+    return frozenset((value + offset) % MINUTES_PER_DAY for value in values for offset in range(-reach, reach + 1))
@@ -1,22 +1,34 @@
 import datetime
 import heapq
 from collections import deque
+from collections.abc import Iterator
 from collections.abc import Sequence
 from typing import Union
 
+from aws_croniter import instrumentation
+from aws_croniter import periodicity
 from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.cancellation import CancellationToken
+from aws_croniter.conflict_exact import find_first_exact_conflict
+from aws_croniter.conflict_models import INTERRUPT_CHECK_INTERVAL
 from aws_croniter.conflict_models import ConflictCollectionMode
+from aws_croniter.conflict_models import ConflictColumns
 from aws_croniter.conflict_models import ConflictSearchOptions
 from aws_croniter.conflict_models import ConflictSearchResult
 from aws_croniter.conflict_models import ScheduleConflict
 from aws_croniter.conflict_models import ScheduledRun
+from aws_croniter.conflict_models import _Interruption
+from aws_croniter.conflict_parallel import search_conflicts_parallel
+from aws_croniter.conflict_prescreen import prune_disjoint_expressions
 from aws_croniter.exceptions import AwsCroniterConflictSearchLimitError
 from aws_croniter.occurrence_stream import OccurrenceCounter
 from aws_croniter.occurrence_stream import OccurrenceStream
+from aws_croniter.utils import TimeUtils
 
 CronInput = Union[str, AwsCroniter]
 
 
+@instrumentation.timed("find_conflicts")
 def find_conflicts(
     expressions: Sequence[CronInput],
     *,
@@ -29,6 +41,12 @@ def find_conflicts(
     max_expressions: int = 50,
     max_occurrences_per_expression: int = 10_000,
     max_total_occurrences: int = 100_000,
+    workers: int = 1,
+    prefetch_size: int = 64,
+    timeout: datetime.timedelta | None = None,
+    deadline: datetime.datetime | None = None,
+    cancellation: CancellationToken | None = None,
+    columnar: bool = False,
 ) -> ConflictSearchResult:
     """
     Find schedule conflicts across two or more AWS cron expressions.
@@ -38,35 +56,133 @@ def find_conflicts(
 
     A conflict is when runs from different expressions fall within ``buffer`` of
     each other (``buffer=0`` requires the exact same timestamp).
+
+    With ``buffer=0`` in ``FIRST`` mode the earliest conflict is computed from the
+    parsed fields directly, without enumerating occurrences; the occurrence limits
+    do not apply and ``occurrences_examined`` is ``0``.
+
+    With ``workers`` greater than one the window is split into time shards that
+    are searched in a process pool; see ``search_conflicts_parallel``.
+
+    Expressions with identical compiled fields (``MON-FRI`` and ``2-6``, or ``* * ?``
+    and ``? * *`` day fields) share one occurrence stream and are searched as one
+    schedule. The groups are listed in ``equivalent_expressions``; each group is
+    reported once, as a conflict naming all its members at the group's first run,
+    and conflicts with other schedules name only its first (lowest-index) member.
+
+    Before enumerating, expressions whose days and minutes of the day (widened by
+    ``buffer``) overlap no other expression are dropped and listed in
+    ``pruned_expressions``; see ``prune_disjoint_expressions``.
+
+    ``timeout``, ``deadline`` and ``cancellation`` bound the search time; when one
+    fires, the conflicts found so far are returned with ``truncated=True`` and
+    ``reached`` set to the time up to which the search is complete.
+
+    With ``columnar`` each conflict is written into ``ConflictSearchResult.columns``
+    (parallel integer arrays) as soon as it is found, without building run or
+    conflict objects at all.
     """
-    if options is None:
-        if from_date is None or to_date is None:
-            raise ValueError("from_date and to_date are required when options is not provided")
-        options = ConflictSearchOptions.from_call(
-            from_date=from_date,
-            to_date=to_date,
-            buffer=buffer,
-            collection_mode=collection_mode,
-            max_conflicts=max_conflicts,
-            max_expressions=max_expressions,
-            max_occurrences_per_expression=max_occurrences_per_expression,
-            max_total_occurrences=max_total_occurrences,
-        )
+    options = _resolve_options(
+        options,
+        from_date=from_date,
+        to_date=to_date,
+        buffer=buffer,
+        collection_mode=collection_mode,
+        max_conflicts=max_conflicts,
+        max_expressions=max_expressions,
+        max_occurrences_per_expression=max_occurrences_per_expression,
+        max_total_occurrences=max_total_occurrences,
+        workers=workers,
+        prefetch_size=prefetch_size,
+        timeout=timeout,
+        deadline=deadline,
+        cancellation=cancellation,
+        columnar=columnar,
+    )
 
     cron_pairs = _prepare_expressions(expressions, options.max_expressions)
+    if options.buffer == datetime.timedelta(0) and options.stop_on_first:
+        groups = _group_equivalent(cron_pairs)
+        result = find_first_exact_conflict(
+            cron_pairs, options.from_date, options.to_date, _Interruption(options), groups
+        )
+        result.equivalent_expressions = _equivalent_expressions(groups)
+        if options.columnar:
+            result.columns = ConflictColumns.from_conflicts(_expression_table(cron_pairs), result.conflicts)
+            result.conflicts = []
+        return result
+    if options.workers > 1:
+        return search_conflicts_parallel(cron_pairs, options)
     return _search_conflicts(cron_pairs, options)
 
 
+def iter_conflicts(
+    expressions: Sequence[CronInput],
+    *,
+    from_date: datetime.datetime | None = None,
+    to_date: datetime.datetime | None = None,
+    options: ConflictSearchOptions | None = None,
+    buffer: datetime.timedelta | None = None,
+    collection_mode: ConflictCollectionMode = ConflictCollectionMode.FIRST,
+    max_conflicts: int = 1,
+    max_expressions: int = 50,
+    max_occurrences_per_expression: int = 10_000,
+    max_total_occurrences: int = 100_000,
+    prefetch_size: int = 64,
+    timeout: datetime.timedelta | None = None,
+    deadline: datetime.datetime | None = None,
+    cancellation: CancellationToken | None = None,
+) -> "ConflictIterator":
+    """
+    Yield schedule conflicts lazily as they are discovered, in time order.
+
+    Accepts the same arguments as ``find_conflicts`` but never builds a result list, so callers can stop
+    early, paginate, or write conflicts out incrementally. The returned ``ConflictIterator`` exposes
+    ``occurrences_examined`` and the ``expressions`` table runs index into. Occurrences are always
+    enumerated (the ``buffer=0`` shortcut and ``workers`` of ``find_conflicts`` do not apply).
+    """
+    options = _resolve_options(
+        options,
+        from_date=from_date,
+        to_date=to_date,
+        buffer=buffer,
+        collection_mode=collection_mode,
+        max_conflicts=max_conflicts,
+        max_expressions=max_expressions,
+        max_occurrences_per_expression=max_occurrences_per_expression,
+        max_total_occurrences=max_total_occurrences,
+        prefetch_size=prefetch_size,
+        timeout=timeout,
+        deadline=deadline,
+        cancellation=cancellation,
+    )
+    return ConflictIterator(_prepare_expressions(expressions, options.max_expressions), options)
+
+
+def _resolve_options(
+    options: ConflictSearchOptions | None,
+    *,
+    from_date: datetime.datetime | None,
+    to_date: datetime.datetime | None,
+    **keywords,
+) -> ConflictSearchOptions:
+    if options is not None:
+        return options
+    if from_date is None or to_date is None:
+        raise ValueError("from_date and to_date are required when options is not provided")
+    return ConflictSearchOptions.from_call(from_date=from_date, to_date=to_date, **keywords)
+
+
 def _prepare_expressions(
     expressions: Sequence[CronInput],
-    max_expressions: int,
+    max_expressions: int | None,
 ) -> list[tuple[AwsCroniter, str]]:
     expression_count = len(expressions)
     if expression_count == 0:
         raise ValueError("at least two cron expressions are required; none were provided")
     if expression_count == 1:
         raise ValueError("at least two cron expressions are required; only one was provided")
-    if expression_count > max_expressions:
+    if max_expressions is not None and expression_count > max_expressions:
         raise AwsCroniterConflictSearchLimitError(
             f"Expression count {expression_count} exceeds max_expressions ({max_expressions})."
         )
@@ -83,87 +199,386 @@ def _prepare_expressions(
 def _search_conflicts(
     cron_pairs: list[tuple[AwsCroniter, str]],
     options: ConflictSearchOptions,
+    report_from: datetime.datetime | None = None,
+    report_until: datetime.datetime | None = None,
+    window_start: datetime.datetime | None = None,
 ) -> ConflictSearchResult:
-    counter = OccurrenceCounter(options.max_total_occurrences)
-    streams = [
-        OccurrenceStream(
-            cron,
-            expression,
-            index,
-            options.from_date,
-            options.to_date,
-            options.max_occurrences_per_expression,
-            counter,
+    iterator = ConflictIterator(cron_pairs, options, report_from, report_until, window_start)
+    columns = None
+    if options.columnar:
+        columns = iterator.collect_columns()
+        conflicts = []
+    else:
+        conflicts = list(iterator)
+    return ConflictSearchResult(
+        iterator.conflicts_found > 0,
+        conflicts,
+        iterator.occurrences_examined,
+        iterator.equivalent_expressions,
+        iterator.pruned_expressions,
+        iterator.truncated,
+        iterator.reached,
+        columns,
+    )
+
+
+def _expression_table(cron_pairs: list[tuple[AwsCroniter, str]]) -> list[str]:
+    return [expression for _, expression in cron_pairs]
+
+
+class ConflictIterator:
+    """
+    Yields conflicts lazily, in the order the time-ordered merge of occurrence streams discovers them.
+
+    Stops after ``options.effective_max_conflicts()`` conflicts. ``occurrences_examined`` can be
+    read at any point and counts occurrences generated so far. Equivalent expressions share one
+    stream and one heap entry per run, and are listed in ``equivalent_expressions``; a group is
+    yielded once, at its first run since ``window_start`` (``options.from_date`` by default), as a
+    conflict naming all members. Expressions the field-level pre-screen proves cannot conflict get
+    no stream and are listed in ``pruned_expressions``. ``expressions`` holds the expression strings
+    by input index.
+
+    Inside the merge a run is its heap entry ``(run_at, expression_index, group)`` and a conflict is a
+    ``(runs, separation)`` pair, so no object is built per run; ``__next__`` turns each conflict into a
+    ``ScheduleConflict`` and ``collect_columns`` writes it straight into ``ConflictColumns`` arrays.
+
+    The timeout, deadline and cancellation token of ``options`` are checked every
+    ``INTERRUPT_CHECK_INTERVAL`` runs; when one fires, iteration ends with ``truncated`` set and
+    ``reached`` holding the time up to which every completed conflict has been yielded.
+    """
+
+    def __init__(
+        self,
+        cron_pairs: list[tuple[AwsCroniter, str]],
+        options: ConflictSearchOptions,
+        report_from: datetime.datetime | None = None,
+        report_until: datetime.datetime | None = None,
+        window_start: datetime.datetime | None = None,
+    ) -> None:
+        self.options = options
+        self.expressions = _expression_table(cron_pairs)
+        self._counter = OccurrenceCounter(options.max_total_occurrences)
+        self._report_from = report_from
+        self._report_until = report_until
+        self._conflicts_found = 0
+        self.truncated = False
+        self.reached: datetime.datetime | None = None
+        self._interruption = _Interruption(options)
+        self._heap: list["_Run"] = []
+        groups = _group_equivalent(cron_pairs)
+        self.equivalent_expressions = _equivalent_expressions(groups)
+        self.pruned_expressions = prune_disjoint_expressions(
+            cron_pairs, options.from_date, options.to_date, options.buffer
         )
-        for index, (cron, expression) in enumerate(cron_pairs)
-    ]
-
-    heap: list[tuple[datetime.datetime, int, OccurrenceStream]] = []
-    for stream in streams:
-        next_time = stream.peek()
-        if next_time is not None:
-            heapq.heappush(heap, (next_time, stream.expression_index, stream))
-
-    recent: deque[ScheduledRun] = deque()
-    conflicts: list[ScheduleConflict] = []
-    target = options.effective_max_conflicts()
-
-    while heap:
-        run_at, _, stream = heapq.heappop(heap)
-        run = ScheduledRun(stream.expression_index, stream.expression, run_at)
-
-        _prune_recent(recent, run_at, options.buffer)
-        conflict = _conflict_with_recent(run, recent, options.buffer)
-        if conflict is not None:
-            conflicts.append(conflict)
-            if len(conflicts) >= target:
-                return ConflictSearchResult(True, conflicts, counter.total)
-
-        recent.append(run)
-        stream.pop()
-        next_time = stream.peek()
-        if next_time is not None:
-            heapq.heappush(heap, (next_time, stream.expression_index, stream))
-
-    return ConflictSearchResult(bool(conflicts), conflicts, counter.total)
-
-
-def _prune_recent(recent: deque[ScheduledRun], current_time: datetime.datetime, buffer: datetime.timedelta) -> None:
-    threshold = current_time - buffer
-    while recent and recent[0].run_at < threshold:
-        recent.popleft()
-
-
-def _conflict_with_recent(
-    current: ScheduledRun,
-    recent: deque[ScheduledRun],
-    buffer: datetime.timedelta,
-) -> ScheduleConflict | None:
-    conflicting = [
-        prior
-        for prior in recent
-        if prior.expression_index != current.expression_index
-        and abs(current.run_at - prior.run_at) <= buffer
-    ]
-    if not conflicting:
-        return None
+        pruned = set(self.pruned_expressions)
+        for members in groups:
+            if members[0] in pruned:
+                continue  # equivalent expressions are pruned together
+            cron, expression = cron_pairs[members[0]]
+            stream = OccurrenceStream(
+                cron,
+                expression,
+                members[0],
+                options.from_date,
+                options.to_date,
+                options.max_occurrences_per_expression,
+                self._counter,
+                options.prefetch_size,
+            )
+            group = _StreamGroup(stream, members)
+            if len(members) > 1:
+                # Parallel shards start their streams after the whole window does; the first run may lie before.
+                if window_start is None or window_start >= options.from_date:
+                    group.first_at = stream.peek()
+                else:
+                    group.first_at = _first_run(cron, window_start)
+            self._push_group(group)
+        self._generator = self._generate()
+
+    @property
+    def occurrences_examined(self) -> int:
+        return self._counter.total
+
+    @property
+    def conflicts_found(self) -> int:
+        return self._conflicts_found
+
+    def __iter__(self) -> "ConflictIterator":
+        return self
+
+    def __next__(self) -> ScheduleConflict:
+        runs, separation = next(self._generator)
+        expressions = self.expressions
+        runs = tuple(ScheduledRun(index, expressions[index], run_at) for run_at, index, _ in runs)
+        return ScheduleConflict(runs, separation)
+
+    def collect_columns(self) -> ConflictColumns:
+        """Run the rest of the search, appending each conflict to the integer arrays of one ``ConflictColumns``."""
+        columns = ConflictColumns(self.expressions)
+        offsets = columns.offsets
+        expression_indexes = columns.expression_indexes
+        run_minutes = columns.run_minutes
+        separation_minutes = columns.separation_minutes
+        minute = datetime.timedelta(minutes=1)
+        for runs, separation in self._generator:
+            for run_at, index, _ in runs:
+                expression_indexes.append(index)
+                run_minutes.append(TimeUtils.datetime_to_epoch_minute(run_at))
+            offsets.append(len(run_minutes))
+            separation_minutes.append(separation // minute)
+        return columns
+
+    def close(self) -> None:
+        """Stop the search early and release the streams."""
+        self._generator.close()
+        self._heap.clear()
+
+    def _owned(self, conflict: "_Conflict") -> bool:
+        completed_at = conflict[0][-1][0]
+        if self._report_from is not None and completed_at < self._report_from:
+            return False
+        return self._report_until is None or completed_at <= self._report_until
+
+    def _generate(self) -> Iterator["_Conflict"]:
+        options = self.options
+        heap = self._heap
+        target = options.effective_max_conflicts()
+        recent = _RecentRuns()
+        clusters = _ClusterWindow(options.buffer) if options.collection_mode is ConflictCollectionMode.CLUSTER else None
+        last_at = last_index = other_at = None  # other_at: latest run of any expression other than last_index
+        steps = 0
+
+        while heap:
+            if steps % INTERRUPT_CHECK_INTERVAL == 0 and self._interrupted():
+                self.truncated = True
+                if last_at is not None:
+                    # Runs before the next unprocessed one (and, for clusters, before the open window) are final.
+                    unfinished = heap[0][0] if clusters is None or clusters.oldest is None else clusters.oldest
+                    self.reached = unfinished - datetime.timedelta(minutes=1)
+                return
+            steps += 1
+            run = heapq.heappop(heap)
+            run_at, index, group = run
+            if index != last_index:
+                other_at, last_index = last_at, index
+            last_at = run_at
 
-    runs = _dedupe_runs([current, *conflicting])
-    if len(runs) < 2:
+            if run_at == group.first_at:
+                conflict = _group_conflict(group, run_at)
+                if self._owned(conflict):
+                    yield self._found(conflict)
+                    if self._conflicts_found >= target:
+                        return
+            if clusters is not None:
+                conflict = clusters.push(run)
+            else:
+                recent.prune(run_at - options.buffer)
+                conflict = _conflict_with_recent(run, recent)
+                recent.add(run)
+            if conflict is not None and self._owned(conflict):
+                yield self._found(conflict)
+                if self._conflicts_found >= target:
+                    return
+
+            group.stream.pop()
+            self._leapfrog(group, other_at)
+            self._push_group(group)
+
+        if clusters is not None:
+            conflict = clusters.close()
+            if conflict is not None and self._owned(conflict):
+                yield self._found(conflict)
+
+    def _interrupted(self) -> bool:
+        return self._interruption.fired()
+
+    def _leapfrog(self, group: "_StreamGroup", other_at: datetime.datetime | None) -> None:
+        """
+        Skip runs of a group that cannot be within ``buffer`` of any other schedule's run.
+
+        A run later than ``other_at + buffer`` (the latest run of any other schedule) and earlier than
+        ``buffer`` before the next run of any other stream conflicts with nothing, so the stream seeks
+        straight to that point instead of yielding every run in between. Collisions between equivalent
+        members are not per-run conflicts, so groups of any size are skipped the same way.
+        """
+        next_time = group.stream.peek()
+        buffer = self.options.buffer
+        if next_time is None or (other_at is not None and next_time - other_at <= buffer):
+            return
+        target = self._heap[0][0] - buffer if self._heap else self.options.to_date + datetime.timedelta(minutes=1)
+        if next_time < target:
+            group.stream.seek(target)
+            collector = instrumentation.active()
+            if collector is not None:
+                collector.increment("conflicts.seeks")
+
+    def _push_group(self, group: "_StreamGroup") -> None:
+        next_time = group.stream.peek()
+        if next_time is None:
+            return
+        heapq.heappush(self._heap, (next_time, group.index, group))
+
+    def _found(self, conflict: "_Conflict") -> "_Conflict":
+        self._conflicts_found += 1
+        collector = instrumentation.active()
+        if collector is not None:
+            collector.increment("conflicts.found")
+        return conflict
+
+
+class _StreamGroup:
+    """
+    One occurrence stream shared by equivalent expressions.
+
+    The group has one heap entry per occurrence, under its first (lowest) member ``index``, so the merge
+    does the same work for a group as for a single expression. ``first_at`` is the run at which the group
+    is reported as a conflict of its own; it stays ``None`` for single expressions.
+    """
+
+    def __init__(self, stream: OccurrenceStream, members: list[int]) -> None:
+        self.stream = stream
+        self.members = members
+        self.index = members[0]
+        self.first_at: datetime.datetime | None = None
+
+
+def _first_run(cron: AwsCroniter, since: datetime.datetime) -> datetime.datetime | None:
+    """First run in the minute of ``since`` or later, matching where an ``OccurrenceStream`` starts."""
+    run = periodicity.first_run(cron, TimeUtils.datetime_to_epoch_minute(since))
+    return None if run is None else TimeUtils.epoch_minute_to_datetime(run)
+
+
+# A run in the merge: its heap entry. A conflict: its time-ordered runs and their separation.
+_Run = tuple[datetime.datetime, int, _StreamGroup]
+_Conflict = tuple[Sequence[_Run], datetime.timedelta]
+
+
+def _group_conflict(group: _StreamGroup, run_at: datetime.datetime) -> _Conflict:
+    """Equivalent expressions collide at every run; the group is reported once, at its first run."""
+    return [(run_at, index, group) for index in group.members], datetime.timedelta(0)
+
+
+def _group_equivalent(cron_pairs: list[tuple[AwsCroniter, str]]) -> list[list[int]]:
+    """Indexes of expressions with identical schedules, grouped in order of first appearance."""
+    groups: dict[tuple, list[int]] = {}
+    for index, (cron, _) in enumerate(cron_pairs):
+        groups.setdefault(cron.schedule_key, []).append(index)
+    return list(groups.values())
+
+
+def _equivalent_expressions(groups: list[list[int]]) -> list[tuple[int, ...]]:
+    return [tuple(members) for members in groups if len(members) > 1]
+
+
+class _RecentRuns:
+    """
+    Runs inside the trailing buffer window, indexed by the latest run of each expression.
+
+    A new run can only conflict with the latest run of another expression (earlier runs of
+    that expression are further away), so checks cost O(expressions in the window) no matter
+    how many runs the window holds. The deque only exists to expire index entries in order.
+    """
+
+    def __init__(self) -> None:
+        self._window: deque[_Run] = deque()
+        self.latest: dict[int, _Run] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct expressions with a run in the window."""
+        return len(self.latest)
+
+    def prune(self, threshold: datetime.datetime) -> None:
+        window = self._window
+        latest = self.latest
+        while window and window[0][0] < threshold:
+            expired = window.popleft()
+            if latest.get(expired[1]) is expired:
+                del latest[expired[1]]
+
+    def add(self, run: _Run) -> None:
+        self._window.append(run)
+        self.latest[run[1]] = run
+
+
+class _ClusterWindow:
+    """
+    Sliding window that emits maximal clusters of runs all within ``buffer`` of each other.
+
+    Runs arrive in time order. The window always holds the runs within ``buffer`` of its
+    oldest run; when an arriving run cannot join, the window is a maximal cluster (it can
+    be extended neither left nor right) and is emitted if it spans two or more expressions.
+    Each run enters and leaves the window once, so the sweep is linear in the runs seen.
+    """
+
+    def __init__(self, buffer: datetime.timedelta) -> None:
+        self._buffer = buffer
+        self._window: deque[_Run] = deque()
+        self._counts: dict[int, int] = {}
+
+    def push(self, run: _Run) -> _Conflict | None:
+        collector = instrumentation.active()
+        if collector is not None:
+            collector.increment("conflicts.runs_checked")
+        closed = None
+        window = self._window
+        threshold = run[0] - self._buffer
+        if window and window[0][0] < threshold:
+            closed = self._conflict()
+            counts = self._counts
+            while window and window[0][0] < threshold:
+                expired = window.popleft()[1]
+                counts[expired] -= 1
+                if counts[expired] == 0:
+                    del counts[expired]
+        window.append(run)
+        self._counts[run[1]] = self._counts.get(run[1], 0) + 1
+        return closed
+
+    @property
+    def oldest(self) -> datetime.datetime | None:
+        """Earliest run of the open window, or ``None`` when it is empty."""
+        return self._window[0][0] if self._window else None
+
+    def close(self) -> _Conflict | None:
+        """Emit the final window once no more runs will arrive."""
+        return self._conflict()
+
+    def _conflict(self) -> _Conflict | None:
+        if len(self._counts) < 2:
+            return None
+        runs = tuple(self._window)
+        return runs, _min_separation(runs)
+
+
+def _conflict_with_recent(current: _Run, recent: _RecentRuns) -> _Conflict | None:
+    collector = instrumentation.active()
+    if collector is not None:
+        collector.increment("conflicts.runs_checked")
+    current_index = current[1]
+    if len(recent) == 0 or (len(recent) == 1 and current_index in recent.latest):
         return None
 
-    separation = min(
-        abs(a.run_at - b.run_at) for i, a in enumerate(runs) for b in runs[i + 1 :]
-    )
-    return ScheduleConflict(tuple(runs), separation)
-
-
-def _dedupe_runs(runs: list[ScheduledRun]) -> list[ScheduledRun]:
-    seen: set[tuple[int, datetime.datetime]] = set()
-    unique: list[ScheduledRun] = []
-    for run in sorted(runs, key=lambda item: (item.run_at, item.expression_index)):
-        key = (run.expression_index, run.run_at)
-        if key not in seen:
-            seen.add(key)
-            unique.append(run)
-    return unique
+    runs = [prior for index, prior in recent.latest.items() if index != current_index]
+    runs.append(current)
+    runs.sort(key=_time_and_index)
+    return runs, _min_separation(runs)
+
+
+def _time_and_index(run: _Run) -> tuple[datetime.datetime, int]:
+    return run[0], run[1]
+
+
+def _min_separation(runs: Sequence[_Run]) -> datetime.timedelta:
+    """Smallest gap between runs of different expressions in a time-ordered sequence, in one pass."""
+    separation = None
+    last_at = last_index = other_at = None  # other_at: latest run of any expression other than last_index
+    for run_at, index, _ in runs:
+        if last_index is not None:
+            prior_at = last_at if index != last_index else other_at
+            if prior_at is not None and (separation is None or run_at - prior_at < separation):
+                separation = run_at - prior_at
+        if index != last_index:
+            other_at = last_at
+            last_index = index
+        last_at = run_at
+    return separation
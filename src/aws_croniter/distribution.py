@@ -0,0 +1,68 @@
+from collections import Counter
+
+from aws_croniter.occurrence_walk import MINUTES_PER_DAY
+from aws_croniter.occurrence_walk import _date_of
+from aws_croniter.occurrence_walk import _day_starts
+from aws_croniter.occurrence_walk import _times_of_day
+
+# Values are the cron field values: weekday counts Sun=1 .. Sat=7 like the day-of-week field.
+TIME_DIMENSIONS = {
+    "minute": lambda time: time % 60,
+    "hour": lambda time: time // 60,
+}
+DAY_DIMENSIONS = {
+    "day": lambda date: date.day,
+    # Python weekday is Mon=0; AWS numbers Sun=1 .. Sat=7.
+    "weekday": lambda date: (date.weekday() + 1) % 7 + 1,
+    "month": lambda date: date.month,
+    "year": lambda date: date.year,
+}
+DIMENSIONS = tuple(TIME_DIMENSIONS) + tuple(DAY_DIMENSIONS)
+
+
+def validate_dimensions(by) -> tuple[str, ...]:
+    """``by`` as a tuple of dimension names; raises ``ValueError`` for empty, unknown or repeated names."""
+    by = (by,) if isinstance(by, str) else tuple(by)
+    if not by:
+        raise ValueError("by must name at least one dimension")
+    unknown = [name for name in by if name not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown distribution dimension(s) {unknown}; expected some of {list(DIMENSIONS)}")
+    if len(set(by)) != len(by):
+        raise ValueError("by must not repeat a dimension")
+    return by
+
+
+def run_distribution(cron, start: int, stop: int, by: tuple[str, ...]) -> dict[tuple, int]:
+    """
+    Number of runs of ``cron`` in ``[start, stop]`` (minutes since the epoch) per combination of ``by`` values.
+
+    The times of day are the same on every matching day, so they are binned once. Whole matching days are
+    only counted per calendar key (day, weekday, month, year) and multiplied by the time-of-day bins; runs
+    are binned one by one only on the partial first and last day of the window. The cost follows the number
+    of matching days and bins, not the number of runs.
+    """
+    times = _times_of_day(cron)
+    time_names = [name for name in by if name in TIME_DIMENSIONS]
+    day_names = [name for name in by if name in DAY_DIMENSIONS]
+    order = [(time_names + day_names).index(name) for name in by]
+
+    def time_key(time: int) -> tuple:
+        return tuple(TIME_DIMENSIONS[name](time) for name in time_names)
+
+    time_bins = Counter(time_key(time) for time in times)
+    whole_days: Counter = Counter()
+    counts: Counter = Counter()
+    for day_start in _day_starts(cron, start, stop):
+        date = _date_of(day_start)
+        day_key = tuple(DAY_DIMENSIONS[name](date) for name in day_names)
+        if start <= day_start and day_start + MINUTES_PER_DAY - 1 <= stop:
+            whole_days[day_key] += 1
+            continue
+        for time in times:
+            if start <= day_start + time <= stop:
+                counts[time_key(time) + day_key] += 1
+    for day_key, days in whole_days.items():
+        for key, runs in time_bins.items():
+            counts[key + day_key] += days * runs
+    return dict(sorted((tuple(key[position] for position in order), runs) for key, runs in counts.items()))
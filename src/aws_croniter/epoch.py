@@ -0,0 +1,54 @@
+import itertools
+from enum import Enum
+
+from aws_croniter.occurrence_walk import MINUTES_PER_DAY
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.periodicity import FIRST_MINUTE
+from aws_croniter.periodicity import LAST_MINUTE
+
+
+class EpochUnit(Enum):
+    """
+    Unit of the integer timestamps taken and returned by the ``*_epoch`` methods of ``AwsCroniter``.
+
+    ``SECONDS`` are Unix timestamps; ``MINUTES`` are whole minutes since the epoch, the unit the run
+    searches work in, so no conversion happens at all.
+    """
+
+    SECONDS = "seconds"
+    MINUTES = "minutes"
+
+    @property
+    def per_minute(self) -> int:
+        return 60 if self is EpochUnit.SECONDS else 1
+
+
+def to_epoch_minute(value: int, unit: EpochUnit, name: str) -> int:
+    """``value`` in ``unit`` as whole minutes since the epoch, dropping seconds like the datetime methods do."""
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"Invalid {name}. Must be of type int")
+    return value // EpochUnit(unit).per_minute
+
+
+def next_epoch_minutes(cron, minute: int, n: int, inclusive: bool) -> list[int]:
+    """Up to ``n`` runs after ``minute`` (or at it, with ``inclusive``), ascending."""
+    start = minute if inclusive else minute + 1
+    return list(itertools.islice(walk_epoch_minutes(cron, start, LAST_MINUTE), n))
+
+
+def prev_epoch_minutes(cron, minute: int, n: int, inclusive: bool) -> list[int]:
+    """
+    Up to ``n`` runs before ``minute`` (or at it, with ``inclusive``), descending.
+
+    The cursor walk only runs forward, so spans ending at the search point are walked backward in doubling
+    sizes until ``n`` runs are found; dense schedules stop after the first day.
+    """
+    high = min(minute if inclusive else minute - 1, LAST_MINUTE)
+    span = MINUTES_PER_DAY
+    runs: list[int] = []
+    while len(runs) < n and high >= FIRST_MINUTE:
+        low = max(FIRST_MINUTE, high - span + 1)
+        runs.extend(reversed(list(walk_epoch_minutes(cron, low, high))))
+        high = low - 1
+        span *= 2
+    return runs[:n]
@@ -0,0 +1,191 @@
+import csv
+import datetime
+import json
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from enum import Enum
+from typing import IO
+from typing import Union
+
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_models import ScheduleConflict
+from aws_croniter.conflict_models import _validate_utc
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.utils import TimeUtils
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+RUN_FIELDS = ("expression_index", "expression", "run_at")
+CONFLICT_FIELDS = ("conflict", "expression_index", "expression", "run_at", "separation_minutes")
+
+
+class ExportFormat(Enum):
+    """
+    Output format of the export writers.
+
+    ``CSV`` writes a header line and ``NDJSON`` one object per line, both with ISO 8601 datetimes.
+    ``ARROW`` writes an Arrow IPC stream with one record batch per chunk and needs the optional
+    ``pyarrow`` package.
+    """
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    ARROW = "arrow"
+
+
+@instrumentation.timed("export_runs")
+def export_runs(
+    expressions: Sequence[Union[str, AwsCroniter]],
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    sink: IO,
+    *,
+    format: ExportFormat = ExportFormat.CSV,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write every run of each expression in ``[from_date, to_date]`` to ``sink`` and return the rows written.
+
+    Rows are ``(expression_index, expression, run_at)``, grouped by expression and ascending in time. Runs are
+    enumerated one expression at a time by a cursor walk and written ``chunk_size`` rows at a time, so memory
+    does not grow with the number of runs. ``sink`` is a text file for CSV and NDJSON and a binary file for
+    Arrow; see ``ExportFormat``.
+    """
+    _validate_utc(from_date, "from_date")
+    _validate_utc(to_date, "to_date")
+    if from_date > to_date:
+        raise ValueError("from_date must be less than or equal to to_date")
+    crons = [item if isinstance(item, AwsCroniter) else AwsCroniter(item) for item in expressions]
+    rows = _run_rows(crons, from_date, to_date)
+    return _write_rows(rows, RUN_FIELDS, sink, format=format, chunk_size=chunk_size)
+
+
+@instrumentation.timed("export_conflicts")
+def export_conflicts(
+    conflicts: Iterable[ScheduleConflict],
+    sink: IO,
+    *,
+    format: ExportFormat = ExportFormat.CSV,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write one row per run of each conflict to ``sink`` and return the rows written.
+
+    Rows are ``(conflict, expression_index, expression, run_at, separation_minutes)`` where ``conflict``
+    numbers the conflicts from zero. ``conflicts`` is consumed lazily, so passing ``iter_conflicts(...)``
+    streams a search straight to the sink; a result's ``conflicts`` list or ``columns`` work as well.
+    """
+    return _write_rows(_conflict_rows(conflicts), CONFLICT_FIELDS, sink, format=format, chunk_size=chunk_size)
+
+
+def _write_rows(
+    rows: Iterable[tuple],
+    fields: Sequence[str],
+    sink: IO,
+    *,
+    format: ExportFormat = ExportFormat.CSV,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    writer = _WRITERS[format](sink, fields)
+    written = 0
+    chunk: list[tuple] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            writer.write(chunk)
+            written += len(chunk)
+            chunk = []
+    if chunk:
+        writer.write(chunk)
+        written += len(chunk)
+    writer.close()
+    return written
+
+
+def _run_rows(
+    crons: list[AwsCroniter],
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+) -> Iterator[tuple]:
+    start = TimeUtils.datetime_to_epoch_minute(from_date)
+    stop = TimeUtils.datetime_to_epoch_minute(to_date)
+    for index, cron in enumerate(crons):
+        expression = cron.cron
+        for minute in walk_epoch_minutes(cron, start, stop):
+            yield index, expression, TimeUtils.epoch_minute_to_datetime(minute)
+
+
+def _conflict_rows(conflicts: Iterable[ScheduleConflict]) -> Iterator[tuple]:
+    for position, conflict in enumerate(conflicts):
+        separation = conflict.separation // datetime.timedelta(minutes=1)
+        for run in conflict.runs:
+            yield position, run.expression_index, run.expression, run.run_at, separation
+
+
+def _text(value):
+    return value.isoformat() if isinstance(value, datetime.datetime) else value
+
+
+class _CsvWriter:
+    def __init__(self, sink: IO[str], fields: Sequence[str]) -> None:
+        self._writer = csv.writer(sink)
+        self._writer.writerow(fields)
+
+    def write(self, chunk: list[tuple]) -> None:
+        self._writer.writerows([_text(value) for value in row] for row in chunk)
+
+    def close(self) -> None:
+        pass
+
+
+class _NdjsonWriter:
+    def __init__(self, sink: IO[str], fields: Sequence[str]) -> None:
+        self._sink = sink
+        self._fields = fields
+
+    def write(self, chunk: list[tuple]) -> None:
+        fields = self._fields
+        self._sink.write(
+            "".join(json.dumps(dict(zip(fields, map(_text, row)))) + "\n" for row in chunk),
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class _ArrowWriter:
+    """Arrow IPC stream writer with one record batch per chunk."""
+
+    def __init__(self, sink: IO[bytes], fields: Sequence[str]) -> None:
+        try:
+            import pyarrow
+        except ImportError as error:
+            raise ImportError("Arrow export requires the optional 'pyarrow' package") from error
+        types = {
+            "conflict": pyarrow.int64(),
+            "expression_index": pyarrow.int64(),
+            "expression": pyarrow.string(),
+            "run_at": pyarrow.timestamp("s", tz="UTC"),
+            "separation_minutes": pyarrow.int64(),
+        }
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(name, types[name]) for name in fields])
+        self._writer = pyarrow.ipc.new_stream(sink, self._schema)
+
+    def write(self, chunk: list[tuple]) -> None:
+        arrays = [self._pyarrow.array(column, type=field.type) for column, field in zip(zip(*chunk), self._schema)]
+        self._writer.write_batch(self._pyarrow.RecordBatch.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {
+    ExportFormat.CSV: _CsvWriter,
+    ExportFormat.NDJSON: _NdjsonWriter,
+    ExportFormat.ARROW: _ArrowWriter,
+}
@@ -0,0 +1,218 @@
+import datetime
+import threading
+from collections.abc import Iterable
+
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_models import _validate_utc
+from aws_croniter.conflicts import CronInput
+from aws_croniter.utils import DateUtils
+
+FIRST_YEAR = 1970
+LAST_YEAR = 2199
+# Months whose "L", "W" and "#" days are kept resolved; a dispatcher only ever looks at one or two.
+SPECIAL_DAY_CACHE_SIZE = 24
+DECODE_BLOCK_BYTES = 64
+
+
+class FiringIndex:
+    """
+    Inverted index answering "which rules are due at minute T" for a large registry of rules.
+
+    Every rule gets a bit position. For each value of each field the index keeps a bitset (a Python int)
+    of the rules allowing that value: minute, hour, month, year, numeric day of month and numeric day of
+    week. ``due`` ANDs the bitsets of T's field values and decodes only the set bits, so a lookup costs a
+    few word-parallel bitwise operations plus time proportional to the number of due rules, instead of a
+    check per rule. Rules with "L", "W" or "#" day rules depend on the month's calendar; their days are
+    resolved once per month and cached.
+
+    Added rules are folded into the bitsets in one batch on the next lookup, so building an index of
+    many rules costs one pass over them rather than one pass over every bitset per rule.
+    Bit positions are stable: ``add`` returns the rule's index, and ``remove`` clears it without
+    renumbering the other rules.
+
+    ``due`` and ``due_expressions`` may be called from many threads at once: the batch of added rules and
+    the per-month day cache are filled under a lock on a miss only. ``add`` and ``remove`` must not run
+    concurrently with any other call.
+    """
+
+    def __init__(self, expressions: Iterable[CronInput] = ()) -> None:
+        self._expressions: list[str | None] = []
+        self._active = 0
+        self._minutes = _FieldBits(0, 59)
+        self._hours = _FieldBits(0, 23)
+        self._months = _FieldBits(1, 12)
+        self._years = _FieldBits(FIRST_YEAR, LAST_YEAR)
+        self._days_of_month = _FieldBits(1, 31)
+        self._days_of_week = _FieldBits(1, 7)
+        self._special: dict[int, tuple[list, list]] = {}
+        self._special_days: dict[tuple[int, int], list[int]] = {}
+        self._pending: list[int] = []
+        self._lock = threading.Lock()
+        for expression in expressions:
+            self.add(expression)
+
+    def __len__(self) -> int:
+        self._flush()
+        return self._active.bit_count()
+
+    def expression(self, index: int) -> str:
+        """Cron string of the rule at ``index``; raises ``KeyError`` for removed or unknown indexes."""
+        if not 0 <= index < len(self._expressions) or self._expressions[index] is None:
+            raise KeyError(index)
+        return self._expressions[index]
+
+    def add(self, expression: CronInput) -> int:
+        """Index ``expression`` and return its rule index."""
+        cron = expression if isinstance(expression, AwsCroniter) else AwsCroniter(expression)
+        index = len(self._expressions)
+        self._expressions.append(cron.cron)
+        self._pending.append(index)
+        self._minutes.add(index, cron.minutes)
+        self._hours.add(index, cron.hours)
+        self._months.add(index, cron.months)
+        self._years.add(index, cron.years)
+        days_of_month, days_of_week = cron.days_of_month, cron.days_of_week
+        if days_of_month and not isinstance(days_of_month[0], str):
+            self._days_of_month.add(index, days_of_month)
+        elif not days_of_month and not isinstance(days_of_week[0], str):
+            self._days_of_week.add(index, days_of_week)
+        else:
+            self._special[index] = (days_of_month, days_of_week)
+            self._special_days.clear()
+        return index
+
+    def remove(self, index: int) -> None:
+        """Stop reporting the rule at ``index``; raises ``KeyError`` for removed or unknown indexes."""
+        self.expression(index)
+        self._flush()
+        self._expressions[index] = None
+        self._active &= ~(1 << index)
+        if self._special.pop(index, None) is not None:
+            self._special_days.clear()
+
+    def due(self, moment: datetime.datetime) -> list[int]:
+        """Ascending indexes of the rules that fire at ``moment``'s minute (seconds are ignored)."""
+        _validate_utc(moment, "moment")
+        if not FIRST_YEAR <= moment.year <= LAST_YEAR:
+            return []
+        self._flush()
+        bits = (
+            self._active
+            & self._minutes.rules(moment.minute)
+            & self._hours.rules(moment.hour)
+            & self._months.rules(moment.month)
+            & self._years.rules(moment.year)
+        )
+        if not bits:
+            return []
+        # Python weekday is Mon=0; AWS numbers Sun=1 .. Sat=7.
+        day_of_week = (moment.weekday() + 1) % 7 + 1
+        days = self._days_of_month.rules(moment.day) | self._days_of_week.rules(day_of_week)
+        if self._special:
+            days |= self._special_month(moment.year, moment.month)[moment.day]
+        return _bit_indexes(bits & days)
+
+    def due_expressions(self, moment: datetime.datetime) -> list[str]:
+        """Cron strings of the rules that fire at ``moment``, in index order."""
+        return [self._expressions[index] for index in self.due(moment)]
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        with self._lock:
+            if not self._pending:
+                return
+            fields = (self._minutes, self._hours, self._months, self._years, self._days_of_month, self._days_of_week)
+            for field in fields:
+                field.flush()
+            self._active |= _bitset(index for index in self._pending if self._expressions[index] is not None)
+            # Cleared last: readers skip the lock only once every bitset is complete.
+            self._pending = []
+
+    def _special_month(self, year: int, month: int) -> list[int]:
+        """Per-day bitsets of the "L", "W" and "#" rules for one month."""
+        key = (year, month)
+        days = self._special_days.get(key)
+        if days is not None:
+            return days
+        with self._lock:
+            days = self._special_days.get(key)
+            if days is None:
+                indexes: list[list[int]] = [[] for _ in range(32)]
+                for index, (days_of_month, days_of_week) in self._special.items():
+                    for day in DateUtils.resolve_days_of_month(year, month, days_of_month, days_of_week):
+                        indexes[day].append(index)
+                days = [_bitset(day_indexes) for day_indexes in indexes]
+                if len(self._special_days) >= SPECIAL_DAY_CACHE_SIZE:
+                    self._special_days.clear()
+                self._special_days[key] = days
+        return days
+
+
+class _FieldBits:
+    """
+    Bitsets of the rules allowing each value of one field.
+
+    Rules allowing every value are kept in one shared bitset instead of one bit per value, so wildcard
+    fields ("*" years, months and days) cost nothing per value.
+    """
+
+    def __init__(self, first: int, last: int) -> None:
+        self.first = first
+        self.values = [0] * (last - first + 1)
+        self.every = 0
+        self._pending: list[list[int]] = [[] for _ in self.values]
+        self._pending_every: list[int] = []
+
+    def add(self, index: int, values: list[int]) -> None:
+        values = set(values)
+        if len(values) == len(self.values):
+            self._pending_every.append(index)
+            return
+        for value in values:
+            self._pending[value - self.first].append(index)
+
+    def flush(self) -> None:
+        for position, indexes in enumerate(self._pending):
+            if indexes:
+                self.values[position] |= _bitset(indexes)
+                self._pending[position] = []
+        if self._pending_every:
+            self.every |= _bitset(self._pending_every)
+            self._pending_every = []
+
+    def rules(self, value: int) -> int:
+        return self.values[value - self.first] | self.every
+
+
+def _bitset(indexes: Iterable[int]) -> int:
+    """Bitset with the given bit positions set, built in one bytearray pass."""
+    data = bytearray()
+    for index in indexes:
+        byte = index >> 3
+        if byte >= len(data):
+            data.extend(bytes(byte - len(data) + 1))
+        data[byte] |= 1 << (index & 7)
+    return int.from_bytes(data, "little")
+
+
+def _bit_indexes(bits: int) -> list[int]:
+    """
+    Positions of the set bits, ascending.
+
+    The bitset is cut into ``DECODE_BLOCK_BYTES`` blocks; all-zero blocks are skipped at C speed and set bits
+    are peeled off small per-block integers, so decoding costs little more than the number of due rules.
+    """
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    indexes = []
+    for start in range(0, len(data), DECODE_BLOCK_BYTES):
+        block = data[start : start + DECODE_BLOCK_BYTES]
+        if not block.strip(b"\x00"):
+            continue
+        value = int.from_bytes(block, "little")
+        base = start * 8
+        while value:
+            lowest = value & -value
+            indexes.append(base + lowest.bit_length() - 1)
+            value ^= lowest
+    return indexes
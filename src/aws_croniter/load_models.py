@@ -0,0 +1,60 @@
+import datetime
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Union
+
+from aws_croniter.aws_croniter import AwsCroniter
+
+
+@dataclass(frozen=True)
+class LoadRule:
+    """A schedule whose runs each occupy ``duration`` and add ``weight`` to the load while running."""
+
+    expression: Union[str, AwsCroniter]
+    duration: datetime.timedelta
+    weight: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.duration <= datetime.timedelta(0):
+            raise ValueError("duration must be greater than zero")
+        if self.weight < 0:
+            raise ValueError("weight must be greater than or equal to zero")
+
+
+@dataclass(frozen=True)
+class LoadBucket:
+    """Peak number of running jobs and peak weighted load inside ``[start, start + bucket)``."""
+
+    start: datetime.datetime
+    max_concurrency: int
+    max_load: float
+
+
+@dataclass(frozen=True)
+class PeakInterval:
+    """A stretch of time ``[start, end)`` during which the same jobs were running."""
+
+    start: datetime.datetime
+    end: datetime.datetime
+    concurrency: int
+    load: float
+    rule_indexes: tuple[int, ...]
+
+
+@dataclass
+class LoadProfile:
+    """
+    Concurrency and weighted load of a fleet of rules over ``[from_date, to_date)``.
+
+    ``buckets`` covers the window in consecutive ``bucket``-sized steps; ``peaks`` holds the
+    highest-load intervals, highest first.
+    """
+
+    from_date: datetime.datetime
+    to_date: datetime.datetime
+    bucket: datetime.timedelta
+    buckets: list[LoadBucket] = field(default_factory=list)
+    peaks: list[PeakInterval] = field(default_factory=list)
+    max_concurrency: int = 0
+    max_load: float = 0.0
+    occurrences_examined: int = 0
@@ -0,0 +1,165 @@
+import datetime
+import heapq
+from collections.abc import Sequence
+
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_models import _validate_utc
+from aws_croniter.load_models import LoadBucket
+from aws_croniter.load_models import LoadProfile
+from aws_croniter.load_models import LoadRule
+from aws_croniter.load_models import PeakInterval
+from aws_croniter.occurrence_stream import OccurrenceCounter
+from aws_croniter.occurrence_stream import OccurrenceStream
+
+
+@instrumentation.timed("load_profile")
+def load_profile(
+    rules: Sequence[LoadRule],
+    from_date: datetime.datetime,
+    to_date: datetime.datetime,
+    bucket: datetime.timedelta = datetime.timedelta(minutes=1),
+    *,
+    top_n: int = 10,
+    max_occurrences_per_rule: int = 10_000,
+    max_total_occurrences: int = 10_000_000,
+) -> LoadProfile:
+    """
+    Measure how many jobs run at once, and their combined weight, across ``[from_date, to_date)``.
+
+    Every run of a rule is a job occupying ``[run_at, run_at + duration)``. Occurrence streams of all rules
+    are merged into one sweep of start and end events (ends first at equal times, so back-to-back jobs do not
+    overlap). Between two events the set of running jobs is constant; each such stretch raises the peaks of
+    the buckets it covers and competes for the ``top_n`` peak intervals. Runs starting up to the longest
+    duration before ``from_date`` are included, since they may still be running when the window opens.
+
+    Sweep memory is proportional to the jobs running at once; the result holds one entry per bucket.
+    """
+    _validate_utc(from_date, "from_date")
+    _validate_utc(to_date, "to_date")
+    if from_date >= to_date:
+        raise ValueError("from_date must be less than to_date")
+    if bucket <= datetime.timedelta(0):
+        raise ValueError("bucket must be greater than zero")
+    if top_n < 0:
+        raise ValueError("top_n must be greater than or equal to zero")
+    if not rules:
+        raise ValueError("at least one rule is required")
+
+    counter = OccurrenceCounter(max_total_occurrences)
+    search_from = from_date - max(rule.duration for rule in rules)
+    # Streams include their end minute; jobs starting at `to_date` fall outside the half-open window.
+    search_to = to_date - datetime.timedelta(seconds=1)
+    starts: list[tuple[datetime.datetime, int, OccurrenceStream]] = []
+    for index, rule in enumerate(rules):
+        cron = rule.expression if isinstance(rule.expression, AwsCroniter) else AwsCroniter(rule.expression)
+        stream = OccurrenceStream(cron, cron.cron, index, search_from, search_to, max_occurrences_per_rule, counter)
+        if stream.peek() is not None:
+            starts.append((stream.peek(), index, stream))
+    heapq.heapify(starts)
+
+    sweep = _LoadSweep(from_date, to_date, bucket, top_n)
+    ends: list[tuple[datetime.datetime, int]] = []
+    active: dict[int, int] = {}
+    concurrency, load = 0, 0.0
+    since = search_from
+    while starts or ends:
+        moment = min(heap[0][0] for heap in (starts, ends) if heap)
+        if moment >= to_date:
+            break
+        if concurrency:
+            sweep.record(since, moment, concurrency, load, active)
+
+        while ends and ends[0][0] == moment:
+            _, index = heapq.heappop(ends)
+            active[index] -= 1
+            if active[index] == 0:
+                del active[index]
+            concurrency -= 1
+            load -= rules[index].weight
+        while starts and starts[0][0] == moment:
+            _, index, stream = starts[0]
+            stream.pop()
+            if stream.peek() is None:
+                heapq.heappop(starts)
+            else:
+                heapq.heapreplace(starts, (stream.peek(), index, stream))
+            heapq.heappush(ends, (moment + rules[index].duration, index))
+            active[index] = active.get(index, 0) + 1
+            concurrency += 1
+            load += rules[index].weight
+        if concurrency == 0:
+            load = 0.0  # drop floating-point residue once nothing is running
+        since = moment
+
+    if concurrency:
+        sweep.record(since, to_date, concurrency, load, active)
+    return sweep.profile(counter.total)
+
+
+class _LoadSweep:
+    """Accumulates bucket peaks and the top-N intervals from constant-load stretches of the sweep."""
+
+    def __init__(
+        self,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        bucket: datetime.timedelta,
+        top_n: int,
+    ) -> None:
+        self.from_date = from_date
+        self.to_date = to_date
+        self.bucket = bucket
+        self.top_n = top_n
+        bucket_count = -((from_date - to_date) // bucket)
+        self.concurrency = [0] * bucket_count
+        self.load = [0.0] * bucket_count
+        # Min-heap of (load, concurrency, -start offset, interval) holding the best `top_n` intervals.
+        self._top: list[tuple[float, int, float, PeakInterval]] = []
+
+    def record(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        concurrency: int,
+        load: float,
+        active: dict[int, int],
+    ) -> None:
+        start = max(start, self.from_date)
+        if start >= end:
+            return
+        first = (start - self.from_date) // self.bucket
+        last = -((self.from_date - end) // self.bucket) - 1
+        for position in range(first, last + 1):
+            if concurrency > self.concurrency[position]:
+                self.concurrency[position] = concurrency
+            if load > self.load[position]:
+                self.load[position] = load
+
+        if self.top_n == 0:
+            return
+        key = (load, concurrency, -(start - self.from_date).total_seconds())
+        if len(self._top) == self.top_n and key <= self._top[0][:3]:
+            return
+        interval = PeakInterval(start, end, concurrency, load, tuple(sorted(active)))
+        if len(self._top) < self.top_n:
+            heapq.heappush(self._top, (*key, interval))
+        else:
+            heapq.heapreplace(self._top, (*key, interval))
+
+    def profile(self, occurrences_examined: int) -> LoadProfile:
+        buckets = [
+            LoadBucket(self.from_date + self.bucket * position, concurrency, load)
+            for position, (concurrency, load) in enumerate(zip(self.concurrency, self.load))
+        ]
+        peaks = [entry[3] for entry in sorted(self._top, key=lambda entry: entry[:3], reverse=True)]
+        return LoadProfile(
+            self.from_date,
+            self.to_date,
+            self.bucket,
+            buckets,
+            peaks,
+            max(self.concurrency),
+            max(self.load),
+            occurrences_examined,
+        )
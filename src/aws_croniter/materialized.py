@@ -0,0 +1,141 @@
+import bisect
+import datetime
+import json
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Iterator
+
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.utils import TimeUtils
+
+# File layout: MAGIC, an 8-byte little-endian header length, the JSON header, padding to a multiple of 8
+# bytes, then one signed 64-bit integer per run in the byte order named by the header.
+MAGIC = b"AWSCRMT1"
+ALIGNMENT = 8
+
+
+class MaterializedSchedule:
+    """
+    Every run of an expression in ``[from_date, to_date]``, stored as ascending epoch minutes.
+
+    Lookups bisect the table instead of searching the expression's fields. Only runs inside the
+    materialized window are known: ``next`` past the last run and ``prev`` before the first return ``None``
+    even when the expression keeps running outside the window.
+
+    Tables built by ``AwsCroniter.materialize`` live in an ``array('q')``. ``load`` maps a saved file
+    read-only instead, so processes loading the same file share one copy of the pages; call ``close``
+    (or use the table as a context manager) to release the mapping.
+    """
+
+    def __init__(
+        self,
+        expression: str,
+        from_date: datetime.datetime,
+        to_date: datetime.datetime,
+        minutes,
+        _mapping: mmap.mmap | None = None,
+    ) -> None:
+        self.expression = expression
+        self.from_date = from_date
+        self.to_date = to_date
+        self.minutes = minutes
+        self._mapping = _mapping
+
+    @classmethod
+    def build(cls, cron, from_date: datetime.datetime, to_date: datetime.datetime) -> "MaterializedSchedule":
+        """Materialize the runs of a parsed ``AwsCroniter`` with one cursor walk."""
+        start = TimeUtils.datetime_to_epoch_minute(from_date)
+        stop = TimeUtils.datetime_to_epoch_minute(to_date)
+        return cls(cron.cron, from_date, to_date, array("q", walk_epoch_minutes(cron, start, stop)))
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def __iter__(self) -> Iterator[datetime.datetime]:
+        for minute in self.minutes:
+            yield TimeUtils.epoch_minute_to_datetime(minute)
+
+    def __enter__(self) -> "MaterializedSchedule":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def next(self, from_date: datetime.datetime, inclusive: bool = False) -> datetime.datetime | None:
+        """First run after ``from_date`` (or at it, with ``inclusive``), like ``AwsCroniter.get_next``."""
+        start = TimeUtils.datetime_to_epoch_minute(from_date) + (0 if inclusive else 1)
+        position = bisect.bisect_left(self.minutes, start)
+        if position == len(self.minutes):
+            return None
+        return TimeUtils.epoch_minute_to_datetime(self.minutes[position])
+
+    def prev(self, from_date: datetime.datetime, inclusive: bool = False) -> datetime.datetime | None:
+        """Last run before ``from_date`` (or at it, with ``inclusive``), like ``AwsCroniter.get_prev``."""
+        stop = TimeUtils.datetime_to_epoch_minute(from_date) - (0 if inclusive else 1)
+        position = bisect.bisect_right(self.minutes, stop)
+        if position == 0:
+            return None
+        return TimeUtils.epoch_minute_to_datetime(self.minutes[position - 1])
+
+    def slice(self, from_date: datetime.datetime, to_date: datetime.datetime) -> list[datetime.datetime]:
+        """Runs in ``[from_date, to_date]``, like ``AwsCroniter.get_all_schedule_bw_dates``."""
+        first, last = self.slice_bounds(from_date, to_date)
+        return [TimeUtils.epoch_minute_to_datetime(self.minutes[index]) for index in range(first, last)]
+
+    def slice_bounds(self, from_date: datetime.datetime, to_date: datetime.datetime) -> tuple[int, int]:
+        """Index range of ``minutes`` holding the runs in ``[from_date, to_date]``, without building datetimes."""
+        first = bisect.bisect_left(self.minutes, TimeUtils.datetime_to_epoch_minute(from_date))
+        last = bisect.bisect_right(self.minutes, TimeUtils.datetime_to_epoch_minute(to_date))
+        return first, max(first, last)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the table to ``path`` in a layout ``load`` can map without parsing the runs."""
+        header = json.dumps(
+            {
+                "expression": self.expression,
+                "from_date": self.from_date.isoformat(),
+                "to_date": self.to_date.isoformat(),
+                "count": len(self.minutes),
+                "byteorder": sys.byteorder,
+            }
+        ).encode("utf-8")
+        padding = -(len(MAGIC) + 8 + len(header)) % ALIGNMENT
+        with open(path, "wb") as file:
+            file.write(MAGIC)
+            file.write(len(header).to_bytes(8, "little"))
+            file.write(header + b" " * padding)
+            file.write(self.minutes if isinstance(self.minutes, array) else array("q", self.minutes))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "MaterializedSchedule":
+        """Map a file written by ``save`` read-only; the runs are not copied into the process."""
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{os.fspath(path)!r} is not a materialized schedule file")
+            header_length = int.from_bytes(file.read(8), "little")
+            header = json.loads(file.read(header_length))
+            offset = len(MAGIC) + 8 + header_length
+            offset += -offset % ALIGNMENT
+            from_date = datetime.datetime.fromisoformat(header["from_date"])
+            to_date = datetime.datetime.fromisoformat(header["to_date"])
+            if header["count"] == 0:
+                return cls(header["expression"], from_date, to_date, array("q"))
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        minutes = memoryview(mapping)[offset : offset + header["count"] * 8].cast("q")
+        if header["byteorder"] != sys.byteorder:
+            # Foreign byte order: fall back to a private, byte-swapped copy.
+            swapped = array("q", minutes)
+            swapped.byteswap()
+            minutes.release()
+            mapping.close()
+            return cls(header["expression"], from_date, to_date, swapped)
+        return cls(header["expression"], from_date, to_date, minutes, mapping)
+
+    def close(self) -> None:
+        """Release the file mapping of a loaded table; the table is unusable afterwards."""
+        if self._mapping is not None:
+            self.minutes.release()
+            self._mapping.close()
+            self._mapping = None
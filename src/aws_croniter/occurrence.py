@@ -3,6 +3,7 @@ import math
 
 from dateutil.relativedelta import relativedelta
 
+from aws_croniter import instrumentation
 from aws_croniter.utils import DateUtils
 from aws_croniter.utils import SequenceUtils
 from aws_croniter.utils import TimeUtils
@@ -162,7 +163,9 @@ class Occurrence:
             # Do not add extra minute, include current time
             from_epoch = math.floor(TimeUtils.datetime_to_millisec(self.utc_datetime) / 60000.0) * 60000
         dt = datetime.datetime.fromtimestamp(from_epoch / 1000.0, tz=datetime.timezone.utc)
-        return self.__find_once(self.cron, dt)
+        found = self.__find_once(self.cron, dt)
+        self.__record_search_steps()
+        return found
 
     def prev(self, inclusive=False):
         """
@@ -177,4 +180,11 @@ class Occurrence:
             # Do not subtract extra minute, include current time
             from_epoch = math.floor(TimeUtils.datetime_to_millisec(self.utc_datetime) / 60000.0) * 60000
         dt = datetime.datetime.fromtimestamp(from_epoch / 1000.0, tz=datetime.timezone.utc)
-        return self.__find_prev_once(self.cron, dt)
+        found = self.__find_prev_once(self.cron, dt)
+        self.__record_search_steps()
+        return found
+
+    def __record_search_steps(self):
+        collector = instrumentation.active()
+        if collector is not None:
+            collector.observe("occurrence.search_steps", self.iter)
@@ -1,8 +1,15 @@
 import datetime
+import itertools
+from collections import deque
 from collections.abc import Iterator
 
+from aws_croniter import instrumentation
 from aws_croniter.aws_croniter import AwsCroniter
 from aws_croniter.exceptions import AwsCroniterConflictSearchLimitError
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.utils import TimeUtils
+
+DEFAULT_PREFETCH_SIZE = 64
 
 
 class OccurrenceCounter:
@@ -19,7 +26,14 @@ class OccurrenceCounter:
 
 
 class OccurrenceStream:
-    """Lazily yields ascending UTC occurrence times within a bounded window."""
+    """
+    Lazily yields ascending UTC occurrence times within a bounded window.
+
+    Occurrences are produced by one cursor walk over the expression's months (see ``walk_epoch_minutes``) and
+    buffered ``prefetch_size`` at a time. Limits and counters still apply per occurrence handed out, and a
+    refill never reads more than one occurrence past ``max_occurrences``, so results, ``occurrences_examined``
+    and limit errors do not depend on the batch size.
+    """
 
     def __init__(
         self,
@@ -30,16 +44,18 @@ class OccurrenceStream:
         to_date: datetime.datetime,
         max_occurrences: int,
         counter: OccurrenceCounter,
+        prefetch_size: int = DEFAULT_PREFETCH_SIZE,
     ) -> None:
         self._cron = cron
         self.expression = expression
         self.expression_index = expression_index
-        self._to_date = to_date.replace(second=0, microsecond=0)
+        self._stop = TimeUtils.datetime_to_epoch_minute(to_date)
         self._max_occurrences = max_occurrences
         self._counter = counter
+        self._prefetch_size = prefetch_size
         self._count = 0
-        self._exhausted = False
-        self._cursor = from_date.replace(second=0, microsecond=0) - datetime.timedelta(seconds=1)
+        self._buffer: deque[int] = deque()
+        self._walk = walk_epoch_minutes(cron, TimeUtils.datetime_to_epoch_minute(from_date), self._stop)
         self._next: datetime.datetime | None = None
         self._advance()
 
@@ -53,25 +69,45 @@ class OccurrenceStream:
         self._advance()
         return current
 
+    def seek(self, target: datetime.datetime) -> datetime.datetime | None:
+        """
+        Skip ahead to the first occurrence at or after ``target`` without generating the ones in between.
+
+        Only the landing occurrence counts toward the occurrence limits. Returns the new ``peek()``.
+        """
+        if self._next is None or self._next >= target:
+            return self._next
+        start = -((TimeUtils.EPOCH - target) // datetime.timedelta(minutes=1))  # first whole minute >= target
+        buffer = self._buffer
+        while buffer and buffer[0] < start:
+            buffer.popleft()
+        if not buffer:
+            self._walk = walk_epoch_minutes(self._cron, start, self._stop)
+        self._advance()
+        return self._next
+
     def _advance(self) -> None:
         self._next = None
-        if self._exhausted:
-            return
-        while True:
-            if self._count >= self._max_occurrences:
-                raise AwsCroniterConflictSearchLimitError(
-                    f"Exceeded max_occurrences_per_expression ({self._max_occurrences}) "
-                    f"for expression index {self.expression_index}."
-                )
-            candidate = self._cron.occurrence(self._cursor).next()
-            if candidate is None or candidate > self._to_date:
-                self._exhausted = True
+        if not self._buffer:
+            self._refill()
+            if not self._buffer:
                 return
-            self._cursor = candidate
-            self._count += 1
-            self._counter.record()
-            self._next = candidate
-            return
+        if self._count >= self._max_occurrences:
+            raise AwsCroniterConflictSearchLimitError(
+                f"Exceeded max_occurrences_per_expression ({self._max_occurrences}) "
+                f"for expression index {self.expression_index}."
+            )
+        self._count += 1
+        self._counter.record()
+        collector = instrumentation.active()
+        if collector is not None:
+            collector.increment("conflicts.streams_advanced")
+        self._next = TimeUtils.epoch_minute_to_datetime(self._buffer.popleft())
+
+    def _refill(self) -> None:
+        # Reading one past the per-expression limit is enough to raise at the same point as an unbuffered walk.
+        size = min(self._prefetch_size, self._max_occurrences - self._count + 1)
+        self._buffer.extend(itertools.islice(self._walk, size))
 
     def __iter__(self) -> Iterator[datetime.datetime]:
         while self._next is not None:
@@ -0,0 +1,71 @@
+import bisect
+import datetime
+from collections.abc import Iterator
+
+from aws_croniter.utils import DateUtils
+
+MINUTES_PER_DAY = 24 * 60
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def walk_epoch_minutes(cron, start: int, stop: int) -> Iterator[int]:
+    """
+    Yield every run of ``cron`` in ``[start, stop]`` as ascending minutes since the epoch.
+
+    One cursor walks the matching months in order, resolving day rules once per month and pairing each day
+    with the sorted minutes of the day, so consecutive runs cost a loop step instead of a fresh search.
+    ``cron`` is a parsed ``AwsCroniter``.
+    """
+    if start > stop:
+        return
+    times = _times_of_day(cron)
+    for day_start in _day_starts(cron, start, stop):
+        for index in range(bisect.bisect_left(times, start - day_start), len(times)):
+            run = day_start + times[index]
+            if run > stop:
+                return
+            yield run
+
+
+def count_epoch_minutes(cron, start: int, stop: int) -> int:
+    """Number of runs ``walk_epoch_minutes`` would yield, counted a day at a time instead of run by run."""
+    if start > stop:
+        return 0
+    times = _times_of_day(cron)
+    total = 0
+    for day_start in _day_starts(cron, start, stop):
+        total += bisect.bisect_right(times, stop - day_start) - bisect.bisect_left(times, start - day_start)
+    return total
+
+
+def _times_of_day(cron) -> list[int]:
+    return sorted({hour * 60 + minute for hour in cron.hours for minute in cron.minutes})
+
+
+def _day_starts(cron, start: int, stop: int) -> Iterator[int]:
+    """Start minute of every matching day that overlaps ``[start, stop]``, ascending."""
+    first = _date_of(start)
+    last = _date_of(stop)
+    months = sorted(set(cron.months))
+    for year in sorted(set(cron.years)):
+        if year < first.year:
+            continue
+        if year > last.year:
+            return
+        for month in months:
+            if (year, month) < (first.year, first.month):
+                continue
+            if (year, month) > (last.year, last.month):
+                return
+            month_start = (datetime.date(year, month, 1).toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY
+            for day in DateUtils.resolve_days_of_month(year, month, cron.days_of_month, cron.days_of_week):
+                day_start = month_start + (day - 1) * MINUTES_PER_DAY
+                if day_start + MINUTES_PER_DAY <= start:
+                    continue
+                if day_start > stop:
+                    return
+                yield day_start
+
+
+def _date_of(epoch_minute: int) -> datetime.date:
+    return datetime.date.fromordinal(EPOCH_ORDINAL + epoch_minute // MINUTES_PER_DAY)
@@ -0,0 +1,127 @@
+import datetime
+from collections.abc import Iterator
+
+from aws_croniter.occurrence_walk import EPOCH_ORDINAL
+from aws_croniter.occurrence_walk import MINUTES_PER_DAY
+from aws_croniter.occurrence_walk import count_epoch_minutes
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+# 28 Gregorian years hold exactly 7 leap days, so weekdays and leap years line up again after 10_227 days,
+# unless the cycle crosses a skipped leap day (2100 is the only one between 1970 and 2199).
+CALENDAR_CYCLE_MINUTES = 10_227 * MINUTES_PER_DAY
+SKIPPED_LEAP_DAY = (datetime.date(2100, 3, 1).toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY
+FIRST_MINUTE = 0
+LAST_MINUTE = (datetime.date(2200, 1, 1).toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY - 1
+
+
+def schedule_period(cron) -> int:
+    """
+    Fundamental period of ``cron`` in minutes, ignoring the year field.
+
+    Rules that run every day repeat with the period of their minutes of the day (at most one day); rules
+    that pick days of the week in every month repeat weekly; everything else (month, day-of-month, ``L``,
+    ``W`` and ``#`` rules) repeats with the 28-year calendar cycle. ``cron`` is a parsed ``AwsCroniter``.
+    """
+    every_month = set(cron.months) == set(range(1, 13))
+    days_of_month, days_of_week = cron.days_of_month, cron.days_of_week
+    numeric_days_of_week = not days_of_month and not isinstance(days_of_week[0], str)
+    every_day = (numeric_days_of_week and set(days_of_week) == set(range(1, 8))) or (
+        days_of_month and not isinstance(days_of_month[0], str) and set(days_of_month) == set(range(1, 32))
+    )
+    if every_month and every_day:
+        times = {hour * 60 + minute for hour in cron.hours for minute in cron.minutes}
+        for period in (divisor for divisor in range(1, MINUTES_PER_DAY + 1) if MINUTES_PER_DAY % divisor == 0):
+            if all((time + period) % MINUTES_PER_DAY in times for time in times):
+                return period
+    if every_month and numeric_days_of_week:
+        return MINUTES_PER_WEEK
+    return CALENDAR_CYCLE_MINUTES
+
+
+def periodic_segments(cron, period: int, start: int, stop: int) -> list[tuple[int, int]]:
+    """
+    Split ``[start, stop]`` into the stretches on which runs of ``cron`` repeat every ``period`` minutes.
+
+    Segments are runs of consecutive years allowed by the year field, further split at the skipped leap
+    day of 2100 for the calendar cycle; times outside the segments have no runs.
+    """
+    segments = []
+    for first_year, last_year in _year_runs(sorted(set(cron.years))):
+        low = (datetime.date(first_year, 1, 1).toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY
+        high = (datetime.date(last_year + 1, 1, 1).toordinal() - EPOCH_ORDINAL) * MINUTES_PER_DAY - 1
+        if period == CALENDAR_CYCLE_MINUTES and low < SKIPPED_LEAP_DAY <= high:
+            bounds = [(low, SKIPPED_LEAP_DAY - 1), (SKIPPED_LEAP_DAY, high)]
+        else:
+            bounds = [(low, high)]
+        segments.extend((max(low, start), min(high, stop)) for low, high in bounds if low <= stop and high >= start)
+    return segments
+
+
+def count_runs(cron, start: int, stop: int) -> int:
+    """
+    Number of runs of ``cron`` in ``[start, stop]`` (minutes since the epoch).
+
+    Within each periodic segment, one period is counted and multiplied by the number of whole periods;
+    only the remainder is counted separately, so the cost does not grow with the length of the window.
+    """
+    period = schedule_period(cron)
+    total = 0
+    for low, high in periodic_segments(cron, period, start, stop):
+        cycles = (high - low + 1) // period
+        if cycles < 2:
+            total += count_epoch_minutes(cron, low, high)
+            continue
+        total += cycles * count_epoch_minutes(cron, low, low + period - 1)
+        total += count_epoch_minutes(cron, low + cycles * period, high)
+    return total
+
+
+def first_run(cron, start: int) -> int | None:
+    """
+    First run at or after ``start``, or ``None``.
+
+    A segment without a run in its first period has no run at all, so at most one period per segment
+    is walked, however far away the next run is.
+    """
+    period = schedule_period(cron)
+    for low, high in periodic_segments(cron, period, start, LAST_MINUTE):
+        run = next(walk_epoch_minutes(cron, low, min(high, low + period - 1)), None)
+        if run is not None:
+            return run
+    return None
+
+
+def last_run(cron, stop: int) -> int | None:
+    """Last run at or before ``stop``, or ``None``; the mirror image of ``first_run``."""
+    period = schedule_period(cron)
+    for low, high in reversed(periodic_segments(cron, period, FIRST_MINUTE, stop)):
+        run = _last_in(cron, max(low, high - period + 1), high)
+        if run is not None:
+            return run
+    return None
+
+
+def _last_in(cron, low: int, high: int) -> int | None:
+    """Last run in ``[low, high]``, walking backward in doubling spans so dense schedules stop early."""
+    span = MINUTES_PER_DAY
+    while high >= low:
+        run = None
+        for run in walk_epoch_minutes(cron, max(low, high - span + 1), high):
+            pass
+        if run is not None:
+            return run
+        high -= span
+        span *= 2
+    return None
+
+
+def _year_runs(years: list[int]) -> Iterator[tuple[int, int]]:
+    """Maximal ranges of consecutive years, as ``(first, last)`` pairs."""
+    first = previous = years[0]
+    for year in years[1:]:
+        if year != previous + 1:
+            yield first, previous
+            first = year
+        previous = year
+    yield first, previous
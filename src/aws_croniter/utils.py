@@ -2,13 +2,19 @@ import bisect
 import calendar
 import datetime
 import re
+import threading
 from typing import Callable
 
 from dateutil.relativedelta import relativedelta
 
+from aws_croniter import instrumentation
+
 
 class RegexUtils:
+    # Shared by every thread: lookups read the dict without locking, misses compile under the lock so each
+    # pattern is compiled and published once.
     _compiled_patterns: dict[str, re.Pattern[str]] = {}
+    _compiled_patterns_lock = threading.Lock()
 
     MINUTE_VALUES = r"(0?[0-9]|[1-5][0-9])"  # [0]0-59
     HOUR_VALUES = r"(0?[0-9]|1[0-9]|2[0-3])"  # [0]0-23
@@ -77,9 +83,17 @@ class RegexUtils:
     @classmethod
     def _compiled_pattern(cls, name: str, pattern_builder: Callable[[], str]) -> re.Pattern[str]:
         pattern = cls._compiled_patterns.get(name)
+        collector = instrumentation.active()
+        missed = False
         if pattern is None:
-            pattern = re.compile(pattern_builder())
-            cls._compiled_patterns[name] = pattern
+            with cls._compiled_patterns_lock:
+                pattern = cls._compiled_patterns.get(name)
+                if pattern is None:
+                    pattern = re.compile(pattern_builder())
+                    cls._compiled_patterns[name] = pattern
+                    missed = True
+        if collector is not None:
+            collector.increment("regex.cache_misses" if missed else "regex.cache_hits")
         return pattern
 
     @classmethod
@@ -88,6 +102,12 @@ class RegexUtils:
 
 
 class DateUtils:
+    @staticmethod
+    def _record_day_resolution():
+        collector = instrumentation.active()
+        if collector is not None:
+            collector.increment("dates.day_resolutions")
+
     @staticmethod
     def python_to_aws_day_of_week(python_day_of_week):
         """Convert Python day of week (Mon=0) to AWS day of week (Mon=2)."""
@@ -97,6 +117,7 @@ class DateUtils:
     @staticmethod
     def get_days_of_month_from_days_of_week(year, month, days_of_week):
         """Get all days of the month that match the given days of the week."""
+        DateUtils._record_day_resolution()
         no_of_days_in_month = calendar.monthrange(year, month)[1]
 
         if days_of_week[0] == "L":
@@ -134,6 +155,7 @@ class DateUtils:
     @staticmethod
     def get_days_of_month_for_L(year, month, days_before):
         """Get the last day of the month adjusted by a specific number of days."""
+        DateUtils._record_day_resolution()
         for i in range(31, 28 - 1, -1):
             this_date = datetime.datetime(year, month, 1, tzinfo=datetime.timezone.utc) + relativedelta(days=i - 1)
             if this_date.month == month:
@@ -145,6 +167,7 @@ class DateUtils:
         Get the closest weekday for the specified day of the month.
         Adjusts for weekends and ensures the date is within the month.
         """
+        DateUtils._record_day_resolution()
         offset = SequenceUtils.array_find_first([0, 1, -1, 2, -2], lambda c: DateUtils.is_weekday(year, month, day + c))
         if offset is None:
             return []
@@ -161,6 +184,52 @@ class DateUtils:
             return False
         return this_date.weekday() >= 0 and this_date.weekday() <= 4  # Mon=0, Fri=4
 
+    @staticmethod
+    def resolve_days_of_month(year, month, days_of_month, days_of_week):
+        """
+        Get the sorted days of a month selected by parsed day-of-month and day-of-week rules.
+
+        Produces the same days an occurrence search accepts, without building a datetime per day.
+        Days that do not exist in the month are dropped.
+        """
+        DateUtils._record_day_resolution()
+        first_weekday, no_of_days_in_month = calendar.monthrange(year, month)
+
+        if len(days_of_month) == 0:
+            # Python weekday of day 1 is `first_weekday` (Mon=0); AWS numbers Sun=1 .. Sat=7.
+            def aws_day_of_week(day):
+                return (first_weekday + day) % 7 + 1
+
+            if days_of_week[0] == "L":
+                target_dow = days_of_week[1]
+                for i in range(no_of_days_in_month, no_of_days_in_month - 7, -1):
+                    if aws_day_of_week(i) == target_dow:
+                        return [i]
+                return []
+            if days_of_week[0] == "#":
+                target_dow, target_week = days_of_week[1], days_of_week[2]
+                first_match = (target_dow - aws_day_of_week(1)) % 7 + 1
+                day = first_match + 7 * (target_week - 1)
+                return [day] if day <= no_of_days_in_month else []
+            allowed_days = frozenset(days_of_week)
+            return [i for i in range(1, no_of_days_in_month + 1) if aws_day_of_week(i) in allowed_days]
+
+        if days_of_month[0] == "L":
+            day = no_of_days_in_month - int(days_of_month[1])
+            return [day] if day >= 1 else []
+
+        if days_of_month[0] == "W":
+            day = int(days_of_month[1])
+            if day > no_of_days_in_month:
+                return []
+            for offset in (0, 1, -1, 2, -2):
+                candidate = day + offset
+                if 1 <= candidate <= no_of_days_in_month and (first_weekday + candidate - 1) % 7 <= 4:
+                    return [candidate]
+            return []
+
+        return [day for day in days_of_month if day <= no_of_days_in_month]
+
     @staticmethod
     def is_day_in_month(year, month, test_day):
         """Check if a specific day exists in a given month."""
@@ -172,11 +241,23 @@ class DateUtils:
 
 
 class TimeUtils:
+    EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
     @staticmethod
     def datetime_to_millisec(dt_obj):
         """Convert a datetime object to milliseconds since epoch."""
         return round(dt_obj.timestamp() * 1000)
 
+    @staticmethod
+    def datetime_to_epoch_minute(dt_obj):
+        """Convert a UTC datetime object to whole minutes since epoch, dropping seconds."""
+        return (dt_obj - TimeUtils.EPOCH) // datetime.timedelta(minutes=1)
+
+    @staticmethod
+    def epoch_minute_to_datetime(epoch_minute):
+        """Convert minutes since epoch to a UTC datetime object."""
+        return TimeUtils.EPOCH + datetime.timedelta(minutes=epoch_minute)
+
 
 class SequenceUtils:
     @staticmethod
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 
 import pytest
 
@@ -738,4 +739,117 @@ def test_get_final_execution_time_errors(from_date, to_date, expected_error):
     """Test that get_final_execution_time raises ValueError for invalid from_date or to_date."""
     itr = AwsCroniter("0/5 8-17 ? * MON-FRI *")
     with pytest.raises(ValueError, match=expected_error):
-        itr.get_final_execution_time(from_date, to_date)
\ No newline at end of file
+        itr.get_final_execution_time(from_date, to_date)
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("0 12 * * ? *", "0 12 ? * * *"),
+        ("0 12 ? * MON-FRI *", "0 12 ? * 2-6 *"),
+        ("0 12 ? * 2,3,4,5,6 *", "0 12 ? * MON-FRI *"),
+        ("0/15 * * * ? *", "0,15,30,45 * * * ? *"),
+        ("0,30 9-10 1-31 * ? 1970-2199", "30,0 9,10 * * ? *"),
+        ("0 12 L * ? *", "00 12 L * ? *"),
+        ("0 12 ? * 6L *", "0 12 ? * L-6 *"),
+        ("0 0 1 JAN-MAR ? 2024", "0 0 1 1,2,3 ? 2024"),
+    ],
+)
+def test_equivalent_expressions_are_equal(first, second):
+    first, second = AwsCroniter(first), AwsCroniter(second)
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first.canonical == second.canonical
+    assert first.fingerprint == second.fingerprint
+    assert len({first, second}) == 1
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("0 12 * * ? *", "0 12 ? * MON-FRI *"),
+        ("0 12 L * ? *", "0 12 15W * ? *"),
+        ("0 12 ? * 2L *", "0 12 ? * 2#4 *"),
+        ("0 12 L-2 * ? *", "0 12 L * ? *"),
+    ],
+)
+def test_distinct_expressions_are_not_equal(first, second):
+    first, second = AwsCroniter(first), AwsCroniter(second)
+    assert first != second
+    assert first.fingerprint != second.fingerprint
+
+
+@pytest.mark.parametrize(
+    "cron_str, canonical",
+    [
+        ("0/15 9-17 ? * MON-FRI *", "0,15,30,45 9-17 ? * 2-6 *"),
+        ("0 12 ? * * *", "0 12 * * ? *"),
+        ("5,6,7,9 0,1 1-5,10 JAN,FEB ? 2024-2025", "5-7,9 0,1 1-5,10 1,2 ? 2024,2025"),
+        ("0 20/2 L-3 * ? *", "0 20,22 L-3 * ? *"),
+        ("0 12 15W * ? *", "0 12 15W * ? *"),
+        ("0 12 ? * MON#2 *", "0 12 ? * 2#2 *"),
+        ("0 12 ? * FRIL *", "0 12 ? * 6L *"),
+    ],
+)
+def test_canonical_form_round_trips(cron_str, canonical):
+    cron = AwsCroniter(cron_str)
+    assert cron.canonical == canonical
+    assert AwsCroniter(cron.canonical) == cron
+    assert AwsCroniter(cron.canonical).canonical == canonical
+
+
+def test_fingerprint_is_stable_sha256_of_canonical_form():
+    cron = AwsCroniter("0 12 ? * MON-FRI *")
+    assert cron.fingerprint == hashlib.sha256(b"0 12 ? * 2-6 *").hexdigest()
+    assert cron.fingerprint == "ead2ffa8f147e08cb1582dd8615b791d188ada7871264bbce278e9c183228119"
+    assert AwsCroniter("0 12 ? * 2-6 *").fingerprint == cron.fingerprint
+    assert cron != "0 12 ? * MON-FRI *"
+
+
+@pytest.mark.parametrize(
+    "cron_str, last_run, now",
+    [
+        ("* * * * ? *", (2024, 3, 1, 10, 0, 30), (2024, 3, 1, 12, 7, 59)),
+        ("0/15 9-17 ? * MON-FRI *", (2024, 3, 1, 9, 15), (2024, 3, 11, 9, 15)),
+        ("0 12 L * ? *", (2024, 1, 31, 11, 0), (2024, 6, 30, 12, 0)),
+        ("0 12 ? * 2#5 2024-2025", (2024, 1, 1), (2025, 12, 31)),
+    ],
+)
+def test_missed_between_matches_enumeration(cron_str, last_run, now):
+    cron = AwsCroniter(cron_str)
+    last_run = datetime.datetime(*last_run, tzinfo=datetime.timezone.utc)
+    now = datetime.datetime(*now, tzinfo=datetime.timezone.utc)
+    expected = [run for run in cron.get_all_schedule_bw_dates(last_run, now) if run > last_run]
+    missed = cron.missed_between(last_run, now)
+    assert missed.count == len(expected)
+    assert (missed.first, missed.last) == (expected[0], expected[-1])
+
+
+def test_missed_between_excludes_last_run_and_includes_now():
+    cron = AwsCroniter("0 * * * ? *")
+    last_run = datetime.datetime(2024, 3, 1, 10, 0, tzinfo=datetime.timezone.utc)
+    missed = cron.missed_between(last_run, last_run + datetime.timedelta(hours=2))
+    assert (missed.count, missed.first, missed.last) == (2, last_run.replace(hour=11), last_run.replace(hour=12))
+    assert cron.missed_between(last_run, last_run).count == 0
+    nothing = cron.missed_between(last_run, last_run + datetime.timedelta(minutes=59))
+    assert (nothing.count, nothing.first, nothing.last) == (0, None, None)
+
+
+def test_missed_between_counts_long_outages_of_minutely_rules():
+    cron = AwsCroniter("* * * * ? *")
+    last_run = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    missed = cron.missed_between(last_run, last_run + datetime.timedelta(days=366))
+    assert missed.count == 366 * 24 * 60
+    assert missed.first == last_run + datetime.timedelta(minutes=1)
+    assert missed.last == last_run + datetime.timedelta(days=366)
+
+
+def test_missed_between_rejects_invalid_dates():
+    cron = AwsCroniter("0 * * * ? *")
+    now = datetime.datetime(2024, 3, 1, tzinfo=datetime.timezone.utc)
+    with pytest.raises(ValueError, match="last_run must be less than or equal to now"):
+        cron.missed_between(now, now - datetime.timedelta(minutes=1))
+    with pytest.raises(ValueError):
+        cron.missed_between(now.replace(tzinfo=None), now)
+    with pytest.raises(ValueError):
+        cron.missed_between("2024-03-01", now)
@@ -0,0 +1,59 @@
+import datetime
+
+import pytest
+
+from aws_croniter import AwsCroniter
+from aws_croniter import MissedRuns
+from aws_croniter import missed_runs
+
+UTC = datetime.timezone.utc
+NOW = datetime.datetime(2024, 3, 2, 9, 30, tzinfo=UTC)
+OUTAGE = datetime.datetime(2024, 3, 1, 9, 30, tzinfo=UTC)
+
+
+def test_missed_runs_matches_missed_between_in_input_order():
+    rules = [
+        ("0/5 * * * ? *", OUTAGE),
+        (AwsCroniter("0 9 ? * MON-FRI *"), OUTAGE - datetime.timedelta(days=3)),
+        ("0 0 1 1 ? 2030", OUTAGE),
+        ("0/5 * * * ? *", OUTAGE + datetime.timedelta(hours=23)),
+    ]
+    results = missed_runs(rules, NOW)
+    expected = [
+        (cron if isinstance(cron, AwsCroniter) else AwsCroniter(cron)).missed_between(last_run, NOW)
+        for cron, last_run in rules
+    ]
+    assert results == expected
+    assert results[0].count == 288
+    assert results[1] == MissedRuns(
+        3,
+        datetime.datetime(2024, 2, 28, 9, 0, tzinfo=UTC),
+        datetime.datetime(2024, 3, 1, 9, 0, tzinfo=UTC),
+    )
+    assert results[2] == MissedRuns(0, None, None)
+    assert results[3].count == 12
+
+
+def test_missed_runs_shares_answers_between_equal_schedules(monkeypatch):
+    calls = []
+    original = AwsCroniter.missed_between
+
+    def counting(self, last_run, now):
+        calls.append(self.cron)
+        return original(self, last_run, now)
+
+    monkeypatch.setattr(AwsCroniter, "missed_between", counting)
+    rules = [("0/15 * * * ? *", OUTAGE + datetime.timedelta(seconds=second)) for second in range(50)]
+    rules.append(("0,15,30,45 * * * ? *", OUTAGE))
+    results = missed_runs(rules, NOW)
+    assert len(results) == 51
+    assert len(set(results)) == 1
+    assert calls == ["0/15 * * * ? *"]
+
+
+def test_missed_runs_validates_dates():
+    with pytest.raises(ValueError, match="now"):
+        missed_runs([("0 * * * ? *", OUTAGE)], NOW.replace(tzinfo=None))
+    with pytest.raises(ValueError, match="last_run"):
+        missed_runs([("0 * * * ? *", OUTAGE.replace(tzinfo=None))], NOW)
+    assert missed_runs([], NOW) == []
@@ -0,0 +1,150 @@
+import datetime
+import io
+import json
+
+import pytest
+
+from aws_croniter import cli
+from aws_croniter.aws_croniter import AwsCroniter
+
+UTC = datetime.timezone.utc
+RULES = """# nightly jobs
+0 12 * * ? *
+
+0 18 ? * MON-FRI *
+0 18 ? * MON-FRI
+*/30 9 1 JAN ? 2024
+"""
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / "rules.txt"
+    path.write_text(RULES)
+    return str(path)
+
+
+def _run(argv, capsys):
+    status = cli.main(argv)
+    return status, [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_validate_reports_each_line(rules_file, capsys):
+    status, records = _run(["validate", rules_file], capsys)
+
+    assert status == 1
+    assert [(record["line"], record["valid"]) for record in records] == [(2, True), (4, True), (5, False), (6, True)]
+    assert "6 required" in records[2]["error"]
+
+
+def test_next_reads_stdin(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("0 12 * * ? *\n"))
+    status, records = _run(["next", "--from", "2024-01-01T13:00:00Z", "--count", "2"], capsys)
+
+    assert status == 0
+    assert records == [
+        {
+            "line": 1,
+            "expression": "0 12 * * ? *",
+            "next": ["2024-01-02T12:00:00+00:00", "2024-01-03T12:00:00+00:00"],
+        }
+    ]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_between_and_count_match_enumeration(rules_file, capsys, workers):
+    window = ["--from", "2024-01-01T00:00:00", "--to", "2024-01-07T23:59:00+00:00", "--workers", workers]
+    _, between = _run(["between", rules_file, *window], capsys)
+    _, counts = _run(["count", rules_file, *window], capsys)
+
+    from_date = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+    to_date = datetime.datetime(2024, 1, 7, 23, 59, tzinfo=UTC)
+    for record, count in zip(between, counts):
+        assert count["line"] == record["line"]
+        if "error" in record:
+            assert "error" in count
+            continue
+        expected = AwsCroniter(record["expression"]).get_all_schedule_bw_dates(from_date, to_date)
+        assert record["runs"] == [run_at.isoformat() for run_at in expected]
+        assert count["count"] == len(expected)
+    assert [record["line"] for record in between] == [2, 4, 5, 6]
+
+
+def test_conflicts_reports_runs_by_line(rules_file, capsys):
+    status, records = _run(
+        [
+            "conflicts",
+            rules_file,
+            "--from",
+            "2024-01-01T00:00:00Z",
+            "--to",
+            "2024-01-01T23:59:00Z",
+            "--buffer",
+            "150",
+            "--mode",
+            "all",
+            "--max-conflicts",
+            "10",
+        ],
+        capsys,
+    )
+
+    assert status == 1  # line 5 is invalid
+    assert records[0] == {"line": 5, "expression": "0 18 ? * MON-FRI", "error": records[0]["error"]}
+    conflicts = records[1:]
+    assert [conflict["conflict"] for conflict in conflicts] == list(range(len(conflicts)))
+    assert {run["line"] for conflict in conflicts for run in conflict["runs"]} == {2, 6}
+    assert all(conflict["separation_minutes"] <= 150 for conflict in conflicts)
+
+
+def test_conflicts_needs_two_valid_expressions(tmp_path, capsys):
+    path = tmp_path / "one.txt"
+    path.write_text("0 12 * * ? *\n")
+    status = cli.main(["conflicts", str(path), "--from", "2024-01-01", "--to", "2024-01-02"])
+    assert status == 2
+    assert "at least two" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["count", "--from", "2024-01-02", "--to", "2024-01-01"],
+        ["count", "--from", "yesterday", "--to", "2024-01-01"],
+        ["next", "--count", "0"],
+    ],
+)
+def test_invalid_arguments_exit_with_usage_error(argv):
+    with pytest.raises(SystemExit) as error:
+        cli.main(argv)
+    assert error.value.code == 2
+
+
+@pytest.mark.parametrize("command", ["validate", "conflicts"])
+def test_missing_input_file_exits_with_error(tmp_path, capsys, command):
+    missing = tmp_path / "missing.txt"
+    argv = [command, str(missing)]
+    if command == "conflicts":
+        argv += ["--from", "2024-01-01", "--to", "2024-01-02"]
+    assert cli.main(argv) == 2
+    captured = capsys.readouterr()
+    assert captured.err == f"aws-croniter: {missing}: No such file or directory\n"
+    assert captured.out == ""
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_unreadable_input_file_exits_with_error(rules_file, tmp_path, capsys, workers):
+    assert cli.main(["validate", str(rules_file), str(tmp_path), "--workers", workers]) == 2
+    captured = capsys.readouterr()
+    assert captured.err.startswith(f"aws-croniter: {tmp_path}: ")
+    if workers == "1":
+        # Lines of the earlier file were written before the failing file was opened.
+        assert captured.out
+
+
+def test_compile_cache_parses_each_expression_once():
+    cli._compile.cache_clear()
+    for number in range(3):
+        cli._process_line("validate", None, None, 1, number, "0 12 * * ? *")
+        cli._process_line("validate", None, None, 1, number, "0 12 * *")
+    info = cli._compile.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
@@ -0,0 +1,142 @@
+import datetime
+from array import array
+
+import pytest
+
+from aws_croniter import ConflictIndex
+from aws_croniter import conflict_matrix
+from aws_croniter import find_conflicts
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.conflict_index import _Entry
+from aws_croniter.exceptions import AwsCroniterConflictSearchLimitError
+
+UTC = datetime.timezone.utc
+FROM_DATE = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+TO_DATE = datetime.datetime(2024, 1, 3, tzinfo=UTC)
+BUFFER = datetime.timedelta(minutes=5)
+
+EXPRESSIONS = [
+    "*/20 * * * ? 2024",
+    "5 * * * ? 2024",
+    "0 */6 * * ? 2024",
+    "30 12 * * ? 2024",
+    "0 0 15 * ? 2024",
+    "45 23 ? * MON 2024",
+]
+
+
+def _matrix_by_expression(expressions, buffer):
+    matrix = conflict_matrix(expressions, FROM_DATE, TO_DATE, buffer)
+    return {(expressions[i], expressions[j]): pair for (i, j), pair in matrix.pairs.items()}
+
+
+@pytest.mark.parametrize("buffer", [datetime.timedelta(0), BUFFER, datetime.timedelta(hours=2, seconds=30)])
+def test_index_matches_conflict_matrix(buffer):
+    index = ConflictIndex(FROM_DATE, TO_DATE, buffer, expressions=tuple(EXPRESSIONS))
+    assert index.conflicts() == _matrix_by_expression(EXPRESSIONS, buffer)
+
+
+@pytest.mark.parametrize("cell_width", [1, 6, 7_201])
+def test_entry_cells_are_derived_from_the_sorted_runs(cell_width):
+    runs = array("q", [5, 6, 11, 12, 13, 40, 7_200, 7_201])
+    assert list(_Entry(0, runs).cells(cell_width)) == sorted({run // cell_width for run in runs})
+
+
+def test_entries_store_runs_as_integer_arrays():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, expressions=tuple(EXPRESSIONS))
+    entry = index._entries[EXPRESSIONS[0]]
+    assert entry.runs.typecode == "q"
+    assert len(entry.runs) == 3 * 48 + 1
+    assert "cells" not in vars(entry)
+
+
+def test_add_reports_conflicts_found_by_pairwise_search():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, expressions=tuple(EXPRESSIONS[:-1]))
+    new = "58 11 * * ? 2024"
+    change = index.add(new)
+
+    expected = {}
+    for other in EXPRESSIONS[:-1]:
+        result = find_conflicts([other, new], from_date=FROM_DATE, to_date=TO_DATE, buffer=BUFFER)
+        if result.has_conflict:
+            expected[(other, new)] = result.first_conflict.latest
+    assert {key: pair.first_conflict for key, pair in change.introduced.items()} == expected
+    assert change.resolved == {}
+    assert set(index.conflicts_for(new)) == {other for other, _ in expected}
+
+
+def test_remove_reports_resolved_pairs_and_forgets_expression():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, expressions=tuple(EXPRESSIONS))
+    before = index.conflicts()
+
+    change = index.remove("5 * * * ? 2024")
+
+    assert change.introduced == {}
+    assert change.resolved == {key: pair for key, pair in before.items() if "5 * * * ? 2024" in key}
+    assert "5 * * * ? 2024" not in index
+    assert len(index) == len(EXPRESSIONS) - 1
+    assert index.conflicts() == {key: pair for key, pair in before.items() if "5 * * * ? 2024" not in key}
+
+
+def test_replace_swaps_expression_and_matches_rebuild():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, expressions=tuple(EXPRESSIONS))
+    change = index.replace("5 * * * ? 2024", AwsCroniter("2 * * * ? 2024"))
+
+    assert change.resolved and change.introduced
+    assert all("5 * * * ? 2024" in key for key in change.resolved)
+    assert all("2 * * * ? 2024" in key for key in change.introduced)
+    assert index.expressions[-1] == "2 * * * ? 2024"
+    assert index.conflicts() == _matrix_by_expression(index.expressions, BUFFER)
+
+
+def test_replace_with_invalid_expression_leaves_index_untouched():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, expressions=tuple(EXPRESSIONS))
+    before = index.conflicts()
+    with pytest.raises(ValueError):
+        index.replace("30 12 * * ? 2024", "not a cron")
+    assert index.conflicts() == before
+    assert "30 12 * * ? 2024" in index
+
+
+def test_replace_over_occurrence_limit_keeps_old_expression():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, max_occurrences_per_expression=200)
+    index.add("0 12 * * ? 2024")
+    with pytest.raises(AwsCroniterConflictSearchLimitError):
+        index.replace("0 12 * * ? 2024", "* * * * ? 2024")
+    assert index.expressions == ["0 12 * * ? 2024"]
+
+
+def test_add_and_remove_errors():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, expressions=("0 12 * * ? 2024",))
+    with pytest.raises(ValueError, match="already indexed"):
+        index.add("0 12 * * ? 2024")
+    with pytest.raises(ValueError, match="not indexed"):
+        index.remove("0 13 * * ? 2024")
+    with pytest.raises(ValueError, match="not indexed"):
+        index.conflicts_for("0 13 * * ? 2024")
+
+
+def test_occurrence_limit_is_enforced_per_expression():
+    index = ConflictIndex(FROM_DATE, TO_DATE, BUFFER, max_occurrences_per_expression=10)
+    with pytest.raises(AwsCroniterConflictSearchLimitError):
+        index.add("* * * * ? 2024")
+    assert len(index) == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"buffer": datetime.timedelta(minutes=-1)}, "buffer"),
+        ({"max_occurrences_per_expression": 0}, "max_occurrences_per_expression"),
+    ],
+)
+def test_invalid_configuration(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        ConflictIndex(FROM_DATE, TO_DATE, **kwargs)
+
+
+def test_requires_utc_and_ordered_window():
+    with pytest.raises(ValueError, match="from_date"):
+        ConflictIndex(FROM_DATE.replace(tzinfo=None), TO_DATE)
+    with pytest.raises(ValueError, match="less than or equal"):
+        ConflictIndex(TO_DATE, FROM_DATE)
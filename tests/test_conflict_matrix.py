@@ -0,0 +1,73 @@
+import datetime
+import itertools
+
+import pytest
+
+from aws_croniter import conflict_matrix
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.exceptions import AwsCroniterConflictSearchLimitError
+
+UTC = datetime.timezone.utc
+FROM_DATE = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+TO_DATE = datetime.datetime(2024, 1, 3, tzinfo=UTC)
+
+EXPRESSIONS = [
+    "*/20 * * * ? 2024",
+    "5 * * * ? 2024",
+    "0 */6 * * ? 2024",
+    "30 12 * * ? 2024",
+    "0 0 15 * ? 2024",
+]
+
+
+def _brute_force_pair(first, second, buffer):
+    runs = sorted(
+        [(run, 0) for run in AwsCroniter(first).get_all_schedule_bw_dates(FROM_DATE, TO_DATE)]
+        + [(run, 1) for run in AwsCroniter(second).get_all_schedule_bw_dates(FROM_DATE, TO_DATE)]
+    )
+    latest = {}
+    first_conflict, count, separations = None, 0, []
+    for run_at, side in runs:
+        other_at = latest.get(1 - side)
+        if other_at is not None and run_at - other_at <= buffer:
+            first_conflict = first_conflict or run_at
+            count += 1
+            separations.append(run_at - other_at)
+        latest[side] = run_at
+    if count == 0:
+        return None
+    return first_conflict, count, min(separations)
+
+
+@pytest.mark.parametrize("buffer_minutes", [0, 5, 30])
+def test_matrix_matches_pairwise_brute_force(buffer_minutes):
+    buffer = datetime.timedelta(minutes=buffer_minutes)
+    matrix = conflict_matrix(EXPRESSIONS, FROM_DATE, TO_DATE, buffer)
+
+    assert matrix.expressions == EXPRESSIONS
+    for i, j in itertools.combinations(range(len(EXPRESSIONS)), 2):
+        expected = _brute_force_pair(EXPRESSIONS[i], EXPRESSIONS[j], buffer)
+        pair = matrix.get(j, i)
+        if expected is None:
+            assert pair is None
+        else:
+            assert (pair.first_conflict, pair.count, pair.min_separation) == expected
+
+
+def test_matrix_has_no_expression_cap_and_lists_partners():
+    expressions = [f"{minute} 9 * * ? 2024" for minute in range(0, 60)]
+    matrix = conflict_matrix(expressions, FROM_DATE, TO_DATE, datetime.timedelta(minutes=1))
+
+    assert len(matrix.pairs) == 59
+    assert matrix.conflicting_with(10) == [9, 11]
+    assert matrix.get(0, 1).count == 2
+    assert matrix.occurrences_examined == 60 * 2
+
+
+def test_matrix_limits_and_validation():
+    with pytest.raises(AwsCroniterConflictSearchLimitError, match="max_total_occurrences"):
+        conflict_matrix(EXPRESSIONS, FROM_DATE, TO_DATE, max_total_occurrences=10)
+    with pytest.raises(ValueError, match="buffer"):
+        conflict_matrix(EXPRESSIONS, FROM_DATE, TO_DATE, datetime.timedelta(minutes=-1))
+    with pytest.raises(ValueError, match="only one"):
+        conflict_matrix(EXPRESSIONS[:1], FROM_DATE, TO_DATE)
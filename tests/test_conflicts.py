@@ -1,13 +1,31 @@
+import dataclasses
 import datetime
+import multiprocessing
+import pickle
+import threading
+import time
 
 import pytest
 
+from aws_croniter import CancellationToken
 from aws_croniter import ConflictCollectionMode
+from aws_croniter import ConflictColumns
+from aws_croniter import ConflictIterator
 from aws_croniter import ConflictSearchOptions
+from aws_croniter import PairConflict
 from aws_croniter import find_conflicts
+from aws_croniter import conflicts as conflicts_module
+from aws_croniter import iter_conflicts
 from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter import conflict_parallel
+from aws_croniter.conflict_parallel import _shard_bounds
+from aws_croniter.conflict_prescreen import prune_disjoint_expressions
+from aws_croniter.conflicts import _prepare_expressions
+from aws_croniter.conflicts import _search_conflicts
 from aws_croniter.exceptions import AwsCroniterConflictSearchLimitError
 from aws_croniter.exceptions import AwsCroniterExpressionError
+from aws_croniter.occurrence_stream import OccurrenceCounter
+from aws_croniter.occurrence_stream import OccurrenceStream
 
 UTC = datetime.timezone.utc
 FROM_DATE = datetime.datetime(2024, 1, 1, tzinfo=UTC)
@@ -146,12 +164,13 @@ def test_max_expressions_limit():
 
 
 def test_max_total_occurrences_limit():
+    # A non-zero buffer keeps the search on the enumerating path the limits apply to.
     with pytest.raises(AwsCroniterConflictSearchLimitError, match="max_total_occurrences"):
         find_conflicts(
             ["* * * * ? 2024", "30 * * * ? 2024"],
             from_date=FROM_DATE,
             to_date=datetime.datetime(2024, 1, 1, 6, 0, tzinfo=UTC),
-            buffer=datetime.timedelta(0),
+            buffer=datetime.timedelta(minutes=1),
             max_total_occurrences=5,
         )
 
@@ -173,3 +192,621 @@ def test_conflict_search_options_object():
 def test_from_date_after_to_date_rejected():
     with pytest.raises(ValueError, match="from_date must be"):
         ConflictSearchOptions(from_date=TO_DATE, to_date=FROM_DATE)
+
+
+@pytest.mark.parametrize(
+    "expressions",
+    [
+        ["*/15 * * * ? 2024", "*/10 * * * ? 2024"],
+        ["0 12 ? * MON-FRI 2024", "0 12 15 * ? 2024"],
+        ["30 9 ? * 6L 2024", "30 9 L * ? 2024"],
+        ["0 8 15W * ? 2024", "0 8 ? * 2#3 2024"],
+        ["0 0 1 * ? 2024", "0 1 1 * ? 2024", "0 0 ? * 2 2024"],
+        ["5 4 ? * SUN 2024", "5 4 ? * SAT 2024"],
+    ],
+)
+def test_exact_buffer_zero_path_matches_enumeration(expressions):
+    options = ConflictSearchOptions(
+        from_date=FROM_DATE,
+        to_date=datetime.datetime(2024, 12, 31, 23, 59, tzinfo=UTC),
+        max_occurrences_per_expression=100_000,
+        max_total_occurrences=1_000_000,
+    )
+    enumerated = _search_conflicts(_prepare_expressions(expressions, 50), options)
+    exact = find_conflicts(expressions, options=options)
+
+    assert exact.has_conflict is enumerated.has_conflict
+    assert exact.occurrences_examined == 0
+    if exact.has_conflict:
+        assert exact.first_conflict == enumerated.first_conflict
+
+
+def test_exact_buffer_zero_path_scans_to_2199_without_enumeration():
+    from_date = datetime.datetime(2024, 3, 1, tzinfo=UTC)
+    to_date = datetime.datetime(2199, 12, 31, 23, 59, tzinfo=UTC)
+
+    disjoint = find_conflicts(["0 9 ? * MON *", "0 9 ? * TUE *"], from_date=from_date, to_date=to_date)
+    assert disjoint.has_conflict is False
+
+    leap_monday = find_conflicts(["0 0 29 2 ? *", "0 0 ? * MON *"], from_date=from_date, to_date=to_date)
+    expected_year = next(
+        year
+        for year in range(2025, 2200)
+        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) and datetime.date(year, 2, 29).weekday() == 0
+    )
+    assert leap_monday.first_conflict.earliest == datetime.datetime(expected_year, 2, 29, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    "collection_mode,max_conflicts,buffer",
+    [
+        (ConflictCollectionMode.FIRST, 1, datetime.timedelta(minutes=3)),
+        (ConflictCollectionMode.ALL, 40, datetime.timedelta(minutes=2)),
+        (ConflictCollectionMode.ALL, 1_000, datetime.timedelta(0)),
+    ],
+)
+def test_parallel_shards_match_sequential_search(collection_mode, max_conflicts, buffer):
+    expressions = ["*/7 * * * ? 2024", "*/11 * * * ? 2024", "3 */2 * * ? 2024"]
+    options = ConflictSearchOptions(
+        from_date=datetime.datetime(2024, 1, 1, 5, 17, tzinfo=UTC),
+        to_date=datetime.datetime(2024, 1, 2, 3, 0, tzinfo=UTC),
+        buffer=buffer,
+        collection_mode=collection_mode,
+        max_conflicts=max_conflicts,
+    )
+    sequential = _search_conflicts(_prepare_expressions(expressions, 50), options)
+    parallel = find_conflicts(expressions, options=dataclasses.replace(options, workers=2))
+
+    assert parallel.has_conflict is sequential.has_conflict is True
+    assert parallel.conflicts == sequential.conflicts
+
+
+def test_parallel_shard_bounds_cover_window_without_overlap():
+    bounds = _shard_bounds(FROM_DATE, datetime.datetime(2024, 1, 1, 0, 9, 30, tzinfo=UTC), 4)
+
+    assert bounds[0][0] == FROM_DATE
+    assert bounds[-1][1] == datetime.datetime(2024, 1, 1, 0, 9, tzinfo=UTC)
+    for (_, previous_end), (next_start, _) in zip(bounds, bounds[1:]):
+        assert next_start - previous_end == datetime.timedelta(minutes=1)
+    assert len(_shard_bounds(FROM_DATE, FROM_DATE, 8)) == 1
+
+
+def test_workers_must_be_positive():
+    with pytest.raises(ValueError, match="workers"):
+        ConflictSearchOptions(from_date=FROM_DATE, to_date=TO_DATE, workers=0)
+
+
+def test_prefetch_size_must_be_positive():
+    with pytest.raises(ValueError, match="prefetch_size"):
+        ConflictSearchOptions(from_date=FROM_DATE, to_date=TO_DATE, prefetch_size=0)
+
+
+def test_conflict_keeps_only_latest_run_of_each_expression():
+    result = find_conflicts(
+        ["*/2 * * * ? 2024", "5 * * * ? 2024", "0 * * * ? 2024"],
+        from_date=FROM_DATE,
+        to_date=DENSE_RANGE_END,
+        buffer=datetime.timedelta(minutes=5),
+        collection_mode=ConflictCollectionMode.ALL,
+        max_conflicts=4,
+    )
+
+    conflicts = result.conflicts
+    # 00:00 collides exactly; at 00:05 the every-2-minute rule contributes only its 00:04 run.
+    assert [(run.expression_index, run.run_at.minute) for run in conflicts[0].runs] == [(0, 0), (2, 0)]
+    assert [(run.expression_index, run.run_at.minute) for run in conflicts[-1].runs] == [(2, 0), (0, 4), (1, 5)]
+    assert conflicts[-1].separation == datetime.timedelta(minutes=1)
+
+
+def test_cluster_mode_emits_one_conflict_per_burst():
+    # 39 distinct schedules (they differ in later years) that all fire at 00:00 and 12:00 in January 2024.
+    expressions = [f"0 0,12 * * ? 2024-{year}" for year in range(2025, 2064)] + ["1 0 * * ? 2024"]
+    result = find_conflicts(
+        expressions,
+        from_date=FROM_DATE,
+        to_date=datetime.datetime(2024, 1, 2, 23, 59, tzinfo=UTC),
+        buffer=datetime.timedelta(minutes=1),
+        collection_mode=ConflictCollectionMode.CLUSTER,
+        max_conflicts=100,
+    )
+
+    # Two days of 00:00 (+00:01) and 12:00 bursts: four clusters, not one conflict per arriving run.
+    assert [conflict.earliest.hour for conflict in result.conflicts] == [0, 12, 0, 12]
+    assert [len(conflict.runs) for conflict in result.conflicts] == [40, 39, 40, 39]
+    assert result.conflicts[0].latest == datetime.datetime(2024, 1, 1, 0, 1, tzinfo=UTC)
+    assert all(conflict.separation == datetime.timedelta(0) for conflict in result.conflicts)
+
+
+def test_cluster_mode_reports_maximal_windows_only():
+    # Runs at 00:00 (A), 00:04 (B), 00:08 (C) with buffer 5: {A, B} and {B, C} are the maximal clusters.
+    result = find_conflicts(
+        ["0 0 * * ? 2024", "4 0 * * ? 2024", "8 0 * * ? 2024"],
+        from_date=FROM_DATE,
+        to_date=datetime.datetime(2024, 1, 1, 1, 0, tzinfo=UTC),
+        buffer=datetime.timedelta(minutes=5),
+        collection_mode=ConflictCollectionMode.CLUSTER,
+        max_conflicts=10,
+    )
+
+    assert [[run.expression_index for run in conflict.runs] for conflict in result.conflicts] == [[0, 1], [1, 2]]
+    assert [conflict.separation for conflict in result.conflicts] == [datetime.timedelta(minutes=4)] * 2
+
+
+def test_cluster_mode_parallel_matches_sequential():
+    expressions = ["*/7 * * * ? 2024", "*/11 * * * ? 2024", "3 */2 * * ? 2024"]
+    options = ConflictSearchOptions(
+        from_date=datetime.datetime(2024, 1, 1, 5, 17, tzinfo=UTC),
+        to_date=datetime.datetime(2024, 1, 2, 3, 0, tzinfo=UTC),
+        buffer=datetime.timedelta(minutes=2),
+        collection_mode=ConflictCollectionMode.CLUSTER,
+        max_conflicts=10_000,
+    )
+    sequential = _search_conflicts(_prepare_expressions(expressions, 50), options)
+    parallel = find_conflicts(expressions, options=dataclasses.replace(options, workers=3))
+
+    assert len(sequential.conflicts) > 50
+    assert parallel.conflicts == sequential.conflicts
+
+
+def test_iter_conflicts_yields_lazily_and_matches_find_conflicts():
+    options = ConflictSearchOptions(
+        from_date=FROM_DATE,
+        to_date=TO_DATE,
+        buffer=datetime.timedelta(minutes=1),
+        collection_mode=ConflictCollectionMode.ALL,
+        max_conflicts=500,
+    )
+    expressions = [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10]
+    iterator = iter_conflicts(expressions, options=options)
+    assert iterator.occurrences_examined == 2
+
+    first = next(iterator)
+    examined_after_first = iterator.occurrences_examined
+    assert first.earliest == FROM_DATE
+    assert examined_after_first < 10
+
+    remaining = list(iterator)
+    assert iterator.conflicts_found == 500
+    assert iterator.occurrences_examined > examined_after_first
+    assert [first, *remaining] == find_conflicts(expressions, options=options).conflicts
+    with pytest.raises(TypeError):
+        iter_conflicts(expressions, options)
+
+
+def test_iter_conflicts_can_be_closed_early():
+    iterator = iter_conflicts(
+        [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10],
+        from_date=FROM_DATE,
+        to_date=TO_DATE,
+        collection_mode=ConflictCollectionMode.ALL,
+        max_conflicts=1_000,
+    )
+    pages = [next(iterator) for _ in range(3)]
+    iterator.close()
+
+    assert len(pages) == 3
+    assert list(iterator) == []
+
+
+@pytest.mark.parametrize("mode", [ConflictCollectionMode.ALL, ConflictCollectionMode.CLUSTER])
+def test_equivalent_expressions_are_enumerated_once(monkeypatch, mode):
+    expressions = [
+        "0/20 * * * ? 2024",
+        "5 * * * ? 2024",
+        "0,20,40 * * * ? 2024",
+        "0/20 * ? * * 2024",
+        "5 0-23 * * ? 2024",
+    ]
+    options = ConflictSearchOptions(
+        from_date=FROM_DATE,
+        to_date=FROM_DATE + datetime.timedelta(hours=6),
+        buffer=datetime.timedelta(minutes=5),
+        collection_mode=mode,
+        max_conflicts=1_000,
+    )
+    deduplicated = find_conflicts(expressions, options=options)
+    representatives = find_conflicts(expressions[:2], options=options)
+
+    # One group per expression disables grouping and gives the one-stream-per-expression baseline.
+    monkeypatch.setattr(conflicts_module, "_group_equivalent", lambda cron_pairs: [[i] for i in range(len(cron_pairs))])
+    baseline = find_conflicts(expressions, options=options)
+
+    # Each group is reported once at its first run; every other conflict is between the two distinct schedules.
+    assert [_indexes_and_times(conflict) for conflict in deduplicated.conflicts[:2]] == [
+        ([0, 2, 3], [FROM_DATE] * 3),
+        ([1, 4], [FROM_DATE + datetime.timedelta(minutes=5)] * 2),
+    ]
+    assert deduplicated.conflicts[2:] == representatives.conflicts
+    assert len(baseline.conflicts) > len(deduplicated.conflicts)
+    assert deduplicated.equivalent_expressions == [(0, 2, 3), (1, 4)]
+    assert baseline.equivalent_expressions == []
+    # At most the runs of two distinct schedules (19 and 6) instead of five expressions.
+    assert deduplicated.occurrences_examined <= 19 + 6
+    assert baseline.occurrences_examined == 3 * 19 + 2 * 6
+
+
+def test_equivalent_expressions_are_reported_once_not_per_run():
+    options = _all_mode_options(to_date=FROM_DATE + datetime.timedelta(hours=1), buffer=datetime.timedelta(0))
+    result = find_conflicts(
+        ["*/5 * * * ? 2024", "0/5 * * * ? 2024", "0,5,10,15,20,25,30,35,40,45,50,55 * * * ? 2024"], options=options
+    )
+
+    assert result.equivalent_expressions == [(0, 1, 2)]
+    assert [_indexes_and_times(conflict) for conflict in result.conflicts] == [([0, 1, 2], [FROM_DATE] * 3)]
+    # With no other schedule to collide with, the group skips ahead instead of walking its 13 runs.
+    assert result.occurrences_examined < 13
+
+
+def _indexes_and_times(conflict) -> tuple[list[int], list[datetime.datetime]]:
+    return [run.expression_index for run in conflict.runs], [run.run_at for run in conflict.runs]
+
+
+def test_equivalent_expressions_reported_by_every_search_path():
+    expressions = ["0 12 * * ? 2024", "0 13 * * ? 2024", "0 12 ? * * 2024"]
+    exact = find_conflicts(expressions, from_date=FROM_DATE, to_date=TO_DATE)
+    parallel = find_conflicts(
+        expressions,
+        from_date=FROM_DATE,
+        to_date=TO_DATE,
+        buffer=datetime.timedelta(minutes=1),
+        collection_mode=ConflictCollectionMode.ALL,
+        max_conflicts=10,
+        workers=2,
+    )
+    assert exact.equivalent_expressions == parallel.equivalent_expressions == [(0, 2)]
+    # Every shard sees the group, but only the shard holding its first run reports it.
+    noon = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    assert [_indexes_and_times(conflict) for conflict in parallel.conflicts] == [([0, 2], [noon, noon])]
+    assert [(run.expression_index, run.expression) for run in exact.first_conflict.runs] == [
+        (0, "0 12 * * ? 2024"),
+        (2, "0 12 ? * * 2024"),
+    ]
+
+
+PRESCREEN_EXPRESSIONS = [
+    "0 3 * * ? 2024",
+    "10 3 * * ? 2024",
+    "0 15 * * ? 2024",
+    "0 3 * 6 ? 2024",
+    "55 23 * * ? 2024",
+    "5 0 * * ? 2024",
+    "0 3 1 * ? 2023",
+    "0 9 1 * ? 2024",
+    "0 9 15 * ? 2024",
+]
+
+
+def test_prescreen_prunes_expressions_disjoint_from_all_others():
+    cron_pairs = _prepare_expressions(PRESCREEN_EXPRESSIONS, None)
+    pruned = prune_disjoint_expressions(cron_pairs, FROM_DATE, TO_DATE, datetime.timedelta(minutes=15))
+    # 15:00 is hours from any other run, June and 2023 fall outside the window, and the two 09:00 rules run on
+    # different days; 23:55 and 00:05 meet across midnight.
+    assert pruned == [2, 3, 6, 7, 8]
+
+
+@pytest.mark.parametrize(
+    "to_date, buffer",
+    [
+        (TO_DATE, datetime.timedelta(minutes=15)),
+        (TO_DATE, datetime.timedelta(hours=13)),
+        (datetime.datetime(2026, 12, 31, tzinfo=UTC), datetime.timedelta(days=20)),
+    ],
+    ids=["day-level", "wide-buffer", "month-level"],
+)
+def test_prescreen_never_changes_conflicts(monkeypatch, to_date, buffer):
+    expressions = [
+        expression.replace("2024", "2024-2026").replace("2023", "2023-2025") for expression in PRESCREEN_EXPRESSIONS
+    ]
+    options = ConflictSearchOptions(
+        from_date=FROM_DATE,
+        to_date=to_date,
+        buffer=buffer,
+        collection_mode=ConflictCollectionMode.ALL,
+        max_conflicts=100_000,
+    )
+    screened = find_conflicts(expressions, options=options)
+    monkeypatch.setattr(conflicts_module, "prune_disjoint_expressions", lambda *args: [])
+    baseline = find_conflicts(expressions, options=options)
+
+    assert screened.conflicts == baseline.conflicts
+    assert screened.occurrences_examined <= baseline.occurrences_examined
+    involved = {run.expression_index for conflict in baseline.conflicts for run in conflict.runs}
+    assert involved.isdisjoint(screened.pruned_expressions)
+
+
+def test_pruned_expressions_are_reported_by_parallel_search():
+    kwargs = {
+        "from_date": FROM_DATE,
+        "to_date": TO_DATE,
+        "buffer": datetime.timedelta(minutes=15),
+        "collection_mode": ConflictCollectionMode.ALL,
+        "max_conflicts": 10_000,
+    }
+    sequential = find_conflicts(PRESCREEN_EXPRESSIONS, **kwargs)
+    parallel = find_conflicts(PRESCREEN_EXPRESSIONS, workers=2, **kwargs)
+    assert sequential.pruned_expressions == [2, 3, 6, 7, 8]
+    assert set(sequential.pruned_expressions) <= set(parallel.pruned_expressions)
+    assert parallel.conflicts == sequential.conflicts
+
+
+def test_occurrence_stream_seek_skips_without_counting():
+    counter = OccurrenceCounter(100)
+    stream = OccurrenceStream(AwsCroniter("* * * * ? 2024"), "* * * * ? 2024", 0, FROM_DATE, TO_DATE, 5, counter)
+    assert stream.seek(FROM_DATE + datetime.timedelta(days=3, seconds=30)) == FROM_DATE + datetime.timedelta(
+        days=3, minutes=1
+    )
+    assert stream.seek(FROM_DATE) == FROM_DATE + datetime.timedelta(days=3, minutes=1)
+    assert counter.total == 2
+    assert stream.seek(TO_DATE + datetime.timedelta(minutes=1)) is None
+
+
+@pytest.mark.parametrize("mode", list(ConflictCollectionMode))
+def test_leapfrog_matches_full_merge_and_skips_dense_runs(monkeypatch, mode):
+    expressions = [
+        "* * * * ? 2024",
+        "0 12 1 * ? 2024",
+        "30 6 ? * 2#2 2024",
+        "0 0 L * ? 2024",
+        "15 12 1 * ? 2024",
+    ]
+    options = ConflictSearchOptions(
+        from_date=FROM_DATE,
+        to_date=datetime.datetime(2024, 2, 29, tzinfo=UTC),
+        buffer=datetime.timedelta(minutes=20),
+        collection_mode=mode,
+        max_conflicts=1_000,
+        max_occurrences_per_expression=1_000_000,
+        max_total_occurrences=1_000_000,
+    )
+    skipping = find_conflicts(expressions, options=options)
+    monkeypatch.setattr(ConflictIterator, "_leapfrog", lambda *args: None)
+    baseline = find_conflicts(expressions, options=options)
+
+    assert skipping.conflicts == baseline.conflicts
+    if mode is not ConflictCollectionMode.FIRST:
+        assert skipping.occurrences_examined * 50 < baseline.occurrences_examined
+
+
+@pytest.mark.parametrize("mode", list(ConflictCollectionMode))
+def test_prefetch_size_does_not_change_results(mode):
+    expressions = [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10, "0 12 L * ? 2024"]
+    options = ConflictSearchOptions(
+        from_date=FROM_DATE,
+        to_date=TO_DATE,
+        buffer=datetime.timedelta(minutes=3),
+        collection_mode=mode,
+        max_conflicts=300,
+    )
+    unbuffered = find_conflicts(expressions, options=dataclasses.replace(options, prefetch_size=1))
+    for prefetch_size in (7, 64, 10_000):
+        result = find_conflicts(expressions, options=dataclasses.replace(options, prefetch_size=prefetch_size))
+        assert result.conflicts == unbuffered.conflicts
+        assert result.occurrences_examined == unbuffered.occurrences_examined
+
+
+@pytest.mark.parametrize("prefetch_size", [1, 64])
+def test_prefetch_stops_at_the_same_occurrence_limit(prefetch_size):
+    counter = OccurrenceCounter(1_000)
+    stream = OccurrenceStream(
+        AwsCroniter("* * * * ? 2024"), "* * * * ? 2024", 0, FROM_DATE, TO_DATE, 10, counter, prefetch_size
+    )
+    assert [stream.pop() for _ in range(9)][-1] == FROM_DATE + datetime.timedelta(minutes=8)
+    with pytest.raises(AwsCroniterConflictSearchLimitError, match="max_occurrences_per_expression"):
+        stream.pop()
+    assert counter.total == 10
+
+
+def _all_mode_options(**kwargs):
+    defaults = {
+        "from_date": FROM_DATE,
+        "to_date": TO_DATE,
+        "buffer": datetime.timedelta(minutes=2),
+        "collection_mode": ConflictCollectionMode.ALL,
+        "max_conflicts": 10_000,
+    }
+    return ConflictSearchOptions(**{**defaults, **kwargs})
+
+
+def test_zero_timeout_returns_truncated_empty_result():
+    result = find_conflicts(
+        [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], options=_all_mode_options(timeout=datetime.timedelta(0))
+    )
+    assert result.truncated
+    assert result.conflicts == []
+    assert result.reached is None
+
+
+def test_past_deadline_truncates_and_deadline_must_be_utc():
+    past = datetime.datetime.now(UTC) - datetime.timedelta(seconds=1)
+    result = find_conflicts([EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], options=_all_mode_options(deadline=past))
+    assert result.truncated
+    with pytest.raises(ValueError, match="deadline"):
+        _all_mode_options(deadline=past.replace(tzinfo=None))
+    with pytest.raises(ValueError, match="timeout"):
+        _all_mode_options(timeout=datetime.timedelta(seconds=-1))
+
+
+@pytest.mark.parametrize("mode", [ConflictCollectionMode.ALL, ConflictCollectionMode.CLUSTER])
+def test_cancellation_returns_complete_prefix_up_to_reached(mode):
+    expressions = [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10]
+    options = dataclasses.replace(_all_mode_options(), collection_mode=mode)
+    full = find_conflicts(expressions, options=options)
+
+    token = CancellationToken()
+    iterator = iter_conflicts(expressions, options=dataclasses.replace(options, cancellation=token))
+    yielded = [next(iterator) for _ in range(5)]
+    token.cancel()
+    yielded.extend(iterator)
+
+    assert iterator.truncated
+    assert FROM_DATE < iterator.reached < TO_DATE
+    assert yielded == full.conflicts[: len(yielded)]
+    assert all(conflict.latest <= iterator.reached for conflict in yielded)
+    assert [conflict for conflict in full.conflicts if conflict.latest <= iterator.reached] == yielded
+
+
+def test_completed_search_is_not_truncated():
+    result = find_conflicts(
+        [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], options=_all_mode_options(timeout=datetime.timedelta(minutes=5))
+    )
+    assert not result.truncated
+    assert result.reached is None
+    assert result.conflicts
+
+
+def test_parallel_search_stops_running_shards_before_returning():
+    expressions = ["* * * * ? *", "*/2 * * * ? *"]
+    # Every shard alone would take tens of seconds to merge its million runs.
+    options = _all_mode_options(
+        to_date=datetime.datetime(2025, 12, 31, tzinfo=UTC),
+        buffer=datetime.timedelta(0),
+        max_conflicts=10_000_000,
+        max_occurrences_per_expression=10_000_000,
+        max_total_occurrences=100_000_000,
+        workers=2,
+    )
+    token = CancellationToken()
+    threading.Timer(0.5, token.cancel).start()
+    started = time.monotonic()
+    result = find_conflicts(expressions, options=dataclasses.replace(options, cancellation=token))
+    assert result.truncated
+    assert time.monotonic() - started < 5
+    assert multiprocessing.active_children() == []
+
+
+def test_shard_stops_at_its_next_check_once_the_stop_signal_is_set(monkeypatch):
+    stop = multiprocessing.Event()
+    monkeypatch.setattr(conflict_parallel, "_stop_signal", None)
+    conflict_parallel._install_stop_signal(stop)
+    cron_pairs = _prepare_expressions([EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], 50)
+    options = _all_mode_options()
+    assert not conflict_parallel._search_shard(cron_pairs, options, FROM_DATE, TO_DATE).truncated
+    stop.set()
+    stopped = conflict_parallel._search_shard(cron_pairs, options, FROM_DATE, TO_DATE)
+    assert stopped.truncated
+    assert stopped.conflicts == []
+
+
+# Same time of day, never the same date: the exact search has to scan every month of the window.
+NEVER_SHARING_A_DAY = [f"0 12 ? * {day}#{week} *" for day in range(1, 8) for week in range(1, 6)]
+
+
+class _CancelAfterChecks(CancellationToken):
+    def __init__(self, checks):
+        super().__init__()
+        self.checks = checks
+
+    @property
+    def cancelled(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_exact_first_search_honours_timeout_and_cancellation():
+    window = {
+        "from_date": datetime.datetime(1970, 1, 1, tzinfo=UTC),
+        "to_date": datetime.datetime(2199, 12, 31, tzinfo=UTC),
+        "max_expressions": 50,
+    }
+    expired = find_conflicts(NEVER_SHARING_A_DAY, timeout=datetime.timedelta(0), **window)
+    assert (expired.truncated, expired.reached, expired.has_conflict) == (True, None, False)
+
+    # Checked every INTERRUPT_CHECK_INTERVAL (64) months: the third check stops before month 129.
+    cancelled = find_conflicts(NEVER_SHARING_A_DAY, cancellation=_CancelAfterChecks(2), **window)
+    assert cancelled.truncated and not cancelled.has_conflict
+    assert cancelled.reached == datetime.datetime(1980, 8, 31, 23, 59, tzinfo=UTC)
+
+    unbounded = find_conflicts(NEVER_SHARING_A_DAY[:10], **window)
+    assert (unbounded.truncated, unbounded.has_conflict) == (False, False)
+
+
+def test_parallel_search_honours_cancellation_and_deadline():
+    expressions = [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10]
+    token = CancellationToken()
+    token.cancel()
+    cancelled = find_conflicts(expressions, options=_all_mode_options(workers=2, cancellation=token))
+    assert cancelled.truncated
+    assert cancelled.conflicts == []
+
+    expired = find_conflicts(expressions, options=_all_mode_options(workers=2, timeout=datetime.timedelta(0)))
+    assert expired.truncated
+    assert expired.conflicts == []
+
+
+@pytest.mark.parametrize(
+    "collection_mode, buffer",
+    [
+        (ConflictCollectionMode.FIRST, datetime.timedelta(0)),
+        (ConflictCollectionMode.ALL, datetime.timedelta(minutes=2)),
+        (ConflictCollectionMode.CLUSTER, datetime.timedelta(minutes=4)),
+    ],
+)
+def test_columnar_result_matches_object_result(collection_mode, buffer):
+    expressions = ["*/7 * * * ? 2024", AwsCroniter("*/11 * * * ? 2024"), "3 */2 * * ? 2024"]
+    kwargs = {
+        "from_date": FROM_DATE,
+        "to_date": DENSE_RANGE_END,
+        "buffer": buffer,
+        "collection_mode": collection_mode,
+        "max_conflicts": 500,
+    }
+    objects = find_conflicts(expressions, **kwargs)
+    columnar = find_conflicts(expressions, columnar=True, **kwargs)
+
+    assert columnar.conflicts == []
+    assert columnar.has_conflict is objects.has_conflict is True
+    assert columnar.conflict_count == len(columnar.columns) == len(objects.conflicts)
+    assert list(columnar.columns) == objects.conflicts
+    assert columnar.first_conflict == objects.first_conflict
+    assert columnar.columns.expressions == ["*/7 * * * ? 2024", "*/11 * * * ? 2024", "3 */2 * * ? 2024"]
+    assert len(columnar.columns.offsets) == len(columnar.columns) + 1
+
+
+def test_columnar_search_builds_no_run_or_conflict_objects(monkeypatch):
+    options = _all_mode_options(to_date=DENSE_RANGE_END, max_conflicts=500, columnar=True)
+    expected = list(find_conflicts([EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], options=options).columns)
+
+    def unexpected(*args):
+        raise AssertionError("columnar searches write integer columns directly")
+
+    monkeypatch.setattr(conflicts_module, "ScheduledRun", unexpected)
+    monkeypatch.setattr(conflicts_module, "ScheduleConflict", unexpected)
+    result = find_conflicts([EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], options=options)
+
+    assert len(result.columns) == len(expected) > 0
+    monkeypatch.undo()
+    assert list(result.columns) == expected
+
+
+def test_columnar_parallel_search_concatenates_shards():
+    expressions = ["*/7 * * * ? 2024", "*/11 * * * ? 2024"]
+    options = _all_mode_options(to_date=DENSE_RANGE_END, buffer=datetime.timedelta(minutes=1), max_conflicts=50)
+    sequential = find_conflicts(expressions, options=options)
+    parallel = find_conflicts(expressions, options=dataclasses.replace(options, workers=2, columnar=True))
+
+    assert parallel.columns is not None
+    assert list(parallel.columns) == sequential.conflicts
+
+
+def test_conflict_columns_extend_respects_limit():
+    result = find_conflicts(
+        [EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], options=_all_mode_options(max_conflicts=5, columnar=True)
+    )
+    merged = ConflictColumns(result.columns.expressions)
+    merged.extend(result.columns, limit=3)
+    merged.extend(result.columns)
+
+    assert len(merged) == 8
+    assert list(merged) == list(result.columns)[:3] + list(result.columns)
+    with pytest.raises(IndexError):
+        merged.conflict(8)
+
+
+def test_result_models_are_slotted_and_picklable():
+    conflict = find_conflicts([EXPR_DENSE_EVERY_15, EXPR_DENSE_EVERY_10], from_date=FROM_DATE, to_date=TO_DATE)
+    conflict = conflict.first_conflict
+    pair = PairConflict(FROM_DATE, 3, datetime.timedelta(minutes=1))
+
+    for item in (conflict, conflict.runs[0], pair):
+        assert not hasattr(item, "__dict__")
+        assert pickle.loads(pickle.dumps(item)) == item
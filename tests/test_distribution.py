@@ -0,0 +1,86 @@
+import datetime
+from collections import Counter
+
+import pytest
+
+from aws_croniter.aws_croniter import AwsCroniter
+
+UTC = datetime.timezone.utc
+
+
+def _enumerated(cron, from_date, to_date, by):
+    values = {
+        "minute": lambda run: run.minute,
+        "hour": lambda run: run.hour,
+        "day": lambda run: run.day,
+        "weekday": lambda run: run.isoweekday() % 7 + 1,
+        "month": lambda run: run.month,
+        "year": lambda run: run.year,
+    }
+    runs = cron.get_all_schedule_bw_dates(from_date, to_date)
+    return dict(sorted(Counter(tuple(values[name](run) for name in by) for run in runs).items()))
+
+
+@pytest.mark.parametrize(
+    "cron_str",
+    [
+        "0/30 9-11 ? * MON-FRI *",
+        "30 8,20 L * ? *",
+        "0 12 15W * ? *",
+        "5 10 ? * 6#2 2024-2025",
+        "0/7 23 1,31 JAN,JUL ? *",
+    ],
+)
+@pytest.mark.parametrize("by", [("hour",), ("weekday",), ("month", "hour"), ("minute", "day"), ("year", "weekday")])
+def test_distribution_matches_enumeration(cron_str, by):
+    cron = AwsCroniter(cron_str)
+    from_date = datetime.datetime(2024, 1, 1, 9, 40, tzinfo=UTC)
+    to_date = datetime.datetime(2025, 7, 31, 23, 10, tzinfo=UTC)
+    assert cron.distribution(from_date, to_date, by=by) == _enumerated(cron, from_date, to_date, by)
+
+
+def test_distribution_of_partial_days_matches_enumeration():
+    cron = AwsCroniter("0/10 * * * ? *")
+    from_date = datetime.datetime(2024, 2, 29, 13, 25, tzinfo=UTC)
+    to_date = datetime.datetime(2024, 3, 1, 2, 5, tzinfo=UTC)
+    assert cron.distribution(from_date, to_date, by=("day", "hour")) == _enumerated(
+        cron, from_date, to_date, ("day", "hour")
+    )
+
+
+def test_distribution_keys_follow_the_order_of_by():
+    cron = AwsCroniter("0 9,18 ? * SAT,SUN *")
+    from_date = datetime.datetime(2024, 6, 1, tzinfo=UTC)
+    to_date = datetime.datetime(2024, 6, 30, 23, 59, tzinfo=UTC)
+    assert cron.distribution(from_date, to_date, by=("hour", "weekday")) == {
+        (9, 1): 5,
+        (9, 7): 5,
+        (18, 1): 5,
+        (18, 7): 5,
+    }
+    assert cron.distribution(from_date, to_date, by="weekday") == {(1,): 10, (7,): 10}
+
+
+def test_distribution_counts_long_horizons_without_enumerating():
+    cron = AwsCroniter("* * * * ? *")
+    from_date = datetime.datetime(2000, 1, 1, tzinfo=UTC)
+    to_date = datetime.datetime(2099, 12, 31, 23, 59, tzinfo=UTC)
+    histogram = cron.distribution(from_date, to_date, by=("year",))
+    assert len(histogram) == 100
+    assert histogram[(2024,)] == 366 * 24 * 60
+    assert sum(histogram.values()) == cron.count_between(from_date, to_date)
+
+
+def test_distribution_rejects_invalid_arguments():
+    cron = AwsCroniter("0 * * * ? *")
+    from_date = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+    to_date = datetime.datetime(2024, 1, 2, tzinfo=UTC)
+    with pytest.raises(ValueError, match="at least one"):
+        cron.distribution(from_date, to_date, by=())
+    with pytest.raises(ValueError, match="Unknown distribution dimension"):
+        cron.distribution(from_date, to_date, by=("hour", "second"))
+    with pytest.raises(ValueError, match="repeat"):
+        cron.distribution(from_date, to_date, by=("hour", "hour"))
+    with pytest.raises(ValueError):
+        cron.distribution(from_date.replace(tzinfo=None), to_date)
+    assert cron.distribution(to_date, from_date) == {}
@@ -0,0 +1,78 @@
+import datetime
+from array import array
+
+import pytest
+
+from aws_croniter import EpochUnit
+from aws_croniter.aws_croniter import AwsCroniter
+
+UTC = datetime.timezone.utc
+EXPRESSIONS = [
+    "* * * * ? *",
+    "0/15 9-17 ? * MON-FRI *",
+    "30 8 L * ? *",
+    "0 12 15W * ? *",
+    "0 12 ? * 6#5 2024-2026",
+    "0 0 1 1 ? 2030",
+]
+MOMENTS = [
+    datetime.datetime(2024, 2, 29, 9, 15, tzinfo=UTC),
+    datetime.datetime(2024, 2, 29, 9, 15, 42, tzinfo=UTC),
+    datetime.datetime(2025, 12, 31, 23, 59, tzinfo=UTC),
+]
+
+
+def _seconds(run):
+    return None if run is None else int(run.timestamp())
+
+
+@pytest.mark.parametrize("cron_str", EXPRESSIONS)
+@pytest.mark.parametrize("moment", MOMENTS)
+@pytest.mark.parametrize("inclusive", [False, True])
+def test_next_and_prev_epoch_match_datetime_versions(cron_str, moment, inclusive):
+    cron = AwsCroniter(cron_str)
+    seconds = int(moment.timestamp())
+    assert cron.get_next_epoch(seconds, 3, inclusive) == [_seconds(run) for run in cron.get_next(moment, 3, inclusive)]
+    assert cron.get_prev_epoch(seconds, 3, inclusive) == [_seconds(run) for run in cron.get_prev(moment, 3, inclusive)]
+
+
+@pytest.mark.parametrize("cron_str", EXPRESSIONS[1:])
+@pytest.mark.parametrize("exclude_ends", [False, True])
+def test_schedule_between_epochs_matches_datetime_version(cron_str, exclude_ends):
+    cron = AwsCroniter(cron_str)
+    from_date = datetime.datetime(2024, 2, 1, 9, 0, 30, tzinfo=UTC)
+    to_date = datetime.datetime(2024, 3, 31, 8, 30, tzinfo=UTC)
+    runs = cron.get_all_schedule_bw_epochs(int(from_date.timestamp()), int(to_date.timestamp()), exclude_ends)
+    assert isinstance(runs, array)
+    expected = cron.get_all_schedule_bw_dates(from_date, to_date)
+    if exclude_ends and expected:
+        expected = [run for run in expected if run not in (from_date.replace(second=0), to_date.replace(second=0))]
+    assert list(runs) == [_seconds(run) for run in expected]
+
+
+def test_epoch_minutes_unit_skips_conversion():
+    cron = AwsCroniter("0/15 9-17 ? * MON-FRI *")
+    minute = int(datetime.datetime(2024, 3, 1, 17, 50, tzinfo=UTC).timestamp()) // 60
+    monday = int(datetime.datetime(2024, 3, 4, 9, 0, tzinfo=UTC).timestamp()) // 60
+    assert cron.get_next_epoch(minute, 2, unit=EpochUnit.MINUTES) == [monday, monday + 15]
+    assert cron.get_prev_epoch(minute, unit="minutes") == [minute - 5]
+    runs = cron.get_all_schedule_bw_epochs(minute - 60, minute, unit=EpochUnit.MINUTES)
+    assert list(runs) == [minute - 50, minute - 35, minute - 20, minute - 5]
+
+
+def test_epoch_search_ends_at_the_supported_years():
+    cron = AwsCroniter("0 0 1 1 ? *")
+    assert cron.get_next_epoch(int(datetime.datetime(2199, 6, 1, tzinfo=UTC).timestamp()), 2) == [None, None]
+    assert cron.get_prev_epoch(0, inclusive=True) == [0]
+    assert cron.get_prev_epoch(0) == [None]
+
+
+def test_epoch_methods_reject_non_integers():
+    cron = AwsCroniter("0 * * * ? *")
+    for value in (1.5, "1700000000", True, datetime.datetime(2024, 1, 1, tzinfo=UTC)):
+        with pytest.raises(ValueError, match="from_epoch"):
+            cron.get_next_epoch(value)
+    with pytest.raises(ValueError, match="to_epoch"):
+        cron.get_all_schedule_bw_epochs(0, 60.0)
+    with pytest.raises(ValueError):
+        cron.get_prev_epoch(0, unit="hours")
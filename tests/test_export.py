@@ -0,0 +1,126 @@
+import csv
+import datetime
+import io
+import json
+import sys
+
+import pytest
+
+from aws_croniter import ConflictCollectionMode
+from aws_croniter import ExportFormat
+from aws_croniter import export_conflicts
+from aws_croniter import export_runs
+from aws_croniter import find_conflicts
+from aws_croniter import iter_conflicts
+from aws_croniter.aws_croniter import AwsCroniter
+
+UTC = datetime.timezone.utc
+FROM_DATE = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+TO_DATE = datetime.datetime(2024, 1, 3, tzinfo=UTC)
+
+EXPRESSIONS = ["0 */6 * * ? 2024", AwsCroniter("30 12 * * ? 2024"), "0 0 1 FEB ? 2024"]
+CONFLICT_EXPRESSIONS = ["*/15 * * * ? 2024", "*/10 * * * ? 2024"]
+
+
+def _expected_runs():
+    rows = []
+    for index, expression in enumerate(EXPRESSIONS):
+        cron = expression if isinstance(expression, AwsCroniter) else AwsCroniter(expression)
+        rows.extend((index, cron.cron, run_at) for run_at in cron.get_all_schedule_bw_dates(FROM_DATE, TO_DATE))
+    return rows
+
+
+class _ChunkRecorder(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10_000])
+def test_export_runs_csv_matches_enumeration(chunk_size):
+    sink = io.StringIO()
+    written = export_runs(EXPRESSIONS, FROM_DATE, TO_DATE, sink, chunk_size=chunk_size)
+
+    rows = list(csv.reader(io.StringIO(sink.getvalue())))
+    expected = _expected_runs()
+    assert written == len(expected) == 11
+    assert rows[0] == ["expression_index", "expression", "run_at"]
+    assert rows[1:] == [[str(index), expression, run_at.isoformat()] for index, expression, run_at in expected]
+
+
+def test_export_runs_ndjson_is_written_in_chunks():
+    sink = _ChunkRecorder()
+    written = export_runs(EXPRESSIONS, FROM_DATE, TO_DATE, sink, format=ExportFormat.NDJSON, chunk_size=4)
+
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert written == len(records) == 11
+    assert sink.writes == 3
+    assert records[0] == {
+        "expression_index": 0,
+        "expression": "0 */6 * * ? 2024",
+        "run_at": "2024-01-01T00:00:00+00:00",
+    }
+
+
+@pytest.mark.parametrize("output_format", [ExportFormat.CSV, ExportFormat.NDJSON])
+def test_export_conflicts_streams_from_iter_conflicts(output_format):
+    kwargs = {
+        "from_date": FROM_DATE,
+        "to_date": TO_DATE,
+        "buffer": datetime.timedelta(minutes=2),
+        "collection_mode": ConflictCollectionMode.ALL,
+        "max_conflicts": 1_000,
+    }
+    expected = find_conflicts(CONFLICT_EXPRESSIONS, **kwargs).conflicts
+    sink = io.StringIO()
+    written = export_conflicts(iter_conflicts(CONFLICT_EXPRESSIONS, **kwargs), sink, format=output_format, chunk_size=7)
+
+    if output_format is ExportFormat.CSV:
+        rows = list(csv.DictReader(io.StringIO(sink.getvalue())))
+    else:
+        rows = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert written == len(rows) == sum(len(conflict.runs) for conflict in expected)
+    assert {int(row["conflict"]) for row in rows} == set(range(len(expected)))
+    first_rows = [row for row in rows if int(row["conflict"]) == 0]
+    assert [row["run_at"] for row in first_rows] == [run.run_at.isoformat() for run in expected[0].runs]
+    assert int(first_rows[0]["separation_minutes"]) == expected[0].separation // datetime.timedelta(minutes=1)
+
+
+def test_export_conflicts_accepts_columnar_results():
+    result = find_conflicts(CONFLICT_EXPRESSIONS, from_date=FROM_DATE, to_date=TO_DATE, columnar=True)
+    objects, columns = io.StringIO(), io.StringIO()
+    export_conflicts(find_conflicts(CONFLICT_EXPRESSIONS, from_date=FROM_DATE, to_date=TO_DATE).conflicts, objects)
+    export_conflicts(result.columns, columns)
+    assert columns.getvalue() == objects.getvalue()
+
+
+def test_arrow_export_round_trips():
+    pyarrow = pytest.importorskip("pyarrow")
+    sink = io.BytesIO()
+    written = export_runs(EXPRESSIONS, FROM_DATE, TO_DATE, sink, format=ExportFormat.ARROW, chunk_size=4)
+
+    reader = pyarrow.ipc.open_stream(sink.getvalue())
+    batches = list(reader)
+    assert written == 11
+    assert [batch.num_rows for batch in batches] == [4, 4, 3]
+    table = pyarrow.Table.from_batches(batches)
+    assert table.column("run_at").to_pylist() == [run_at for _, _, run_at in _expected_runs()]
+
+
+def test_arrow_export_requires_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="pyarrow"):
+        export_runs(EXPRESSIONS, FROM_DATE, TO_DATE, io.BytesIO(), format=ExportFormat.ARROW)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="chunk_size"):
+        export_runs(EXPRESSIONS, FROM_DATE, TO_DATE, io.StringIO(), chunk_size=0)
+    with pytest.raises(ValueError, match="less than or equal"):
+        export_runs(EXPRESSIONS, TO_DATE, FROM_DATE, io.StringIO())
+    with pytest.raises(ValueError, match="from_date"):
+        export_runs(EXPRESSIONS, FROM_DATE.replace(tzinfo=None), TO_DATE, io.StringIO())
@@ -0,0 +1,105 @@
+import datetime
+
+import pytest
+
+from aws_croniter import FiringIndex
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.firing_index import _bit_indexes
+
+UTC = datetime.timezone.utc
+EXPRESSIONS = [
+    "*/15 * * * ? *",
+    "0 9 ? * MON-FRI *",
+    "0 9 L * ? *",
+    "0 9 15W * ? *",
+    "0 9 ? * 2#1 *",
+    "0 9 ? * 6L *",
+    "0,30 8-10 1,15 * ? 2024",
+    "0 9 * JAN,MAR ? 2025",
+    "0 9 ? * * *",
+]
+
+
+def _brute_force(expressions, moment):
+    return [
+        index
+        for index, expression in enumerate(expressions)
+        if AwsCroniter(expression).get_next(moment, inclusive=True)[0] == moment
+    ]
+
+
+@pytest.mark.parametrize(
+    "moment",
+    [
+        datetime.datetime(2024, 1, 1, 9, 0, tzinfo=UTC),
+        datetime.datetime(2024, 1, 15, 9, 0, tzinfo=UTC),
+        datetime.datetime(2024, 1, 15, 8, 30, tzinfo=UTC),
+        datetime.datetime(2024, 1, 26, 9, 0, tzinfo=UTC),
+        datetime.datetime(2024, 1, 31, 9, 0, tzinfo=UTC),
+        datetime.datetime(2024, 6, 14, 9, 0, tzinfo=UTC),
+        datetime.datetime(2024, 6, 28, 9, 0, tzinfo=UTC),
+        datetime.datetime(2025, 3, 1, 9, 0, tzinfo=UTC),
+        datetime.datetime(2025, 3, 1, 9, 7, tzinfo=UTC),
+    ],
+)
+def test_due_matches_brute_force(moment):
+    index = FiringIndex(EXPRESSIONS)
+    assert index.due(moment) == _brute_force(EXPRESSIONS, moment)
+    assert index.due_expressions(moment) == [EXPRESSIONS[rule] for rule in _brute_force(EXPRESSIONS, moment)]
+
+
+def test_due_over_a_day_matches_brute_force():
+    index = FiringIndex(EXPRESSIONS)
+    start = datetime.datetime(2024, 2, 29, tzinfo=UTC)
+    for step in range(0, 24 * 60, 7):
+        moment = start + datetime.timedelta(minutes=step)
+        assert index.due(moment) == _brute_force(EXPRESSIONS, moment)
+
+
+def test_remove_keeps_other_indexes_stable():
+    index = FiringIndex()
+    first = index.add("0 9 ? * * *")
+    second = index.add(AwsCroniter("0 9 L * ? *"))
+    third = index.add("0 9 * * ? *")
+    moment = datetime.datetime(2024, 1, 31, 9, 0, tzinfo=UTC)
+    assert index.due(moment) == [first, second, third]
+
+    index.remove(second)
+    assert len(index) == 2
+    assert index.due(moment) == [first, third]
+    assert index.expression(third) == "0 9 * * ? *"
+    with pytest.raises(KeyError):
+        index.remove(second)
+    with pytest.raises(KeyError):
+        index.expression(7)
+
+
+def test_due_ignores_seconds_and_rejects_naive_datetimes():
+    index = FiringIndex(["0 9 ? * * *"])
+    assert index.due(datetime.datetime(2024, 1, 1, 9, 0, 42, tzinfo=UTC)) == [0]
+    with pytest.raises(ValueError, match="moment"):
+        index.due(datetime.datetime(2024, 1, 1, 9, 0))
+
+
+def test_bit_indexes_decodes_sparse_large_bitsets():
+    positions = [0, 3, 511, 512, 4_000, 199_999]
+    assert _bit_indexes(sum(1 << position for position in positions)) == positions
+    assert _bit_indexes(0) == []
+
+
+def test_large_registry_returns_only_due_rules():
+    index = FiringIndex(f"{rule % 60} {rule // 60 % 24} * * ? *" for rule in range(5_000))
+    moment = datetime.datetime(2024, 5, 5, 3, 7, tzinfo=UTC)
+    due = index.due(moment)
+    assert due == [rule for rule in range(5_000) if rule % 60 == 7 and rule // 60 % 24 == 3]
+
+
+def test_rules_added_after_a_lookup_are_indexed():
+    index = FiringIndex(["0 9 ? * * *"])
+    moment = datetime.datetime(2024, 1, 31, 9, 0, tzinfo=UTC)
+    assert index.due(moment) == [0]
+    removed = index.add("0 9 * * ? *")
+    index.remove(removed)
+    added = index.add("0 9 L * ? *")
+    assert index.due(moment) == [0, added]
+    assert len(index) == 2
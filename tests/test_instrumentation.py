@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+
+from aws_croniter import instrumentation
+from aws_croniter import find_conflicts
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.instrumentation import InstrumentationCollector
+
+UTC = datetime.timezone.utc
+
+
+@pytest.fixture(autouse=True)
+def _disable_instrumentation():
+    yield
+    instrumentation.disable()
+
+
+def test_disabled_by_default_and_collects_nothing():
+    assert instrumentation.is_enabled() is False
+    assert instrumentation.active() is None
+    collector = InstrumentationCollector()
+    AwsCroniter("0 12 ? * MON-FRI *").get_next(datetime.datetime(2024, 1, 1, tzinfo=UTC))
+    assert collector.snapshot() == {"counters": {}, "values": {}, "timers": {}}
+
+
+def test_parse_and_occurrence_metrics():
+    with instrumentation.collect() as collector:
+        assert instrumentation.active() is collector
+        cron = AwsCroniter("0 12 ? * MON-FRI *")
+        cron.get_next(datetime.datetime(2024, 1, 1, tzinfo=UTC), n=3)
+    assert instrumentation.is_enabled() is False
+
+    assert collector.timers["parse"].count == 1
+    assert collector.timers["parse.fields"].count == 1
+    assert collector.timers["get_next"].count == 1
+    assert collector.values["occurrence.search_steps"].count == 3
+    assert collector.values["occurrence.search_steps"].minimum >= 1
+    assert collector.counter("dates.day_resolutions") >= 3
+    assert collector.counter("regex.cache_hits") + collector.counter("regex.cache_misses") == 6
+
+
+def test_conflict_search_metrics():
+    collector = instrumentation.enable()
+    result = find_conflicts(
+        ["*/15 * * * ? 2024", "*/10 * * * ? 2024"],
+        from_date=datetime.datetime(2024, 1, 1, tzinfo=UTC),
+        to_date=datetime.datetime(2024, 1, 1, 2, tzinfo=UTC),
+        buffer=datetime.timedelta(minutes=1),
+    )
+    assert instrumentation.disable() is collector
+
+    assert result.has_conflict is True
+    assert collector.timers["find_conflicts"].count == 1
+    assert collector.counter("conflicts.streams_advanced") == result.occurrences_examined
+    assert collector.counter("conflicts.runs_checked") >= 1
+    assert collector.counter("conflicts.found") == 1
+
+
+def test_slow_call_callback_receives_name_and_elapsed():
+    slow_calls = []
+    collector = InstrumentationCollector(slow_call_threshold=0, on_slow_call=lambda *call: slow_calls.append(call))
+    with instrumentation.collect(collector):
+        AwsCroniter("0 12 15 * ? 2024").get_prev(datetime.datetime(2024, 6, 1, tzinfo=UTC))
+
+    names = [name for name, _ in slow_calls]
+    assert names == ["parse", "get_prev"]
+    assert all(elapsed >= 0 for _, elapsed in slow_calls)
+
+
+def test_reset_and_invalid_threshold():
+    collector = InstrumentationCollector()
+    collector.increment("x", 2)
+    collector.observe("y", 4)
+    assert collector.counter("x") == 2
+    assert collector.values["y"].mean == 4
+    collector.reset()
+    assert collector.snapshot()["counters"] == {}
+
+    with pytest.raises(ValueError, match="slow_call_threshold"):
+        InstrumentationCollector(slow_call_threshold=-1)
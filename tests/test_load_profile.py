@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+
+from aws_croniter import LoadRule
+from aws_croniter import load_profile
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.exceptions import AwsCroniterConflictSearchLimitError
+
+UTC = datetime.timezone.utc
+FROM_DATE = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+TO_DATE = datetime.datetime(2024, 1, 2, tzinfo=UTC)
+MINUTE = datetime.timedelta(minutes=1)
+
+RULES = [
+    LoadRule("*/15 * * * ? 2024", datetime.timedelta(minutes=10), 1.0),
+    LoadRule("0 * * * ? 2024", datetime.timedelta(minutes=35), 2.5),
+    LoadRule("50 23 31 12 ? 2023", datetime.timedelta(hours=2), 4.0),
+    LoadRule(AwsCroniter("5 6 * * ? 2024"), datetime.timedelta(minutes=1), 0.5),
+]
+
+
+def _brute_force(rules, from_date, to_date):
+    """Running jobs and load for every minute of the window."""
+    minutes = int((to_date - from_date) / MINUTE)
+    concurrency, load = [0] * minutes, [0.0] * minutes
+    for rule in rules:
+        cron = rule.expression if isinstance(rule.expression, AwsCroniter) else AwsCroniter(rule.expression)
+        runs = cron.get_all_schedule_bw_dates(from_date - rule.duration, to_date - MINUTE)
+        for run_at in runs:
+            for position in range(minutes):
+                moment = from_date + MINUTE * position
+                if run_at <= moment < run_at + rule.duration:
+                    concurrency[position] += 1
+                    load[position] += rule.weight
+    return concurrency, load
+
+
+def test_minute_buckets_match_brute_force():
+    window_end = FROM_DATE + datetime.timedelta(hours=7)
+    profile = load_profile(RULES, FROM_DATE, window_end)
+    concurrency, load = _brute_force(RULES, FROM_DATE, window_end)
+
+    assert [bucket.max_concurrency for bucket in profile.buckets] == concurrency
+    assert [bucket.max_load for bucket in profile.buckets] == pytest.approx(load)
+    assert profile.max_concurrency == max(concurrency)
+    assert profile.max_load == pytest.approx(max(load))
+
+
+def test_wide_buckets_hold_the_peak_of_their_minutes():
+    window_end = FROM_DATE + datetime.timedelta(hours=7)
+    profile = load_profile(RULES, FROM_DATE, window_end, bucket=datetime.timedelta(hours=1))
+    concurrency, load = _brute_force(RULES, FROM_DATE, window_end)
+
+    assert len(profile.buckets) == 7
+    for hour, bucket in enumerate(profile.buckets):
+        assert bucket.start == FROM_DATE + datetime.timedelta(hours=hour)
+        assert bucket.max_concurrency == max(concurrency[hour * 60 : (hour + 1) * 60])
+        assert bucket.max_load == pytest.approx(max(load[hour * 60 : (hour + 1) * 60]))
+
+
+def test_peaks_are_highest_load_intervals():
+    profile = load_profile(RULES, FROM_DATE, TO_DATE, top_n=3)
+
+    assert len(profile.peaks) == 3
+    assert [peak.load for peak in profile.peaks] == sorted((peak.load for peak in profile.peaks), reverse=True)
+    top = profile.peaks[0]
+    # The job carried over from 2023 overlaps the first hourly and quarter-hourly runs.
+    assert top.start == FROM_DATE
+    assert top.end == FROM_DATE + datetime.timedelta(minutes=10)
+    assert top.concurrency == 3
+    assert top.load == pytest.approx(7.5)
+    assert top.rule_indexes == (0, 1, 2)
+
+
+def test_back_to_back_runs_do_not_overlap():
+    rules = [LoadRule("*/10 * * * ? 2024", datetime.timedelta(minutes=10))]
+    profile = load_profile(rules, FROM_DATE, FROM_DATE + datetime.timedelta(hours=1))
+    assert profile.max_concurrency == 1
+    assert profile.peaks[0].end - profile.peaks[0].start == datetime.timedelta(minutes=10)
+
+
+def test_occurrence_limits_are_enforced():
+    rules = [LoadRule("* * * * ? 2024", MINUTE)]
+    with pytest.raises(AwsCroniterConflictSearchLimitError):
+        load_profile(rules, FROM_DATE, TO_DATE, max_occurrences_per_rule=100)
+    with pytest.raises(AwsCroniterConflictSearchLimitError):
+        load_profile(rules * 2, FROM_DATE, TO_DATE, max_total_occurrences=100)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"from_date": TO_DATE, "to_date": FROM_DATE}, "less than to_date"),
+        ({"bucket": datetime.timedelta(0)}, "bucket"),
+        ({"top_n": -1}, "top_n"),
+        ({"rules": []}, "at least one rule"),
+    ],
+)
+def test_invalid_arguments(kwargs, message):
+    arguments = {"rules": RULES, "from_date": FROM_DATE, "to_date": TO_DATE, **kwargs}
+    with pytest.raises(ValueError, match=message):
+        load_profile(**arguments)
+
+
+def test_invalid_rules():
+    with pytest.raises(ValueError, match="duration"):
+        LoadRule("0 12 * * ? *", datetime.timedelta(0))
+    with pytest.raises(ValueError, match="weight"):
+        LoadRule("0 12 * * ? *", MINUTE, -1.0)
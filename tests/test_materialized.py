@@ -0,0 +1,100 @@
+import datetime
+import multiprocessing
+from array import array
+
+import pytest
+
+from aws_croniter import MaterializedSchedule
+from aws_croniter.aws_croniter import AwsCroniter
+
+UTC = datetime.timezone.utc
+FROM_DATE = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+TO_DATE = datetime.datetime(2024, 12, 31, 23, 59, tzinfo=UTC)
+EXPRESSION = "0/20 8-17 ? * MON-FRI *"
+
+
+@pytest.fixture(scope="module")
+def table():
+    return AwsCroniter(EXPRESSION).materialize(FROM_DATE, TO_DATE)
+
+
+@pytest.mark.parametrize(
+    "moment",
+    [
+        datetime.datetime(2024, 1, 1, tzinfo=UTC),
+        datetime.datetime(2024, 3, 8, 17, 40, tzinfo=UTC),
+        datetime.datetime(2024, 3, 8, 17, 40, 30, tzinfo=UTC),
+        datetime.datetime(2024, 6, 15, 12, 0, tzinfo=UTC),
+        datetime.datetime(2024, 12, 31, 17, 40, tzinfo=UTC),
+    ],
+)
+def test_next_and_prev_match_search(table, moment):
+    cron = AwsCroniter(EXPRESSION)
+    for inclusive in (False, True):
+        expected_next = cron.get_next(moment, inclusive=inclusive)[0]
+        assert table.next(moment, inclusive) == (expected_next if expected_next <= TO_DATE else None)
+        expected_prev = cron.get_prev(moment, inclusive=inclusive)[0]
+        assert table.prev(moment, inclusive) == (expected_prev if expected_prev >= FROM_DATE else None)
+
+
+def test_table_holds_every_run_in_the_window(table):
+    expected = AwsCroniter(EXPRESSION).get_all_schedule_bw_dates(FROM_DATE, TO_DATE)
+    assert isinstance(table.minutes, array)
+    assert len(table) == len(expected)
+    assert list(table) == expected
+    window = (datetime.datetime(2024, 5, 1, 9, 10, tzinfo=UTC), datetime.datetime(2024, 5, 3, 8, 20, tzinfo=UTC))
+    assert table.slice(*window) == AwsCroniter(EXPRESSION).get_all_schedule_bw_dates(*window)
+    assert table.slice(window[1], window[0]) == []
+
+
+def test_lookups_outside_the_window_return_none(table):
+    assert table.next(TO_DATE) is None
+    assert table.prev(FROM_DATE) is None
+
+
+def test_save_and_load_memory_maps_the_table(table, tmp_path):
+    path = tmp_path / "table.bin"
+    table.save(path)
+
+    with MaterializedSchedule.load(path) as loaded:
+        assert isinstance(loaded.minutes, memoryview)
+        assert loaded.minutes.readonly
+        assert (loaded.expression, loaded.from_date, loaded.to_date) == (EXPRESSION, FROM_DATE, TO_DATE)
+        assert list(loaded.minutes) == list(table.minutes)
+        moment = datetime.datetime(2024, 7, 4, 12, 5, tzinfo=UTC)
+        assert loaded.next(moment) == table.next(moment)
+        assert loaded.prev(moment) == table.prev(moment)
+    assert loaded._mapping is None
+
+
+def _count_loaded(path):
+    with MaterializedSchedule.load(path) as loaded:
+        return len(loaded)
+
+
+def test_loaded_table_is_shared_with_worker_processes(table, tmp_path):
+    path = tmp_path / "table.bin"
+    table.save(path)
+    with multiprocessing.get_context("spawn").Pool(2) as pool:
+        assert pool.map(_count_loaded, [path, path]) == [len(table), len(table)]
+
+
+def test_empty_table_round_trips(tmp_path):
+    empty = AwsCroniter("0 0 1 1 ? 2023").materialize(FROM_DATE, TO_DATE)
+    path = tmp_path / "empty.bin"
+    empty.save(path)
+    loaded = MaterializedSchedule.load(path)
+    assert len(loaded) == 0
+    assert loaded.next(FROM_DATE) is None
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a table")
+    with pytest.raises(ValueError, match="not a materialized schedule"):
+        MaterializedSchedule.load(path)
+
+
+def test_materialize_requires_utc_datetimes():
+    with pytest.raises(ValueError, match="tzinfo"):
+        AwsCroniter(EXPRESSION).materialize(datetime.datetime(2024, 1, 1), TO_DATE)
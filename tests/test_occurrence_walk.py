@@ -0,0 +1,61 @@
+import datetime
+
+import pytest
+
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.occurrence_walk import count_epoch_minutes
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.utils import TimeUtils
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    "cron_expression",
+    [
+        "*/7 * * * ? *",
+        "0 12 L * ? *",
+        "15 10 L-3 * ? *",
+        "0 9 15W * ? *",
+        "0 9 1W * ? *",
+        "0 9 31W * ? *",
+        "30 6 ? * 2#1 *",
+        "30 6 ? * 6L *",
+        "0 0 ? * MON-FRI *",
+        "5,35 1-3 31 * ? *",
+        "0 12 29 2 ? *",
+        "0 0/6 * JAN,JUL ? 2024-2025",
+        "59 23 L * ? *",
+    ],
+)
+def test_walk_matches_schedule_between_dates(cron_expression):
+    cron = AwsCroniter(cron_expression)
+    from_date = datetime.datetime(2024, 1, 3, 5, 18, tzinfo=UTC)
+    to_date = datetime.datetime(2025, 3, 1, tzinfo=UTC)
+
+    walked = walk_epoch_minutes(
+        cron, TimeUtils.datetime_to_epoch_minute(from_date), TimeUtils.datetime_to_epoch_minute(to_date)
+    )
+
+    assert [TimeUtils.epoch_minute_to_datetime(run) for run in walked] == cron.get_all_schedule_bw_dates(
+        from_date, to_date
+    )
+
+
+def test_walk_bounds_are_inclusive_and_empty_when_reversed():
+    cron = AwsCroniter("0 12 * * ? 2024")
+    noon = TimeUtils.datetime_to_epoch_minute(datetime.datetime(2024, 5, 1, 12, tzinfo=UTC))
+    assert list(walk_epoch_minutes(cron, noon, noon)) == [noon]
+    assert list(walk_epoch_minutes(cron, noon + 1, noon - 1)) == []
+    assert list(walk_epoch_minutes(cron, noon + 1, noon + 24 * 60 - 1)) == []
+
+
+@pytest.mark.parametrize(
+    "cron_expression", ["*/7 * * * ? *", "0 12 L * ? *", "30 6 ? * 6L *", "0 0/6 * JAN,JUL ? 2024"]
+)
+def test_count_matches_walk(cron_expression):
+    cron = AwsCroniter(cron_expression)
+    start = TimeUtils.datetime_to_epoch_minute(datetime.datetime(2024, 1, 3, 5, 18, tzinfo=UTC))
+    stop = TimeUtils.datetime_to_epoch_minute(datetime.datetime(2024, 9, 1, 7, 1, tzinfo=UTC))
+    assert count_epoch_minutes(cron, start, stop) == sum(1 for _ in walk_epoch_minutes(cron, start, stop))
+    assert count_epoch_minutes(cron, stop, start) == 0
@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.occurrence_walk import count_epoch_minutes
+from aws_croniter.occurrence_walk import walk_epoch_minutes
+from aws_croniter.periodicity import CALENDAR_CYCLE_MINUTES
+from aws_croniter.periodicity import LAST_MINUTE
+from aws_croniter.periodicity import count_runs
+from aws_croniter.periodicity import first_run
+from aws_croniter.periodicity import last_run
+from aws_croniter.periodicity import schedule_period
+from aws_croniter.utils import TimeUtils
+
+UTC = datetime.timezone.utc
+EXPRESSIONS = [
+    "*/15 * * * ? *",
+    "7 */5 * * ? *",
+    "0 9 ? * MON-FRI *",
+    "0 12 L * ? *",
+    "0 12 29 FEB ? *",
+    "30 6 ? * 6L *",
+    "0 12 ? FEB 2#5 *",
+    "0 9 15W * ? 2090-2110",
+    "0 0 1 JAN ? 1970,2024,2100-2102",
+]
+
+
+def _minute(*args):
+    return TimeUtils.datetime_to_epoch_minute(datetime.datetime(*args, tzinfo=UTC))
+
+
+@pytest.mark.parametrize(
+    "cron_expression, period",
+    [
+        ("* * * * ? *", 1),
+        ("*/15 * * * ? 2024", 15),
+        ("0,30 * * * ? *", 30),
+        ("7 */5 * * ? *", 24 * 60),
+        ("0 0 ? * * *", 24 * 60),
+        ("0 9 ? * MON-FRI *", 7 * 24 * 60),
+        ("0 9 * JAN ? *", CALENDAR_CYCLE_MINUTES),
+        ("0 12 L * ? *", CALENDAR_CYCLE_MINUTES),
+        ("0 12 ? * 2#1 *", CALENDAR_CYCLE_MINUTES),
+    ],
+)
+def test_schedule_period(cron_expression, period):
+    cron = AwsCroniter(cron_expression)
+    assert schedule_period(cron) == period
+    assert cron.period == datetime.timedelta(minutes=period)
+
+
+@pytest.mark.parametrize("cron_expression", EXPRESSIONS)
+def test_count_runs_matches_day_by_day_count(cron_expression):
+    cron = AwsCroniter(cron_expression)
+    for start, stop in [
+        (_minute(1970, 1, 1), LAST_MINUTE),
+        (_minute(2024, 3, 5, 7, 31), _minute(2151, 2, 28, 23, 59)),
+        (_minute(2099, 6, 1), _minute(2100, 6, 1)),
+    ]:
+        assert count_runs(cron, start, stop) == count_epoch_minutes(cron, start, stop)
+
+
+@pytest.mark.parametrize("cron_expression", EXPRESSIONS)
+def test_first_and_last_run_match_walk(cron_expression):
+    cron = AwsCroniter(cron_expression)
+    for moment in (_minute(1970, 1, 1), _minute(2024, 3, 5, 7, 31), _minute(2100, 2, 28, 12), _minute(2198, 7, 1)):
+        assert first_run(cron, moment) == next(walk_epoch_minutes(cron, moment, LAST_MINUTE), None)
+        runs = list(walk_epoch_minutes(cron, moment - schedule_period(cron) * 2, moment))
+        if runs:
+            assert last_run(cron, moment) == runs[-1]
+
+
+def test_count_between_matches_enumeration():
+    cron = AwsCroniter("*/10 8-17 ? * MON-FRI *")
+    from_date = datetime.datetime(2024, 1, 3, 9, 5, 30, tzinfo=UTC)
+    to_date = datetime.datetime(2024, 2, 1, 12, 0, tzinfo=UTC)
+    assert cron.count_between(from_date, to_date) == len(cron.get_all_schedule_bw_dates(from_date, to_date))
+    assert cron.count_between(to_date, from_date) == 0
+
+
+def test_count_between_far_horizon():
+    cron = AwsCroniter("* * * * ? *")
+    from_date = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+    to_date = datetime.datetime(2199, 12, 31, 23, 59, tzinfo=UTC)
+    assert cron.count_between(from_date, to_date) == 84_006 * 24 * 60
+
+
+def test_count_between_rejects_naive_datetimes():
+    cron = AwsCroniter("0 12 * * ? *")
+    with pytest.raises(ValueError, match="tzinfo"):
+        cron.count_between(datetime.datetime(2024, 1, 1), datetime.datetime(2024, 2, 1, tzinfo=UTC))
+    with pytest.raises(ValueError, match="datetime"):
+        cron.count_between("2024-01-01", datetime.datetime(2024, 2, 1, tzinfo=UTC))
+
+
+def test_sparse_runs_are_found_beyond_the_field_search_limit():
+    # The fifth Monday of February only exists in leap years starting on a Monday: every 28 years,
+    # skipping 2100, which is not a leap year.
+    cron = AwsCroniter("0 12 ? FEB 2#5 *")
+    runs = cron.get_next(datetime.datetime(2024, 1, 1, tzinfo=UTC), 3)
+    assert runs == [
+        datetime.datetime(2044, 2, 29, 12, tzinfo=UTC),
+        datetime.datetime(2072, 2, 29, 12, tzinfo=UTC),
+        datetime.datetime(2112, 2, 29, 12, tzinfo=UTC),
+    ]
+    assert cron.get_prev(datetime.datetime(2112, 2, 29, 12, tzinfo=UTC), 2) == runs[1::-1]
+    assert cron.get_next(datetime.datetime(2044, 2, 29, 12, tzinfo=UTC), 1, inclusive=True) == runs[:1]
+    assert AwsCroniter("0 0 30 FEB ? *").get_next(datetime.datetime(2024, 1, 1, tzinfo=UTC)) == [None]
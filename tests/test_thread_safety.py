@@ -0,0 +1,80 @@
+import datetime
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aws_croniter import FiringIndex
+from aws_croniter import instrumentation
+from aws_croniter.aws_croniter import AwsCroniter
+from aws_croniter.utils import RegexUtils
+
+UTC = datetime.timezone.utc
+THREADS = 8
+START = datetime.datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _frequent_thread_switches():
+    # Switch threads as often as possible so that unsynchronized fills would interleave.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+    instrumentation.disable()
+
+
+def _run_together(task, count=THREADS):
+    barrier = threading.Barrier(count)
+
+    def wrapped(position):
+        barrier.wait()
+        return task(position)
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(wrapped, range(count)))
+
+
+def test_validation_patterns_are_compiled_once_under_concurrent_parsing(monkeypatch):
+    monkeypatch.setattr(RegexUtils, "_compiled_patterns", {})
+    with instrumentation.collect() as collector:
+        crons = _run_together(lambda _: AwsCroniter("0/5 9-17 ? JAN-JUN MON-FRI 2024-2030"))
+    assert collector.counter("regex.cache_misses") == 6
+    assert collector.counter("regex.cache_hits") == 6 * (THREADS - 1)
+    assert len(set(crons)) == 1
+
+
+def test_shared_instance_answers_concurrent_reads_like_serial_calls():
+    expression = "0/15 9-17 L * ? *"
+    moments = [START + datetime.timedelta(days=37 * position, minutes=11 * position) for position in range(THREADS)]
+
+    def read(cron, position):
+        moment = moments[position]
+        return (
+            cron.get_next(moment, 5),
+            cron.get_prev(moment, 5),
+            cron.get_next_epoch(int(moment.timestamp()), 5),
+            cron.count_between(moment, moment + datetime.timedelta(days=400)),
+            cron.canonical,
+            cron.period,
+        )
+
+    serial = AwsCroniter(expression)
+    expected = [read(serial, position) for position in range(THREADS)]
+    for _ in range(5):
+        # A fresh instance per round, so the lazily computed properties are filled concurrently too.
+        shared = AwsCroniter(expression)
+        assert _run_together(lambda position: read(shared, position)) == expected
+
+
+def test_firing_index_answers_concurrent_lookups_like_serial_calls():
+    expressions = ["0 9 L * ? *", "0 9 15W * ? *", "0 9 ? * 6#2 *", "0 9 ? * 2L *", "0 9 ? * MON-FRI *"] * 50
+    moments = [START.replace(month=month, day=day, hour=9) for month in range(1, 13) for day in (1, 8, 12, 15, 28)]
+    serial = FiringIndex(expressions)
+    expected = [serial.due(moment) for moment in moments]
+
+    index = FiringIndex(expressions)
+    results = _run_together(lambda position: [index.due(moment) for moment in moments[position:] + moments[:position]])
+    for position, result in enumerate(results):
+        assert result == expected[position:] + expected[:position]
@@ -335,6 +335,43 @@ class TestDateUtils:
         """Test DateUtils.is_day_in_month with various inputs."""
         assert DateUtils.is_day_in_month(year, month, test_day) == expected
 
+    @pytest.mark.parametrize(
+        "days_of_month, days_of_week",
+        [
+            ([], [2]),
+            ([], [2, 3, 4, 5, 6]),
+            ([], ["L", 6]),
+            ([], ["L", 0]),
+            ([], ["#", 2, 1]),
+            ([], ["#", 6, 5]),
+            (["L", 0], []),
+            (["L", 3], []),
+            (["L", 30], []),
+            (["W", 1], []),
+            (["W", 15], []),
+            (["W", 31], []),
+            ([1, 15, 29, 30, 31], []),
+        ],
+    )
+    def test_resolve_days_of_month_matches_rule_helpers(self, days_of_month, days_of_week):
+        """Test DateUtils.resolve_days_of_month against the per-rule helpers used by Occurrence."""
+        for year in (2023, 2024, 2100):
+            for month in range(1, 13):
+                if not days_of_month:
+                    expected = DateUtils.get_days_of_month_from_days_of_week(year, month, days_of_week)
+                elif days_of_month[0] == "L":
+                    expected = DateUtils.get_days_of_month_for_L(year, month, days_of_month[1])
+                elif days_of_month[0] == "W":
+                    expected = (
+                        DateUtils.get_days_of_month_for_W(year, month, days_of_month[1])
+                        if DateUtils.is_day_in_month(year, month, days_of_month[1])
+                        else []
+                    )
+                else:
+                    expected = days_of_month
+                expected = [day for day in expected if DateUtils.is_day_in_month(year, month, day)]
+                assert DateUtils.resolve_days_of_month(year, month, days_of_month, days_of_week) == expected
+
 
 class TestTimeUtils:
     """Test cases for the TimeUtils class."""
@@ -360,6 +397,20 @@ class TestTimeUtils:
         """Test TimeUtils.datetime_to_millisec with various inputs."""
         assert TimeUtils.datetime_to_millisec(dt_obj) == expected
 
+    @pytest.mark.parametrize(
+        "dt_obj, expected",
+        [
+            (datetime.datetime(1970, 1, 1, 0, 0, 59, tzinfo=datetime.timezone.utc), 0),
+            (datetime.datetime(2024, 2, 29, 12, 30, tzinfo=datetime.timezone.utc), 28486830),
+            (datetime.datetime(1969, 12, 31, 23, 59, 30, tzinfo=datetime.timezone.utc), -1),
+        ],
+        ids=["Epoch_Start", "Leap_Day_2024", "Before_Epoch"],
+    )
+    def test_epoch_minute_round_trip(self, dt_obj, expected):
+        """Test TimeUtils.datetime_to_epoch_minute and epoch_minute_to_datetime."""
+        assert TimeUtils.datetime_to_epoch_minute(dt_obj) == expected
+        assert TimeUtils.epoch_minute_to_datetime(expected) == dt_obj.replace(second=0)
+
 
 class TestSequenceUtils:
     """Test cases for the SequenceUtils class."""